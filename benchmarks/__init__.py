@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""性能基准测试（python -m benchmarks.render_bench ...）"""
@@ -0,0 +1,209 @@
+# benchmarks/render_bench.py
+"""
+无窗口界面渲染基准：
+
+用 SDL dummy 视频驱动驱动 PygameUI，在合成的牌面状态（2/3/4 人、手牌 0~20 张、长日志、悬停提示）
+上反复整屏重绘，统计每个场景的 FPS、帧耗时分位数、分阶段耗时（draw_player_zones / draw_zone /
+draw_log_panel / 提示框等，来自 ui.profiler.FrameProfiler），以及点击 / 悬停检测的单次耗时。
+结果可写成 JSON，并可与之前保存的基准比较，FPS 下降超过容差时以退出码 1 结束（用于发版前检查）。
+
+命令行用法：
+    python -m benchmarks.render_bench
+    python -m benchmarks.render_bench --frames 200 --json results.json
+    python -m benchmarks.render_bench --baseline results.json --tolerance 0.2
+"""
+
+import os
+
+# 必须在导入 pygame 之前设置，保证在没有显示器的 Linux 机器上也能运行
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import pygame
+
+from game.card_factory import create_card_by_number
+from game.game_manager import GameManager
+from game.player import Player
+from ui.PygameUI import PygameUI
+
+DEFAULT_PLAYERS = (2, 3, 4)
+DEFAULT_HAND_SIZES = (0, 5, 10, 20)
+LOG_LINES = 200
+
+
+def build_board(ui, num_players, hand_size, seed=0, tooltip=False):
+    """
+    在 ui 上搭建一个合成的对局画面
+    :param num_players: 玩家人数
+    :param hand_size: 每位玩家的手牌数（战场 / 孤立区张数随之变化）
+    :param tooltip: 是否让鼠标悬停在当前玩家第一张手牌上并显示提示框
+    """
+    rng = random.Random(seed)
+    players = [Player(f"玩家{i + 1}", i) for i in range(num_players)]
+    gm = GameManager(players, verbose=False, seed=seed)
+    gm.setup_board()
+    for p in players:
+        p.hand[:] = [create_card_by_number(rng.randint(1, 19)) for _ in range(hand_size)]
+        p.battlefield_cards[:] = [create_card_by_number(rng.randint(1, 19)) for _ in range(min(hand_size, 6))]
+        p.isolated_cards[:] = [create_card_by_number(rng.randint(1, 19)) for _ in range(min(hand_size, 2))]
+    ui.set_manager(gm)
+    ui.state = "game"
+    ui.fix_card_width_for_round()
+    ui.logs.clear()
+    for i in range(LOG_LINES):
+        ui.add_log(f"[技能] 玩家{i % num_players + 1} 打出 {rng.randint(1, 19)}，点数 {rng.randint(-5, 9)}")
+    ui.message_timer = 0
+    ui.hover_card = None
+    ui.hover_start_ms = 0
+    current = gm.current_player
+    if tooltip and current.hand:
+        rect = ui.get_card_rect_for_card(current.hand[0], current)
+        ui.hover_card = current.hand[0]
+        ui.hover_start_ms = 1  # 早已超过悬停延迟
+        ui.mouse_pos = rect.center
+    return gm
+
+
+def bench_scenario(ui, num_players, hand_size, tooltip, frames, hit_points, seed=0):
+    """运行一个场景，返回结果字典"""
+    build_board(ui, num_players, hand_size, seed=seed, tooltip=tooltip)
+    profiler = ui.profiler
+    # 预热：让卡面 / 文字 / 布局缓存进入稳定状态
+    for _ in range(3):
+        ui.invalidate()
+        ui.draw_game()
+    profiler.reset()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        ui.invalidate()
+        ui.draw_game()
+    elapsed = time.perf_counter() - start
+    summary = profiler.summary()
+
+    # 点击 / 悬停检测：随机屏幕点
+    rng = random.Random(seed)
+    width, height = ui.screen.get_size()
+    points = [(rng.randrange(width), rng.randrange(height)) for _ in range(hit_points)]
+    current = ui.gm.current_player
+    start = time.perf_counter()
+    for x, y in points:
+        ui.check_click_target(current, x, y)
+        ui._get_card_under_mouse(x, y)
+    hit_us = (time.perf_counter() - start) / max(1, hit_points) * 1e6
+    start = time.perf_counter()
+    for pos in points:
+        ui.handle_mouse_motion(pos)
+    motion_us = (time.perf_counter() - start) / max(1, hit_points) * 1e6
+
+    return {
+        "name": f"{num_players}p-hand{hand_size}{'-tooltip' if tooltip else ''}",
+        "players": num_players,
+        "hand_size": hand_size,
+        "tooltip": tooltip,
+        "frames": frames,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "frame_ms": summary["frame_ms"],
+        "phase_ms": summary["phase_ms"],
+        "surfaces_per_frame": summary["surfaces_per_frame"],
+        "hit_test_us": hit_us,
+        "mouse_motion_us": motion_us,
+    }
+
+
+def run(players=DEFAULT_PLAYERS, hand_sizes=DEFAULT_HAND_SIZES, frames=60, hit_points=2000, seed=0):
+    """
+    运行全部场景
+    :return: {"meta": {...}, "scenarios": [...]}
+    """
+    ui = PygameUI()
+    was_enabled = ui.profiler.enabled
+    if not was_enabled:
+        ui.profiler.toggle()
+    scenarios = []
+    for n in players:
+        for hand in hand_sizes:
+            for tooltip in (False, True):
+                scenarios.append(bench_scenario(ui, n, hand, tooltip, frames, hit_points, seed))
+    return {
+        "meta": {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "video_driver": pygame.display.get_driver(),
+            "platform": platform.platform(),
+            "frames": frames,
+            "seed": seed,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    与基准结果比较 FPS
+    :param tolerance: 允许的相对下降比例（0.2 表示 FPS 低于基准 80% 视为退化）
+    :return: 退化场景列表 [(名称, 基准 FPS, 当前 FPS), ...]
+    """
+    base = {s["name"]: s for s in baseline.get("scenarios", [])}
+    regressions = []
+    for s in results["scenarios"]:
+        b = base.get(s["name"])
+        if b and s["fps"] < b["fps"] * (1.0 - tolerance):
+            regressions.append((s["name"], b["fps"], s["fps"]))
+    return regressions
+
+
+def _int_list(text):
+    return tuple(int(v) for v in text.split(",") if v)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="萝卜昆特牌 界面渲染基准（无窗口）")
+    parser.add_argument("--frames", type=int, default=60, help="每个场景整屏重绘的帧数")
+    parser.add_argument("--players", type=_int_list, default=DEFAULT_PLAYERS, help="玩家人数列表，例如 2,3,4")
+    parser.add_argument("--hands", type=_int_list, default=DEFAULT_HAND_SIZES, help="手牌数列表，例如 0,5,10,20")
+    parser.add_argument("--hit-points", type=int, default=2000, help="点击 / 悬停检测的随机点数")
+    parser.add_argument("--seed", type=int, default=0, help="合成牌面的随机种子")
+    parser.add_argument("--json", default=None, help="把结果写成 JSON（- 表示输出到标准输出）")
+    parser.add_argument("--baseline", default=None, help="与之前保存的 JSON 结果比较")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许的 FPS 相对下降比例")
+    args = parser.parse_args(argv)
+
+    results = run(args.players, args.hands, args.frames, args.hit_points, args.seed)
+
+    if args.json == "-":
+        json.dump(results, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"{'场景':<18}{'FPS':>8}{'p95 ms':>9}{'zones ms':>10}{'zone ms':>9}{'log ms':>8}{'hit us':>8}")
+        for s in results["scenarios"]:
+            phases = s["phase_ms"]
+            print(f"{s['name']:<18}{s['fps']:>8.0f}{s['frame_ms']['p95']:>9.2f}"
+                  f"{phases.get('draw_player_zones', 0.0):>10.2f}{phases.get('draw_zone', 0.0):>9.2f}"
+                  f"{phases.get('draw_log_panel', 0.0):>8.2f}{s['hit_test_us']:>8.1f}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print(f"退化: {name} FPS {before:.0f} -> {after:.0f}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,517 @@
+# game/batch.py
+"""
+向量化批量对局引擎（需要 numpy）
+
+把成千上万局相互独立的对局放进定长 NumPy 数组里同时推进：
+  - 每位玩家的手牌 / 战场 / 孤立区是 [局数, 玩家数, 容量] 的牌号数组，战场与孤立区另有同形状的点数数组；
+  - 小局数、当前玩家、先手等局面计数放在一个结构化数组 counters 里；
+  - 每局有自己洗好的有限抽牌堆与弃牌堆（弃牌堆只记各牌号张数），与 Deck 一样抽空后洗回弃牌堆；
+  - step() 让所有未结束的对局各走一步（随机策略），按 card_data_map 中的技能类分组做向量化结算。
+
+与逐局引擎（GameManager）的差异：
+  - “孤立放置”（Skill_35）回到手里的同名牌算作原来那张牌，留在孤立区的一份清场时不进入弃牌堆；
+  - 随机策略在“结束回合 + 每个手牌位置”中等概率选择，抽到无合法目标的牌时视为结束回合；
+  - 牌区超出容量的牌直接进入弃牌堆（容量默认 40，正常对局不会触及）。
+适合做大规模平衡性扫描；需要逐张牌精确规则时请使用 GameManager / simulator。
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy 是可选依赖，只有向量化批量模拟需要
+    np = None
+
+from .card_factory import card_data_map
+from .deck import default_composition
+from .skill import (Skill_1, Skill_2, Skill_3, Skill_4, Skill_5, Skill_6, Skill_7, Skill_8, Skill_9,
+                    Skill_10, Skill_11, Skill_16, Skill_21, Skill_23, Skill_26, Skill_28, Skill_29, Skill_35)
+
+# 向量化实现的技能（其余技能的牌不能进入批量引擎）
+SUPPORTED_SKILLS = (Skill_1, Skill_2, Skill_3, Skill_4, Skill_5, Skill_6, Skill_7, Skill_8, Skill_9,
+                    Skill_10, Skill_11, Skill_16, Skill_21, Skill_23, Skill_26, Skill_28, Skill_29, Skill_35)
+
+# 结构化计数器：每局一条
+COUNTER_DTYPE = [("round", "i2"), ("current", "i1"), ("start", "i1"), ("active", "?"), ("finished", "?")]
+
+
+class BatchGames:
+    def __init__(self, n_games, num_players=2, total_rounds=3, seed=None, composition=None, capacity=40):
+        """
+        :param n_games: 同时进行的对局数
+        :param num_players: 玩家人数（2/3/4）
+        :param total_rounds: 每大局最多小局数
+        :param seed: 随机种子
+        :param composition: 牌堆构成 {牌号: 张数}（每局一副）
+        :param capacity: 每个牌区的容量
+        """
+        if np is None:
+            raise ImportError("向量化批量模拟需要 numpy，请先 pip install numpy")
+        if num_players not in (2, 3, 4):
+            raise ValueError(f"玩家人数必须为 2/3/4，传入 {num_players}")
+        self.n_games = G = n_games
+        self.num_players = P = num_players
+        self.total_rounds = total_rounds
+        self.wins_to_win = 2
+        self.capacity = W = capacity
+        self.rng = np.random.default_rng(seed)
+        self._build_tables(composition)
+
+        # 牌区：牌号（0 表示空位）与点数
+        self.hand_ids = np.zeros((G, P, W), dtype=np.int8)
+        self.hand_n = np.zeros((G, P), dtype=np.int16)
+        self.bf_ids = np.zeros((G, P, W), dtype=np.int8)
+        self.bf_pts = np.zeros((G, P, W), dtype=np.int32)
+        self.bf_n = np.zeros((G, P), dtype=np.int16)
+        self.iso_ids = np.zeros((G, P, W), dtype=np.int8)
+        self.iso_pts = np.zeros((G, P, W), dtype=np.int32)
+        self.iso_n = np.zeros((G, P), dtype=np.int16)
+
+        # 玩家计数
+        self.score = np.zeros((G, P), dtype=np.int32)          # 技能直接加到玩家身上的分数
+        self.wins = np.zeros((G, P), dtype=np.int16)           # 胜小局数（含平局）
+        self.rounds_won = np.zeros((G, P), dtype=np.int16)     # 单独获胜的小局数（决定大局胜负）
+        self.prev_won = np.zeros((G, P), dtype=bool)
+        self.done = np.zeros((G, P), dtype=bool)
+        self.counters = np.zeros(G, dtype=COUNTER_DTYPE)
+
+        # 牌堆：各局洗好的抽牌堆（前 pile_n 张有效，末尾为牌顶）与弃牌堆中各牌号的张数
+        self.deck_size = D = int(self.composition.sum())
+        full = np.repeat(np.arange(self.max_number + 1, dtype=np.int8), self.composition)
+        self.pile = full[np.argsort(self.rng.random((G, D)), axis=1)]
+        self.pile_n = np.full(G, D, dtype=np.int32)
+        self.discard = np.zeros((G, self.max_number + 1), dtype=np.int32)
+
+        # 统计
+        self.card_plays = np.zeros(self.max_number + 1, dtype=np.int64)
+        self.card_points = np.zeros(self.max_number + 1, dtype=np.int64)
+        self.card_scored = np.zeros(self.max_number + 1, dtype=np.int64)
+        self.small_rounds = 0
+        self.turns = 0
+
+        self._start_round(np.arange(G))
+
+    # ------------------ 牌表 ------------------
+    def _build_tables(self, composition):
+        """由 card_data_map 生成按牌号索引的查表数组与技能分组"""
+        composition = default_composition() if composition is None else dict(composition)
+        unsupported = []
+        for number in composition:
+            data = card_data_map.get(number)
+            if not data:
+                raise ValueError(f"牌号 {number} 不存在映射表中！可用范围: {list(card_data_map.keys())}")
+            for skill in data["skills"]:
+                if not isinstance(skill, SUPPORTED_SKILLS):
+                    unsupported.append(number)
+        if unsupported:
+            raise ValueError(f"以下牌号的技能没有向量化实现，不能用于批量引擎: {sorted(set(unsupported))}")
+
+        self.max_number = M = max(card_data_map)
+        self.base_points = np.zeros(M + 1, dtype=np.int32)
+        self.isolated = np.zeros(M + 1, dtype=bool)
+        self.returns_to_hand = np.zeros(M + 1, dtype=bool)
+        self.needs_target = np.zeros(M + 1, dtype=bool)
+        self.target_other = np.zeros(M + 1, dtype=bool)
+        for number, data in card_data_map.items():
+            self.base_points[number] = data["points"]
+            self.isolated[number] = data["is_isolated"]
+            for skill in data["skills"]:
+                if isinstance(skill, Skill_35):
+                    self.returns_to_hand[number] = True
+                if skill.needs_target:
+                    self.needs_target[number] = True
+                    self.target_other[number] = skill.target_side == "other"
+
+        self.composition = np.zeros(M + 1, dtype=np.int32)
+        for number, count in composition.items():
+            self.composition[number] = count
+
+        # 技能分组：[(第几个技能, 技能类, 拥有该技能的牌号数组)]
+        groups = {}
+        for number, data in card_data_map.items():
+            for j, skill in enumerate(data["skills"]):
+                groups.setdefault((j, type(skill)), []).append(number)
+        self.skill_groups = sorted(((j, cls, np.array(nums, dtype=np.int8)) for (j, cls), nums in groups.items()),
+                                   key=lambda item: item[0])
+
+    # ------------------ 牌区操作 ------------------
+    def _append(self, ids, n, g, p, values, pts=None, pts_values=None):
+        """向 (g, p) 牌区末尾追加牌（放不下的进入弃牌堆），返回 (成功的掩码, 放入的位置)"""
+        k = n[g, p].astype(np.intp)
+        ok = k < self.capacity
+        if not ok.all():
+            self._discard(g[~ok], values[~ok])
+            g, p, k, values = g[ok], p[ok], k[ok], values[ok]
+            if pts_values is not None:
+                pts_values = pts_values[ok]
+        ids[g, p, k] = values
+        if pts is not None:
+            pts[g, p, k] = pts_values
+        n[g, p] += 1
+        return ok, k
+
+    def _remove_at(self, ids, n, g, p, k, pts=None):
+        """移除 (g, p) 牌区第 k 张牌，其后的牌左移一位"""
+        if len(g) == 0:
+            return
+        after = np.arange(self.capacity)[None, :] >= k[:, None]
+        rows = ids[g, p]
+        shifted = np.zeros_like(rows)
+        shifted[:, :-1] = rows[:, 1:]
+        ids[g, p] = np.where(after, shifted, rows)
+        if pts is not None:
+            rows = pts[g, p]
+            shifted = np.zeros_like(rows)
+            shifted[:, :-1] = rows[:, 1:]
+            pts[g, p] = np.where(after, shifted, rows)
+        n[g, p] -= 1
+
+    def _random_slot(self, n_rows):
+        """在每行前 n 个位置中随机选一个（n 必须 > 0）"""
+        return (self.rng.random(len(n_rows)) * n_rows).astype(np.intp)
+
+    # ------------------ 牌堆 ------------------
+    def _discard(self, g, values):
+        """把牌号 values 放入各局弃牌堆（0 表示空位，忽略）"""
+        real = values > 0
+        np.add.at(self.discard, (g[real], values[real].astype(np.intp)), 1)
+
+    def _reshuffle(self, g):
+        """把 g 中各局的弃牌堆洗回（已抽空的）抽牌堆"""
+        counts = self.discard[g]
+        n = counts.sum(axis=1)
+        pos = np.arange(self.deck_size)
+        # 第 j 张为满足 cum[k-1] <= j < cum[k] 的牌号 k
+        ids = (counts.cumsum(axis=1)[:, None, :] <= pos[None, :, None]).sum(axis=2)
+        keys = self.rng.random(ids.shape)
+        keys[pos[None, :] >= n[:, None]] = 2.0  # 无效位置排到最后
+        order = np.argsort(keys, axis=1)
+        self.pile[g] = np.take_along_axis(ids, order, axis=1)
+        self.pile_n[g] = n
+        self.discard[g] = 0
+
+    def remaining_counts(self):
+        """[局数, 最大牌号 + 1] 数组：各局抽牌堆中各牌号剩余张数（同 Deck.remaining_counts）"""
+        valid = np.arange(self.deck_size)[None, :] < self.pile_n[:, None]
+        rows = np.broadcast_to(np.arange(self.n_games)[:, None], self.pile.shape)
+        counts = np.zeros_like(self.discard)
+        np.add.at(counts, (rows[valid], self.pile[valid].astype(np.intp)), 1)
+        return counts
+
+    def _draw(self, g, p, count=1):
+        """
+        为 (g, p) 各从本局抽牌堆抽 count 张牌到手牌（抽牌堆空时洗回弃牌堆，两者都空则不抽）
+        g 中的对局不能重复：同一局的多次抽牌必须分批进行
+        """
+        for _ in range(count):
+            empty = self.pile_n[g] == 0
+            if empty.any():
+                self._reshuffle(g[empty])
+            has = self.pile_n[g] > 0
+            g, p = g[has], p[has]
+            if len(g) == 0:
+                return
+            self.pile_n[g] -= 1
+            self._append(self.hand_ids, self.hand_n, g, p, self.pile[g, self.pile_n[g]])
+
+    def _discard_random(self, g, p):
+        """(g, p) 随机弃一张手牌（没有手牌的跳过）"""
+        has = self.hand_n[g, p] > 0
+        g, p = g[has], p[has]
+        k = self._random_slot(self.hand_n[g, p])
+        self._discard(g, self.hand_ids[g, p, k])
+        self._remove_at(self.hand_ids, self.hand_n, g, p, k)
+
+    def _discard_board(self, g):
+        """g 中各局场上的牌进入弃牌堆（回到手里的孤立放置牌除外）"""
+        slots = np.arange(self.capacity)[None, None, :]
+        for ids, n, skip in ((self.bf_ids, self.bf_n, None), (self.iso_ids, self.iso_n, self.returns_to_hand)):
+            rows = ids[g]
+            mask = slots < n[g][:, :, None]
+            if skip is not None:
+                mask &= ~skip[rows]
+            owner = np.broadcast_to(g[:, None, None], rows.shape)
+            self._discard(owner[mask], rows[mask])
+
+    def _random_enemy(self, p):
+        """为每个出牌者随机选一名其他玩家"""
+        return (p + 1 + self.rng.integers(0, self.num_players - 1, size=len(p))) % self.num_players
+
+    def _battlefield_targets(self, g, exclude_p=None, exclude_k=None, other_than=None):
+        """
+        随机选一张战场目标牌
+        :param exclude_p: 每局要排除的牌所在玩家（越界索引表示该局无需排除）
+        :param exclude_k: 每局要排除的牌的位置
+        :param other_than: 只能选择这些玩家以外的战场牌
+        :return: (有目标的掩码, 目标玩家, 目标位置)
+        """
+        occupied = np.arange(self.capacity)[None, None, :] < self.bf_n[g][:, :, None]
+        if other_than is not None:
+            occupied[np.arange(len(g)), other_than] = False
+        if exclude_p is not None:
+            rows = np.flatnonzero(exclude_p < self.num_players)
+            occupied[rows, exclude_p[rows], exclude_k[rows]] = False
+        flat = occupied.reshape(len(g), -1)
+        r = self.rng.random(flat.shape)
+        r[~flat] = -1.0
+        choice = r.argmax(axis=1)
+        has = flat.any(axis=1)
+        return has, choice // self.capacity, choice % self.capacity
+
+    # ------------------ 小局流程 ------------------
+    def _start_round(self, g):
+        """为 g 中的对局开始新的小局：发牌、清场、重置回合状态"""
+        if len(g) == 0:
+            return
+        c = self.counters
+        c["round"][g] += 1
+        # 与 GameManager 相同：先清场进入弃牌堆，再发牌
+        self._discard_board(g)
+        self.bf_ids[g] = 0
+        self.bf_pts[g] = 0
+        self.bf_n[g] = 0
+        self.iso_ids[g] = 0
+        self.iso_pts[g] = 0
+        self.iso_n[g] = 0
+        first = c["round"][g] == 1
+        for q in range(self.num_players):
+            p = np.full(len(g), q, dtype=np.intp)
+            self._draw(g, p, 2)
+            self._draw(g[first], p[first], 4)
+        self.score[g] = 0
+        self.done[g] = False
+        c["current"][g] = c["start"][g]
+        c["active"][g] = True
+
+    def live_scores(self, g=None):
+        """
+        当前分数（与 Player.calculate_score / PygameUI.compute_live_score 相同：战场 + 孤立区点数和 + 技能加分）
+        :param g: 对局索引（默认全部）
+        :return: [len(g), 玩家数] 数组
+        """
+        if g is None:
+            g = np.arange(self.n_games)
+        slots = np.arange(self.capacity)[None, None, :]
+        bf = np.where(slots < self.bf_n[g][:, :, None], self.bf_pts[g], 0).sum(axis=2)
+        iso = np.where(slots < self.iso_n[g][:, :, None], self.iso_pts[g], 0).sum(axis=2)
+        return self.score[g] + bf + iso
+
+    def _end_round(self, g):
+        """结算 g 中已结束的小局，开始下一小局或结束大局"""
+        if len(g) == 0:
+            return
+        scores = self.live_scores(g)
+        winners = scores == scores.max(axis=1, keepdims=True)
+        single = winners.sum(axis=1) == 1
+        self.prev_won[g] = winners
+        self.wins[g] += winners
+        self.rounds_won[g[single]] += winners[single]
+        self.small_rounds += len(g)
+
+        # 统计结算时各牌号的点数贡献
+        slots = np.arange(self.capacity)[None, None, :]
+        for ids, pts, n in ((self.bf_ids, self.bf_pts, self.bf_n), (self.iso_ids, self.iso_pts, self.iso_n)):
+            mask = slots < n[g][:, :, None]
+            self.card_points += np.bincount(ids[g][mask], weights=pts[g][mask],
+                                            minlength=self.max_number + 1).astype(np.int64)
+            self.card_scored += np.bincount(ids[g][mask], minlength=self.max_number + 1)
+
+        c = self.counters
+        c["active"][g] = False
+        c["start"][g] = (c["start"][g] + 1) % self.num_players
+        over = (self.rounds_won[g] >= self.wins_to_win).any(axis=1) | (c["round"][g] >= self.total_rounds)
+        c["finished"][g[over]] = True
+        self._start_round(g[~over])
+
+    # ------------------ 单步推进 ------------------
+    def step(self):
+        """
+        所有未结束的对局各走一步
+        :return: 本步推进的对局数（0 表示全部结束）
+        """
+        c = self.counters
+        g = np.flatnonzero(~c["finished"])
+        if len(g) == 0:
+            return 0
+        p = c["current"][g].astype(np.intp)
+        h = self.hand_n[g, p].astype(np.intp)
+        pick = (self.rng.random(len(g)) * (h + 1)).astype(np.intp)
+        playing = pick < h
+        card = np.zeros(len(g), dtype=np.int8)
+        card[playing] = self.hand_ids[g[playing], p[playing], pick[playing]]
+
+        # 需要目标但没有可选目标的牌视为结束回合
+        targeted = playing & self.needs_target[card]
+        if targeted.any():
+            tg = g[targeted]
+            occupied = self.bf_n[tg] > 0
+            other = self.target_other[card[targeted]]
+            own = occupied[np.arange(len(tg)), p[targeted]]
+            total = occupied.sum(axis=1)
+            has = np.where(other, total - own > 0, total > 0)
+            playing[np.flatnonzero(targeted)[~has]] = False
+
+        ended = ~playing
+        self.done[g[ended], p[ended]] = True
+
+        # 出牌：移出手牌，放入战场或孤立区
+        pg, pp, pk, pc = g[playing], p[playing], pick[playing], card[playing]
+        self._remove_at(self.hand_ids, self.hand_n, pg, pp, pk)
+        self.card_plays += np.bincount(pc.astype(np.intp), minlength=self.max_number + 1)
+        iso = self.isolated[pc]
+        _, iso_k = self._append(self.iso_ids, self.iso_n, pg[iso], pp[iso], pc[iso],
+                                self.iso_pts, self.base_points[pc[iso]])
+        ok, bf_k = self._append(self.bf_ids, self.bf_n, pg[~iso], pp[~iso], pc[~iso],
+                                self.bf_pts, self.base_points[pc[~iso]])
+        # 战场牌的位置（孤立牌为 -1），供修改自身点数的技能使用
+        slot = np.full(len(pg), -1, dtype=np.intp)
+        bf_rows = np.flatnonzero(~iso)[ok]
+        slot[bf_rows] = bf_k
+        self._apply_skills(pg, pp, pc, slot)
+
+        # 切换到下一位尚未结束的玩家
+        P = self.num_players
+        cands = (p[:, None] + np.arange(1, P + 1)[None, :]) % P
+        not_done = ~self.done[g[:, None], cands]
+        nxt = cands[np.arange(len(g)), not_done.argmax(axis=1)]
+        c["current"][g] = nxt
+        self.turns += len(g)
+        self._end_round(g[~not_done.any(axis=1)])
+        return len(g)
+
+    def _apply_skills(self, g, p, card, slot):
+        """按技能类分组，向量化结算本步打出的牌"""
+        for _, cls, numbers in self.skill_groups:
+            sel = np.isin(card, numbers)
+            if not sel.any():
+                continue
+            sg, sp, sk = g[sel], p[sel], slot[sel]
+            on_bf = sk >= 0
+            self._apply_one(cls, sg, sp, sk, on_bf, card[sel])
+
+    def _add_self_points(self, g, p, k, on_bf, delta):
+        """给本张战场牌加点（孤立牌上的点数技能不生效）"""
+        self.bf_pts[g[on_bf], p[on_bf], k[on_bf]] += delta[on_bf]
+
+    def _apply_one(self, cls, g, p, k, on_bf, c):
+        """
+        结算一类技能
+        :param k: 本张牌在战场上的位置（孤立牌为 -1）
+        :param c: 本步打出的牌号
+        """
+        rng = self.rng
+        if cls is Skill_1:
+            self._add_self_points(g, p, k, on_bf, self.bf_n[g, p].astype(np.int32) - 1)
+        elif cls is Skill_2:
+            self._add_self_points(g, p, k, on_bf, np.where(self.bf_n[g, p] == 1, 4, 0))
+        elif cls is Skill_8:
+            count_8 = (self.bf_ids[g, p] == 8).sum(axis=1) - 1
+            self._add_self_points(g, p, k, on_bf, 3 * np.maximum(count_8, 0))
+        elif cls is Skill_10:
+            self._add_self_points(g, p, k, on_bf, rng.integers(1, 7, size=len(g)))
+        elif cls is Skill_23:
+            self._add_self_points(g, p, k, on_bf, np.minimum(self.hand_n[g, p], 5).astype(np.int32))
+        elif cls is Skill_29:
+            q = self._random_enemy(p)
+            diff = self.bf_n[g, q].astype(np.int32) - self.bf_n[g, p]
+            self._add_self_points(g, p, k, on_bf, np.maximum(diff, 0))
+        elif cls is Skill_4:
+            self.score[g, p] += np.where(self.prev_won[g, p], 3, 0)
+        elif cls is Skill_5:
+            self.score[g, p] += np.where(self.prev_won[g, p], 0, 3)
+        elif cls in (Skill_3, Skill_21):
+            # 目标在出牌前选定，不包含刚打出的这张
+            ex_k = np.where(on_bf, k, 0)
+            ex_p = np.where(on_bf, p, self.num_players)  # 越界玩家索引不会命中
+            has, tq, tk = self._battlefield_targets(g, exclude_p=ex_p, exclude_k=ex_k)
+            tg, tq, tk = g[has], tq[has], tk[has]
+            if cls is Skill_3:
+                self.bf_pts[tg, tq, tk] += 2
+            else:
+                self.bf_pts[tg, tq, tk] *= 2
+        elif cls is Skill_7:
+            has, tq, tk = self._battlefield_targets(g, other_than=p)
+            self._discard(g[has], self.bf_ids[g[has], tq[has], tk[has]])
+            self._remove_at(self.bf_ids, self.bf_n, g[has], tq[has], tk[has], self.bf_pts)
+        elif cls is Skill_6:
+            self._draw(g, p, 1)
+        elif cls is Skill_16:
+            self._draw(g, p, 2)
+        elif cls is Skill_9:
+            q = self._random_enemy(p)
+            a = rng.integers(1, 7, size=len(g))
+            b = rng.integers(1, 7, size=len(g))
+            win, lose = a > b, a < b
+            self._draw(g[win], p[win], 1)
+            self._discard_random(g[win], q[win])
+            self._draw(g[lose], q[lose], 1)
+            self._discard_random(g[lose], p[lose])
+        elif cls is Skill_11:
+            count = self.hand_n[g, p].copy()
+            held = np.arange(self.capacity)[None, :] < count[:, None]
+            rows = self.hand_ids[g, p]
+            self._discard(np.broadcast_to(g[:, None], rows.shape)[held], rows[held])
+            self.hand_ids[g, p] = 0
+            self.hand_n[g, p] = 0
+            for i in range(int(count.max()) if len(count) else 0):
+                more = count > i
+                self._draw(g[more], p[more], 1)
+        elif cls is Skill_26:
+            q = self._random_enemy(p)
+            has = self.hand_n[g, q] > 0
+            g, p, q = g[has], p[has], q[has]
+            kk = self._random_slot(self.hand_n[g, q])
+            stolen = self.hand_ids[g, q, kk]
+            self._remove_at(self.hand_ids, self.hand_n, g, q, kk)
+            self._append(self.hand_ids, self.hand_n, g, p, stolen)
+        elif cls is Skill_28:
+            self._draw(g, p, 2)
+            self._discard_random(g, p)
+            self._discard_random(g, p)
+        elif cls is Skill_35:
+            # 孤立区已放入本牌，玩家再获得一张同名牌
+            self._append(self.hand_ids, self.hand_n, g, p, c.astype(self.hand_ids.dtype))
+
+    # ------------------ 运行 ------------------
+    def run(self, max_steps=10000):
+        """推进直到所有对局结束（或达到步数上限）"""
+        for _ in range(max_steps):
+            if self.step() == 0:
+                break
+
+    def winners(self):
+        """[局数, 玩家数] 布尔数组：各局大局胜者（按单独获胜小局数，平手并列）"""
+        return self.rounds_won == self.rounds_won.max(axis=1, keepdims=True)
+
+
+def simulate_batch(n_games, num_players=2, total_rounds=3, seed=None, composition=None, batch_size=20000):
+    """
+    用向量化引擎批量模拟，统计结果与 simulator.simulate 相同格式
+    :return: SimulationResult
+    """
+    from .simulator import SimulationResult
+
+    if np is None:
+        raise ImportError("向量化批量模拟需要 numpy，请先 pip install numpy")
+    result = SimulationResult(num_players)
+    master = np.random.default_rng(seed)
+    remaining = n_games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        games = BatchGames(size, num_players, total_rounds,
+                           seed=int(master.integers(2 ** 63)), composition=composition)
+        games.run()
+        win = games.winners()
+        shares = win / win.sum(axis=1, keepdims=True)
+        part = SimulationResult(num_players)
+        part.games = size
+        part.small_rounds = games.small_rounds
+        part.turns = games.turns
+        part.seat_wins = shares.sum(axis=0).tolist()
+        for number in range(1, games.max_number + 1):
+            if games.card_plays[number]:
+                part.card_plays[number] = int(games.card_plays[number])
+            if games.card_scored[number]:
+                part.card_points[number] = int(games.card_points[number])
+                part.card_scored[number] = int(games.card_scored[number])
+        result.merge(part)
+        remaining -= size
+    return result
@@ -41,9 +41,17 @@ class Board:
         """
         cards = []
         for player in self.players:
-            cards.extend(player.battlefield_cards + player.isolated_cards)
+            cards.extend(player.battlefield_cards)
+            cards.extend(player.isolated_cards)
         return cards
 
+    def board_points(self):
+        """
+        各玩家战场牌 + 孤立牌的当前点数和（读取牌区维护的合计，不遍历卡牌）
+        :return: {玩家名字: 点数和}
+        """
+        return {player.name: player.board_points for player in self.players}
+
     def show_board(self):
         """
         打印所有玩家的手牌、战场牌和孤立牌状态，用于调试
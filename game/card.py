@@ -1,39 +1,130 @@
 # game/card.py
 
-class Card:
-    def __init__(self, name, points, skills=None, is_isolated=False, base_points=None):
+from operator import attrgetter
+
+from .events import CardPlayed
+
+
+class CardPrototype:
+    """
+    卡牌原型（享元）：同一牌号的所有卡牌共享的不可变数据
+    包括名称、基础点数、孤立标记、技能列表，以及由技能推导出的目标要求
+    """
+    __slots__ = ("number", "name", "base_points", "is_isolated", "skills",
+                 "requires_target", "requires_enemy", "target_type", "target_side")
+
+    def __init__(self, name, base_points, skills=None, is_isolated=False, number=None):
         """
-        初始化卡牌
         :param name: 卡牌名称
-        :param points: 卡牌基础点数
+        :param base_points: 基础点数
         :param skills: 技能对象列表（Skill 实例）
         :param is_isolated: 是否为孤立牌
+        :param number: 牌号
         """
-        self.name = name
-        self.points = points
-        # 记录基础点数（初始值），便于 UI 提示与效果对比
-        self.base_points = points if base_points is None else base_points
-        self.skills = skills or []
-        self.is_isolated = is_isolated
-
-        # 计算是否需要目标
-        self.requires_target = False
-        self.requires_enemy = False
-        self.target_type = "none"    # 目标类型：none/hand/battlefield/isolated
-        self.target_side = "self"    # 目标方：self/other/any
-        
-        # 从技能中获取目标要求
+        init = object.__setattr__
+        init(self, "number", number)
+        init(self, "name", name)
+        init(self, "base_points", base_points)
+        init(self, "is_isolated", is_isolated)
+        init(self, "skills", tuple(skills or ()))
+
+        # 从技能中获取目标要求（只在构建原型时计算一次）
+        requires_target = False
+        requires_enemy = False
+        target_type = "none"    # 目标类型：none/hand/battlefield/isolated
+        target_side = "self"    # 目标方：self/other/any
         for skill in self.skills:
             if skill.needs_target:
-                self.requires_target = True
-                self.target_type = skill.target_type
-                self.target_side = skill.target_side
+                requires_target = True
+                target_type = skill.target_type
+                target_side = skill.target_side
             if skill.needs_enemy:
-                self.requires_enemy = True
+                requires_enemy = True
+        init(self, "requires_target", requires_target)
+        init(self, "requires_enemy", requires_enemy)
+        init(self, "target_type", target_type)
+        init(self, "target_side", target_side)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"CardPrototype 不可修改（{key}）")
 
+    def __reduce__(self):
+        return (CardPrototype, (self.name, self.base_points, self.skills, self.is_isolated, self.number))
+
+    def __repr__(self):
+        return f"CardPrototype({self.name}, base_points={self.base_points}, isolated={self.is_isolated})"
+
+
+class Card:
+    """
+    卡牌实例：只保存每张牌自己的可变状态（当前点数、UI 高亮、所在牌区），其余数据来自共享的 CardPrototype
+    """
+    __slots__ = ("proto", "_points", "highlight", "zones")
+
+    def __init__(self, name, points, skills=None, is_isolated=False, base_points=None, number=None):
+        """
+        初始化卡牌（会单独构建一个原型；批量创建请用 card_factory.create_card_by_number）
+        :param name: 卡牌名称
+        :param points: 卡牌基础点数
+        :param skills: 技能对象列表（Skill 实例）
+        :param is_isolated: 是否为孤立牌
+        :param base_points: 基础点数（默认与 points 相同），便于 UI 提示与效果对比
+        :param number: 牌号（由工厂创建时给出，弃牌回牌堆时使用）
+        """
+        self.proto = CardPrototype(name, points if base_points is None else base_points,
+                                   skills, is_isolated, number)
+        self._points = points  # 当前点数：读写 points（赋值经 set_points 同步牌区的点数合计）
+        self.zones = None  # 所在的牌区（Zone，同时在多个牌区时为列表），点数变化时同步各牌区的点数合计
         # UI相关属性
         self.highlight = False  # 用于UI高亮显示
 
+    @classmethod
+    def from_prototype(cls, proto):
+        """由共享原型快速创建卡牌，点数初始化为基础点数"""
+        card = cls.__new__(cls)
+        card.proto = proto
+        card._points = proto.base_points
+        card.zones = None
+        card.highlight = False
+        return card
+
+    def add_points(self, delta):
+        """点数增加 delta（可为负），并通知所在牌区（更新点数合计与版本号）"""
+        self._points += delta
+        zones = self.zones
+        if zones is not None and delta:
+            if type(zones) is list:
+                for zone in zones:
+                    zone._points_changed(self, delta)
+            else:
+                zones._points_changed(self, delta)
+
+    def set_points(self, value):
+        """把点数设为 value（同 add_points）"""
+        self.add_points(value - self._points)
+
+    # 读取为 C 实现的 attrgetter；直接赋值（card.points = x / card.points += n）也经 set_points 同步牌区
+    points = property(attrgetter("_points"), set_points)
+
+    def __getstate__(self):
+        # 所在牌区不随卡牌序列化，由牌区重建时重新登记
+        return self.proto, self._points, self.highlight
+
+    def __setstate__(self, state):
+        self.proto, self._points, self.highlight = state
+        self.zones = None
+
+    # ------- 原型数据（只读，attrgetter 为 C 实现，比普通 property 函数更快） -------
+    number = property(attrgetter("proto.number"))
+    name = property(attrgetter("proto.name"))
+    base_points = property(attrgetter("proto.base_points"))
+    skills = property(attrgetter("proto.skills"))
+    is_isolated = property(attrgetter("proto.is_isolated"))
+    requires_target = property(attrgetter("proto.requires_target"))
+    requires_enemy = property(attrgetter("proto.requires_enemy"))
+    target_type = property(attrgetter("proto.target_type"))
+    target_side = property(attrgetter("proto.target_side"))
+
     def play(self, action):
         """
         出牌：
@@ -46,18 +137,10 @@ class Card:
         # 放入牌区
         if self.is_isolated:
             owner.isolated_cards.append(self)
-            msg = f"{owner.name} 将 {self.name} 放入孤立区"
-            if getattr(action, 'ui', None):
-                action.ui.add_log(msg)
-            else:
-                print(msg)
+            action.events.emit(CardPlayed, owner, self, "isolated")
         else:
             owner.battlefield_cards.append(self)
-            msg = f"{owner.name} 将 {self.name} 放入战场"
-            if getattr(action, 'ui', None):
-                action.ui.add_log(msg)
-            else:
-                print(msg)
+            action.events.emit(CardPlayed, owner, self, "battlefield")
 
         # 触发技能
         for skill in self.skills:
@@ -68,7 +151,7 @@ class Card:
         return {
             "name": self.name,
             "points": self.points,
-            "base_points": getattr(self, "base_points", self.points),
+            "base_points": self.base_points,
             "skills": [str(skill) for skill in self.skills],
             "is_isolated": self.is_isolated
         }
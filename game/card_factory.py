@@ -1,6 +1,6 @@
 # game/card_factory.py
 
-from .card import Card
+from .card import Card, CardPrototype
 from .skill import *
 
 # ------------------ 牌号映射表 ------------------
@@ -31,22 +31,46 @@ card_data_map = {
 }
 
 # ------------------ 工厂函数 ------------------
+# 牌号 -> CardPrototype 缓存；修改 card_data_map 后需调用 clear_card_prototypes()
+_prototypes = {}
+
+
+def get_card_prototype(number: int) -> CardPrototype:
+    """
+    获取牌号对应的共享原型（首次访问时构建并缓存）
+    :param number: 牌号 (1~19)
+    """
+    proto = _prototypes.get(number)
+    if proto is None:
+        data = card_data_map.get(number)
+        if not data:
+            raise ValueError(f"牌号 {number} 不存在映射表中！可用范围: {list(card_data_map.keys())}")
+        proto = CardPrototype(
+            name=str(number),
+            base_points=data["points"],
+            skills=data["skills"],
+            is_isolated=data["is_isolated"],
+            number=number,
+        )
+        _prototypes[number] = proto
+    return proto
+
+
+def clear_card_prototypes():
+    """清空原型缓存（平衡性调整修改 card_data_map 之后调用）"""
+    _prototypes.clear()
+
+
 def create_card_by_number(number: int) -> Card:
     """
-    根据牌号生成 Card 实例
-    :param number: 牌号 (1~20)
+    根据牌号生成 Card 实例（共享原型，只分配每张牌的可变状态）
+    :param number: 牌号 (1~19)
     :return: Card 对象
     """
-    data = card_data_map.get(number)
-    if not data:
-        raise ValueError(f"牌号 {number} 不存在映射表中！可用范围: {list(card_data_map.keys())}")
-    return Card(
-        name=str(number),
-        points=data["points"],
-        is_isolated=data["is_isolated"],
-        skills=data["skills"],
-        base_points=data["points"],
-    )
+    proto = _prototypes.get(number)
+    if proto is None:
+        proto = get_card_prototype(number)
+    return Card.from_prototype(proto)
 
 # ------------------ 测试 ------------------
 if __name__ == "__main__":
@@ -0,0 +1,102 @@
+# game/controller.py
+"""
+回合控制器（Controller）接口：
+
+GameManager 在每个玩家回合向控制器索取一次行动，控制器返回与 UI 相同格式的结果字典：
+  - {"type": END_TURN}
+  - {"type": PLAY_CARD, "card": Card, "targets": [Card, ...], "enemies": [Player, ...]}
+
+这样同一套规则代码既能由 PygameUI 驱动，也能在无界面（headless）模式下由 AI / 脚本驱动。
+"""
+
+from abc import ABC, abstractmethod
+
+# 游戏事件类型（ui.constants 从这里重新导出，保证 UI 与引擎使用同一组常量）
+END_TURN = "END_TURN"
+PLAY_CARD = "PLAY_CARD"
+SELECT_TARGET = "SELECT_TARGET"
+
+
+def target_candidates(board, player, card):
+    """
+    列出某张牌可选的目标牌（按 target_side / target_type 过滤）
+    :return: 卡牌列表；不需要目标时返回空列表
+    """
+    if not card.requires_target:
+        return []
+    candidates = []
+    for p in board.players:
+        if card.target_side == "self" and p is not player:
+            continue
+        if card.target_side == "other" and p is player:
+            continue
+        candidates.extend(board.get_player_zone(p, card.target_type))
+    return candidates
+
+
+def enemy_candidates(board, player, card):
+    """列出某张牌可选的敌方玩家；不需要敌人时返回空列表"""
+    if not card.requires_enemy:
+        return []
+    return [p for p in board.players if p is not player]
+
+
+def legal_plays(board, player):
+    """
+    枚举玩家当前所有合法出牌
+    :return: [(card, targets, enemies), ...]，需要目标但无可选目标的牌不会出现
+    """
+    plays = []
+    for card in player.hand:
+        targets = target_candidates(board, player, card) if card.requires_target else [None]
+        enemies = enemy_candidates(board, player, card) if card.requires_enemy else [None]
+        for t in targets:
+            for e in enemies:
+                plays.append((card, [] if t is None else [t], [] if e is None else [e]))
+    return plays
+
+
+class Controller(ABC):
+    """回合控制器基类：为某个座位的玩家做出决策"""
+
+    @abstractmethod
+    def choose_action(self, manager, player):
+        """
+        返回本回合行动
+        :param manager: GameManager
+        :param player: 当前行动的玩家
+        :return: {"type": END_TURN} 或 {"type": PLAY_CARD, "card": ..., "targets": [...], "enemies": [...]}
+        """
+        pass
+
+    def choose_discards(self, manager, player, count):
+        """
+        技能要求弃牌时（例如“先抽再弃”）选择要弃掉的手牌，默认用对局的决策随机数随机选择
+        :return: 卡牌列表（不超过 count 张）
+        """
+        take_n = min(count, len(player.hand))
+        return manager.policy_rng.sample(player.hand, take_n) if take_n > 0 else []
+
+
+class RandomController(Controller):
+    """随机策略：在“结束回合”与所有合法出牌中等概率选择一项，用于批量模拟"""
+
+    def __init__(self, rng=None):
+        """
+        :param rng: random.Random 实例；不传则使用对局自身的 manager.policy_rng（整局可由种子复现）
+        """
+        self.rng = rng
+
+    def choose_action(self, manager, player):
+        rng = self.rng or manager.policy_rng
+        plays = legal_plays(manager.board, player)
+        pick = rng.randrange(len(plays) + 1)
+        if pick == len(plays):
+            return {"type": END_TURN}
+        card, targets, enemies = plays[pick]
+        return {"type": PLAY_CARD, "card": card, "targets": targets, "enemies": enemies}
+
+    def choose_discards(self, manager, player, count):
+        rng = self.rng or manager.policy_rng
+        take_n = min(count, len(player.hand))
+        return rng.sample(player.hand, take_n) if take_n > 0 else []
@@ -0,0 +1,148 @@
+# game/deck.py
+"""
+牌堆：有限张数的抽牌堆 + 弃牌堆
+
+抽牌堆用数组保存牌号，开局前洗好，末尾即牌顶，抽牌是 O(1) 的 pop；
+抽牌堆耗尽时把弃牌堆洗回抽牌堆继续抽。同时维护每个牌号的剩余张数，
+便于模拟 / AI 直接查询剩余牌的概率分布。
+"""
+
+import random
+
+from .card_factory import card_data_map
+
+# 默认每种牌的张数
+DEFAULT_COPIES = 4
+
+
+def default_composition(copies=DEFAULT_COPIES):
+    """按 card_data_map 生成默认牌堆构成：每个牌号 copies 张"""
+    return {number: copies for number in card_data_map}
+
+
+class Deck:
+    def __init__(self, composition=None, rng=None):
+        """
+        :param composition: {牌号: 张数}，默认 card_data_map 中每种牌 DEFAULT_COPIES 张
+        :param rng: random.Random 实例（通常是 GameManager.rng），不传则使用全局 random
+        """
+        composition = default_composition() if composition is None else dict(composition)
+        for number, count in composition.items():
+            if number not in card_data_map:
+                raise ValueError(f"牌号 {number} 不存在映射表中！可用范围: {list(card_data_map.keys())}")
+            if count < 0:
+                raise ValueError(f"牌号 {number} 的张数不能为负数: {count}")
+        self.composition = composition
+        self.rng = rng if rng is not None else random
+        self.draw_pile = []        # 抽牌堆（末尾为牌顶）
+        self.discard_pile = []     # 弃牌堆
+        self.counts = {}           # 抽牌堆中各牌号剩余张数
+        self.reset()
+
+    # ------------------ 构建与洗牌 ------------------
+    def reset(self):
+        """按构成重建完整牌堆并洗牌，清空弃牌堆"""
+        self.draw_pile = [n for n, count in self.composition.items() for _ in range(count)]
+        self.discard_pile = []
+        self.counts = dict(self.composition)
+        self.rng.shuffle(self.draw_pile)
+
+    def reshuffle(self):
+        """把弃牌堆洗回抽牌堆"""
+        if not self.discard_pile:
+            return
+        for n in self.discard_pile:
+            self.counts[n] = self.counts.get(n, 0) + 1
+        self.draw_pile.extend(self.discard_pile)
+        self.discard_pile = []
+        self.rng.shuffle(self.draw_pile)
+
+    # ------------------ 抽牌 / 弃牌 ------------------
+    def draw(self):
+        """
+        抽一张牌
+        :return: 牌号；抽牌堆与弃牌堆都为空时返回 None
+        """
+        if not self.draw_pile:
+            self.reshuffle()
+            if not self.draw_pile:
+                return None
+        n = self.draw_pile.pop()
+        self.counts[n] -= 1
+        return n
+
+    def draw_n(self, count):
+        """
+        连续抽 count 张牌（顺序与逐张 draw 相同）
+        :return: 牌号列表，牌不够时返回能抽到的全部
+        """
+        if count <= 0:
+            return []
+        pile = self.draw_pile
+        if len(pile) >= count:
+            drawn = pile[-count:]
+            del pile[-count:]
+            drawn.reverse()
+            counts = self.counts
+            for n in drawn:
+                counts[n] -= 1
+            return drawn
+        drawn = []
+        for _ in range(count):
+            n = self.draw()
+            if n is None:
+                break
+            drawn.append(n)
+        return drawn
+
+    def discard(self, number):
+        """把一张牌（牌号）放入弃牌堆"""
+        self.discard_pile.append(number)
+
+    def set_hidden(self, pile):
+        """
+        用给定的牌号序列替换抽牌堆（末尾为牌顶，弃牌堆不变），并按其重算剩余张数
+        用于 AI 确定化：把未公开的牌重新洗好后放回牌堆
+        """
+        self.draw_pile = list(pile)
+        counts = dict.fromkeys(self.composition, 0)
+        for n in self.draw_pile:
+            counts[n] = counts.get(n, 0) + 1
+        self.counts = counts
+
+    def shuffle(self, rng=None):
+        """把抽牌堆重新洗乱（剩余张数不变）"""
+        (rng or self.rng).shuffle(self.draw_pile)
+
+    # ------------------ 快照 ------------------
+    def get_state(self):
+        """返回可用于 set_state 恢复的牌堆状态（不含随机数状态）"""
+        return (tuple(self.draw_pile), tuple(self.discard_pile), dict(self.counts))
+
+    def set_state(self, state):
+        """恢复 get_state 保存的牌堆状态"""
+        draw_pile, discard_pile, counts = state
+        self.draw_pile = list(draw_pile)
+        self.discard_pile = list(discard_pile)
+        self.counts = dict(counts)
+
+    # ------------------ 查询 ------------------
+    def __len__(self):
+        return len(self.draw_pile)
+
+    def remaining_counts(self):
+        """抽牌堆中各牌号剩余张数（副本）"""
+        return dict(self.counts)
+
+    def probability(self, number):
+        """下一张抽到指定牌号的概率（不考虑洗回弃牌堆）"""
+        if not self.draw_pile:
+            return 0.0
+        return self.counts.get(number, 0) / len(self.draw_pile)
+
+    def draw_probabilities(self):
+        """下一张牌的概率分布 {牌号: 概率}"""
+        total = len(self.draw_pile)
+        if total == 0:
+            return {}
+        return {n: c / total for n, c in self.counts.items() if c > 0}
@@ -0,0 +1,292 @@
+# game/events.py
+"""
+引擎事件总线
+
+规则代码（技能、出牌、发牌、小局结算）只发出带类型的事件，不直接拼日志字符串、不直接 print：
+    bus.emit(PointsChanged, source, player, card, old, new)
+没有订阅者时 emit 只做一次字典查询就返回，事件对象都不会创建；
+UI 日志、控制台输出、对局录像等都作为订阅者按需接入，只有在订阅者调用 event.format() 时才生成文字。
+"""
+
+
+class Event:
+    """事件基类"""
+    __slots__ = ()
+
+    def format(self):
+        """生成给人看的日志文字"""
+        raise NotImplementedError
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+# ------------------ 出牌与点数 ------------------
+class CardPlayed(Event):
+    """卡牌被打出并放入战场 / 孤立区"""
+    __slots__ = ("player", "card", "zone")
+
+    def __init__(self, player, card, zone):
+        self.player = player
+        self.card = card
+        self.zone = zone
+
+    def format(self):
+        zone_text = "孤立区" if self.zone == "isolated" else "战场"
+        return f"{self.player.name} 将 {self.card.name} 放入{zone_text}"
+
+
+class PointsChanged(Event):
+    """卡牌点数变化"""
+    __slots__ = ("source", "player", "card", "old", "new")
+
+    def __init__(self, source, player, card, old, new):
+        self.source = source
+        self.player = player
+        self.card = card
+        self.old = old
+        self.new = new
+
+    def format(self):
+        return f"[{self.source}] {self.player.name} 的 {self.card.name} 点数 {self.old} -> {self.new}"
+
+
+class ScoreChanged(Event):
+    """技能直接给玩家加分"""
+    __slots__ = ("source", "player", "delta", "total")
+
+    def __init__(self, source, player, delta, total):
+        self.source = source
+        self.player = player
+        self.delta = delta
+        self.total = total
+
+    def format(self):
+        return f"[{self.source}] {self.player.name} 得分 +{self.delta}，总分 {self.total}"
+
+
+# ------------------ 牌的流动 ------------------
+class CardDealt(Event):
+    """小局开始时发牌"""
+    __slots__ = ("player", "card")
+
+    def __init__(self, player, card):
+        self.player = player
+        self.card = card
+
+    def format(self):
+        return f"{self.player.name} 抽到卡牌 {self.card.name}"
+
+
+class CardDrawn(Event):
+    """技能效果抽牌（card 为 None 表示牌堆已空）"""
+    __slots__ = ("source", "player", "card")
+
+    def __init__(self, source, player, card):
+        self.source = source
+        self.player = player
+        self.card = card
+
+    def format(self):
+        if self.card is None:
+            return f"[{self.source}] {self.player.name} 没有抽到牌"
+        return f"[{self.source}] {self.player.name} 抽到 {self.card.name}"
+
+
+class CardDiscarded(Event):
+    """弃掉一张手牌"""
+    __slots__ = ("source", "player", "card")
+
+    def __init__(self, source, player, card):
+        self.source = source
+        self.player = player
+        self.card = card
+
+    def format(self):
+        return f"[{self.source}] {self.player.name} 弃掉 {self.card.name}"
+
+
+class CardDestroyed(Event):
+    """场上的牌被消灭"""
+    __slots__ = ("source", "player", "card")
+
+    def __init__(self, source, player, card):
+        self.source = source
+        self.player = player
+        self.card = card
+
+    def format(self):
+        return f"[{self.source}] 消灭了 {self.player.name} 的 {self.card.name}"
+
+
+class CardStolen(Event):
+    """从其他玩家手牌中抽走一张牌"""
+    __slots__ = ("source", "player", "victim", "card")
+
+    def __init__(self, source, player, victim, card):
+        self.source = source
+        self.player = player
+        self.victim = victim
+        self.card = card
+
+    def format(self):
+        return f"[{self.source}] {self.player.name} 从 {self.victim.name} 手牌中抽取 {self.card.name}"
+
+
+class DiceRolled(Event):
+    """掷骰子（拼点时带对手的点数）"""
+    __slots__ = ("source", "player", "roll", "opponent", "opponent_roll")
+
+    def __init__(self, source, player, roll, opponent=None, opponent_roll=None):
+        self.source = source
+        self.player = player
+        self.roll = roll
+        self.opponent = opponent
+        self.opponent_roll = opponent_roll
+
+    def format(self):
+        text = f"[{self.source}] {self.player.name} 掷出 {self.roll}"
+        if self.opponent is not None:
+            text += f" vs {self.opponent.name} 掷出 {self.opponent_roll}"
+        return text
+
+
+class Notice(Event):
+    """其余提示（技能未生效等），文字按模板延迟格式化"""
+    __slots__ = ("source", "template", "args")
+
+    def __init__(self, source, template, *args):
+        self.source = source
+        self.template = template
+        self.args = args
+
+    def format(self):
+        return f"[{self.source}] " + self.template.format(*self.args)
+
+
+# ------------------ 玩家决策（录像用，不写入日志） ------------------
+class TurnAction(Event):
+    """玩家本回合的行动（在执行前发出，result 与 GameManager.play_turn 的参数相同）"""
+    __slots__ = ("player", "result")
+
+    def __init__(self, player, result):
+        self.player = player
+        self.result = result
+
+    def format(self):
+        if self.result.get("card") is None:
+            return f"{self.player.name} 结束回合"
+        return f"{self.player.name} 打出 {self.result['card'].name}"
+
+
+class DiscardsChosen(Event):
+    """玩家（控制器或 UI）为技能选定的弃牌；空列表表示交给规则随机弃牌"""
+    __slots__ = ("player", "cards")
+
+    def __init__(self, player, cards):
+        self.player = player
+        self.cards = cards
+
+    def format(self):
+        return f"{self.player.name} 选择弃掉 {[c.name for c in self.cards]}"
+
+
+# ------------------ 小局 ------------------
+class RoundStarted(Event):
+    """小局开始"""
+    __slots__ = ("round",)
+
+    def __init__(self, round):
+        self.round = round
+
+    def format(self):
+        return f"\n=== 第 {self.round} 小局 ==="
+
+
+class RoundEnded(Event):
+    """小局结算：scores 为 {玩家名: 分数}，winners 为胜者列表，standings 为 {玩家名: 小局胜场}"""
+    __slots__ = ("round", "scores", "winners", "standings")
+
+    def __init__(self, round, scores, winners, standings):
+        self.round = round
+        self.scores = scores
+        self.winners = winners
+        self.standings = standings
+
+    def format(self):
+        if len(self.winners) == 1:
+            result = f"{self.winners[0].name} 赢得本小局！"
+        else:
+            result = f"平局！胜者: {[p.name for p in self.winners]}"
+        return f"小局得分: {self.scores}\n{result}\n当前总战况: {self.standings}"
+
+
+ALL_EVENTS = (CardPlayed, PointsChanged, ScoreChanged, CardDealt, CardDrawn, CardDiscarded,
+              CardDestroyed, CardStolen, DiceRolled, Notice, RoundStarted, RoundEnded,
+              TurnAction, DiscardsChosen)
+
+# 决策事件（录像订阅这些）
+DECISION_EVENTS = (TurnAction, DiscardsChosen)
+
+# 写入日志的事件（控制台输出订阅这些）
+LOG_EVENTS = tuple(e for e in ALL_EVENTS if e not in DECISION_EVENTS)
+
+# 出牌过程中的事件（UI 操作记录面板订阅这些）
+PLAY_EVENTS = (CardPlayed, PointsChanged, ScoreChanged, CardDrawn, CardDiscarded,
+               CardDestroyed, CardStolen, DiceRolled, Notice)
+
+
+class EventBus:
+    def __init__(self):
+        self.enabled = True          # 关闭后所有事件直接丢弃（例如 AI 搜索推演期间）
+        self._handlers = []          # [(handler, 事件类型元组或 None)]
+        self._dispatch = {}          # 事件类型 -> 订阅者列表（订阅变化时重建）
+
+    def __getstate__(self):
+        # 订阅者（UI、控制台等）不随对局副本发送到其他进程
+        return {"enabled": self.enabled, "_handlers": [], "_dispatch": {}}
+
+    def subscribe(self, handler, *event_types):
+        """
+        订阅事件
+        :param handler: 回调函数，参数为事件对象
+        :param event_types: 只订阅这些事件类型；不传则订阅全部
+        :return: handler（便于之后 unsubscribe）
+        """
+        self._handlers.append((handler, event_types or None))
+        self._rebuild()
+        return handler
+
+    def unsubscribe(self, handler):
+        """取消订阅（用 == 比较，绑定方法每次取值都是新对象）"""
+        self._handlers = [(h, t) for h, t in self._handlers if h != handler]
+        self._rebuild()
+
+    def _rebuild(self):
+        dispatch = {}
+        for event_type in ALL_EVENTS:
+            handlers = [h for h, types in self._handlers if types is None or event_type in types]
+            if handlers:
+                dispatch[event_type] = handlers
+        self._dispatch = dispatch
+
+    def has_subscribers(self, event_type=None):
+        """是否有订阅者（用于跳过只为日志准备的额外计算）"""
+        if not self.enabled:
+            return False
+        return bool(self._dispatch) if event_type is None else event_type in self._dispatch
+
+    def emit(self, event_type, *args):
+        """发出事件：没有订阅者时不会创建事件对象"""
+        handlers = self._dispatch.get(event_type)
+        if handlers is None or not self.enabled:
+            return
+        event = event_type(*args)
+        for handler in handlers:
+            handler(event)
+
+
+def print_event(event):
+    """控制台输出订阅者"""
+    print(event.format())
@@ -1,25 +1,57 @@
 import random
-import pygame
 from .board import Board
 from .card_factory import create_card_by_number
+from .deck import Deck
 from .play_action import PlayAction
-from ui.constants import END_TURN, PLAY_CARD, SELECT_TARGET
+from .state import GameState
+from .controller import END_TURN, PLAY_CARD
+from .events import EventBus, CardDealt, RoundStarted, RoundEnded, TurnAction, LOG_EVENTS, print_event
+
 
 class GameManager:
-    def __init__(self, players, total_rounds=3):
+    def __init__(self, players, total_rounds=3, controllers=None, verbose=True, seed=None, deck_composition=None):
+        """
+        :param players: 玩家列表
+        :param total_rounds: 最多进行的小局数
+        :param controllers: {座位索引: Controller}，配置了控制器的座位不再等待 UI 操作
+        :param verbose: 是否在控制台打印对局过程（批量模拟时关闭，此时事件总线没有订阅者，几乎没有开销）
+        :param seed: 随机种子；同一种子 + 同样的操作序列可完整复现整局（None 时随机生成）
+        :param deck_composition: 牌堆构成 {牌号: 张数}，默认每种牌 DEFAULT_COPIES 张
+        """
         self.players = players
+        # 每局独立的随机数发生器：发牌、抽牌、掷骰、随机弃牌都从这里取
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        # 控制器决策用的随机数与规则随机数分开：规则随机数只受玩家决策影响，录像回放时不必重演控制器
+        self.policy_rng = random.Random(self.rng.getrandbits(64))
+        self.deck = Deck(deck_composition, rng=self.rng)
         self.total_rounds = total_rounds
+        self.controllers = dict(controllers or {})
+        self.verbose = verbose
+        # 对局事件总线：技能 / 出牌 / 发牌 / 结算都在这里发出事件，UI 日志与控制台输出按需订阅
+        self.events = EventBus()
+        if verbose:
+            self.events.subscribe(print_event, *LOG_EVENTS)
+        # 大局胜利所需的小局胜场（先至 2 胜）
+        self.wins_to_win = 2
         self.current_round = 0
         self.board = None
         self.current_player_index = 0
         # 小局起手玩家索引（每小局轮换起手）
         self.starting_player_index = 0
+        # 小局进行状态：各玩家是否已结束回合
+        self.players_done = []
+        self.round_active = False
         self.reset_scores()  # 初始化得分记录
 
+    def _print(self, msg):
+        if self.verbose:
+            print(msg)
+
     def reset_scores(self):
         """重置玩家得分记录"""
         self.small_rounds_won = {p.name: 0 for p in self.players}
-        print(f"初始化玩家得分: {self.small_rounds_won}")
+        self._print(f"初始化玩家得分: {self.small_rounds_won}")
 
     def setup_board(self):
         """初始化战场"""
@@ -29,26 +61,70 @@ class GameManager:
     def start_small_round(self):
         """开始小局"""
         self.current_round += 1
-        print(f"\n=== 第 {self.current_round} 小局 ===")
-        self.deal_cards()
+        self.events.emit(RoundStarted, self.current_round)
+        # 上一小局留在场上的牌先清场进入弃牌堆，发牌时牌堆耗尽才能把它们洗回来
+        leaving = self.board.all_cards_on_board() if self.board else []
         for player in self.players:
             player.reset_board()
-        print("小局开始！")
+        self.discard_cards(leaving)
+        self.deal_cards()
+        # 本小局的先手由 starting_player_index 决定
+        self.current_player_index = self.starting_player_index
+        self.players_done = [False] * len(self.players)
+        self.round_active = True
 
     def deal_cards(self):
         """发牌规则"""
         num_cards = 6 if self.current_round == 1 else 2
+        emit = self.events.emit
         for player in self.players:
-            for _ in range(num_cards):
-                card_number = random.randint(1, 19)
+            for card_number in self.deck.draw_n(num_cards):
                 card = create_card_by_number(card_number)
                 player.draw_card(card)
+                emit(CardDealt, player, card)
 
     def draw_card_for_player(self, player):
-        """为指定玩家抽一张牌"""
-        card_number = random.randint(1, 19)
-        card = create_card_by_number(card_number)
-        return card
+        """为指定玩家从牌堆抽一张牌（牌堆与弃牌堆都空时返回 None）"""
+        card_number = self.deck.draw()
+        if card_number is None:
+            return None
+        return create_card_by_number(card_number)
+
+    def discard_cards(self, cards):
+        """
+        把离开对局的牌放入弃牌堆
+        仍留在某位玩家任一牌区中的牌（例如孤立放置后同时留在手里的牌）不会被弃掉，同一张牌只弃一次
+        """
+        seen = set()
+        for card in cards:
+            key = id(card)
+            # 牌区为每张牌记录所在牌区，仍在场上的牌不用逐区扫描即可判断
+            if key in seen or card.zones is not None:
+                continue
+            seen.add(key)
+            number = getattr(card, "number", None)
+            if number is not None:
+                self.deck.discard(number)
+
+    def reseed(self, seed):
+        """用新种子重置随机数发生器（例如开始新的一大局时）"""
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.policy_rng = random.Random(self.rng.getrandbits(64))
+        self.deck.rng = self.rng
+        self.deck.reset()
+
+    def seed_rng(self, seed):
+        """只重设对局随机数的种子（原地设定，牌堆共用同一发生器；不重建牌堆，供搜索推演使用）"""
+        self.rng.seed(seed)
+
+    def snapshot(self):
+        """拍下当前对局状态（用于搜索推演、悔棋与预览），配合 restore 使用"""
+        return GameState.capture(self)
+
+    def restore(self, state):
+        """恢复 snapshot 拍下的对局状态"""
+        state.restore(self)
 
     def next_turn(self):
         """下一个玩家回合"""
@@ -58,104 +134,129 @@ class GameManager:
     def current_player(self):
         return self.players[self.current_player_index]
 
-    # ---------------- 小局逻辑 ----------------
-    def play_small_round(self, ui):
-        """运行一个小局"""
-        self.start_small_round()
-        # 开局时锁定当局卡面固定宽度
-        if hasattr(ui, 'fix_card_width_for_round'):
-            ui.fix_card_width_for_round()
-        # 本小局的先手由 starting_player_index 决定
-        self.current_player_index = self.starting_player_index
-        players_done = [False] * len(self.players)
+    # ---------------- 回合控制 ----------------
+    def set_controller(self, index, controller):
+        """为指定座位设置回合控制器（None 表示交还给 UI 操作）"""
+        if controller is None:
+            self.controllers.pop(index, None)
+        else:
+            self.controllers[index] = controller
 
-        while not all(players_done):
-            player = self.current_player
-            if players_done[self.current_player_index]:
-                self.next_turn()
-                continue
+    def controller_for(self, player):
+        """返回玩家座位对应的控制器，没有则返回 None"""
+        return self.controllers.get(player.index)
 
-            # --- 阶段 1：等待玩家行动（选牌或结束回合） ---
-            result = ui.wait_for_player_action(player)
-            
-            # 如果玩家选择结束回合
-            if result["type"] == END_TURN:
-                players_done[self.current_player_index] = True
-                self.next_turn()
-                continue
-                
-            # 如果玩家选择了卡牌
-            if result["type"] == PLAY_CARD:
-                card = result["card"]
-                # 直接使用 UI 返回的选择（防止被重置而丢失）
-                targets = result.get("targets", [])
-                enemies = result.get("enemies", [])
-            else:
-                continue
+    def request_action(self, player, ui=None):
+        """向控制器（优先）或 UI 索取玩家本回合的行动"""
+        controller = self.controller_for(player)
+        if controller is not None:
+            return controller.choose_action(self, player)
+        if ui is not None:
+            return ui.wait_for_player_action(player)
+        raise RuntimeError(f"{player.name} 既没有控制器也没有 UI，无法获取行动")
+
+    def is_round_over(self):
+        """本小局是否所有玩家都已结束回合"""
+        return all(self.players_done)
 
-            # --- 阶段 2：选择目标（阻塞等待） ---
-            # 若 UI 已经返回了目标/敌人，则不必再次等待选择
-            needs_target = card.requires_target and not targets
-            needs_enemy = card.requires_enemy and not enemies
-            if needs_target or needs_enemy:
-                message = []
-                if needs_target:
-                    message.append("选择目标卡牌")
-                if needs_enemy:
-                    message.append("选择敌方玩家")
-                ui.show_message(f"{player.name} 请{' 和 '.join(message)}！")
-                
-                waiting_for_targets = True
-                while waiting_for_targets and ui.running:
-                    ui.handle_events()   # 处理玩家操作
-                    ui.draw_game()       # 刷新 UI
-                    pygame.time.wait(50) # 控制帧率
-
-                    if needs_enemy and ui.enemy_list:
-                        enemies = ui.enemy_list
-                        needs_enemy = False
-                    
-                    if needs_target and ui.target_list:
-                        targets = ui.target_list
-                        needs_target = False
-                    
-                    if not needs_target and not needs_enemy:
-                        waiting_for_targets = False
-
-            # 重置选择状态（无论是否进入等待环节，都清理一下以防残留）
-            ui.selected_card = None
-            ui.target_list = []
-            ui.enemy_list = []
-
-            # --- 阶段 3：出牌 ---
+    def is_match_over(self):
+        """是否已有玩家达到大局胜利所需的小局胜场"""
+        return any(w >= self.wins_to_win for w in self.small_rounds_won.values())
+
+    def play_turn(self, result, ui=None):
+        """
+        执行当前玩家的一次行动并轮转到下一位尚未结束的玩家
+        :param result: {"type": END_TURN} 或 {"type": PLAY_CARD, "card", "targets", "enemies"}
+        :param ui: UI 实例（可选，技能需要玩家二次选择时使用）
+        :return: 行动是否被执行（未知类型返回 False，当前玩家不变）
+        """
+        player = self.current_player
+        self.events.emit(TurnAction, player, result)
+        if result["type"] == END_TURN:
+            self.players_done[self.current_player_index] = True
+        elif result["type"] == PLAY_CARD:
             action = PlayAction(
                 owner=player,
-                self_card=card,
+                self_card=result["card"],
                 board=self.board,
                 manager=self,
-                targets=targets,
-                enemies=enemies,
-                ui=ui
+                targets=result.get("targets", []),
+                enemies=result.get("enemies", []),
+                ui=ui,
+                controller=self.controller_for(player),
             )
             player.play_card(action)
-            # 出牌后切换玩家
+        else:
+            return False
+
+        self._advance_turn()
+        if self.is_round_over():
+            self.round_active = False
+        return True
+
+    def _advance_turn(self):
+        """切换到下一位尚未结束回合的玩家（全部结束时停在下一位）"""
+        for _ in range(len(self.players)):
             self.next_turn()
+            if not self.players_done[self.current_player_index]:
+                return
+
+    # ---------------- 小局逻辑 ----------------
+    def play_small_round(self, ui=None):
+        """运行一个小局（ui 为 None 时所有座位必须配置控制器）"""
+        self.start_small_round()
+        # 开局时锁定当局卡面固定宽度
+        if ui is not None and hasattr(ui, 'fix_card_width_for_round'):
+            ui.fix_card_width_for_round()
+
+        while not self.is_round_over():
+            player = self.current_player
+
+            # --- 阶段 1：等待玩家行动（选牌或结束回合） ---
+            result = self.request_action(player, ui)
 
+            # --- 阶段 2：UI 出牌时补选目标（阻塞等待），控制器须直接给出完整目标 ---
+            if result["type"] == PLAY_CARD and ui is not None:
+                if self.controller_for(player) is None:
+                    result = ui.wait_for_targets(player, result)
+                # 重置选择状态（无论是否进入等待环节，都清理一下以防残留）
+                ui.selected_card = None
+                ui.target_list = []
+                ui.enemy_list = []
 
+            # --- 阶段 3：出牌 / 结束回合，并切换玩家 ---
+            self.play_turn(result, ui)
+            # 控制器（AI）行动不经过 UI 的等待循环，这里刷新一次画面
+            if ui is not None and self.controller_for(player) is not None:
+                ui.draw_game()
 
         # 小局全部玩家回合结束后结算
+        return self.finish_small_round()
+
+    def finish_small_round(self):
+        """结算小局，并让下一位玩家成为下一小局的先手"""
         winners = self.end_small_round()
-        # 下一小局轮到下一个玩家先手
+        self.round_active = False
         if len(self.players) > 0:
             self.starting_player_index = (self.starting_player_index + 1) % len(self.players)
         return winners
 
+    def play_match(self, ui=None):
+        """
+        连续进行小局直到有人达到胜场或打满 total_rounds（无界面批量对局入口）
+        :return: 大局胜者名字列表
+        """
+        if self.board is None:
+            self.setup_board()
+        while self.current_round < self.total_rounds and not self.is_match_over():
+            self.play_small_round(ui)
+        return self.show_winner()
+
 
     def end_small_round(self):
         """结算小局得分"""
-        # 计算并打印所有玩家得分
+        # 计算所有玩家得分
         scores = {p.name: p.calculate_score() for p in self.players}
-        print(f"小局得分: {scores}")
 
         # 找出最高分
         max_score = max(scores.values())
@@ -168,28 +269,27 @@ class GameManager:
         # 确保所有玩家都在small_rounds_won中
         for p in self.players:
             if p.name not in self.small_rounds_won:
-                print(f"修复: 添加 {p.name} 到得分记录")
+                self._print(f"修复: 添加 {p.name} 到得分记录")
                 self.small_rounds_won[p.name] = 0
 
         # 处理胜利结果
         if len(winners) == 1:
             winner = winners[0]
-            print(f"{winner.name} 赢得本小局！")
             if winner.name in self.small_rounds_won:
                 self.small_rounds_won[winner.name] += 1
                 winner.wins += 1
             else:
-                print(f"错误：{winner.name} 不在得分记录中")
+                self._print(f"错误：{winner.name} 不在得分记录中")
         else:
-            print(f"平局！胜者: {[p.name for p in winners]}")
             for w in winners:
                 if w.name in self.small_rounds_won:
                     w.wins += 1
                 else:
-                    print(f"错误：{w.name} 不在得分记录中")
+                    self._print(f"错误：{w.name} 不在得分记录中")
 
-        # 打印当前总战况
-        print(f"当前总战况: {self.small_rounds_won}")
+        # 结算事件（战况副本只在有订阅者时才复制）
+        if self.events.has_subscribers(RoundEnded):
+            self.events.emit(RoundEnded, self.current_round, scores, winners, dict(self.small_rounds_won))
         return winners
 
     # ---------------- 大局胜利 ----------------
@@ -204,7 +304,10 @@ class GameManager:
         self.current_round = 0
         self.current_player_index = 0
         self.starting_player_index = 0
+        self.players_done = []
+        self.round_active = False
         self.reset_scores()  # 使用统一的重置得分方法
         for p in self.players:
             p.reset_all()
+        self.deck.reset()
 
@@ -0,0 +1,269 @@
+# game/mcts.py
+"""
+蒙特卡洛树搜索（MCTS）AI：MCTSController
+
+作为回合控制器接入 GameManager，可以坐在任意座位。每次决策：
+  1. 对当前局面拍快照；
+  2. 每轮迭代先做一次“确定化”：把对手手牌与牌堆顺序按观察者视角重新随机发牌；
+  3. 在信息集树上用 UCB 选择 / 扩展一步，再用随机策略推演到小局（或大局）结束；
+  4. 回传各玩家的胜负收益，最后选择根节点访问次数最多的行动。
+动作以牌号而非卡牌对象标识，因此同一棵树可以跨不同的确定化复用。
+workers > 1 时在多个进程中各自独立搜索（根并行），再合并根节点访问次数。
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .card_factory import create_card_by_number
+from .controller import END_TURN, PLAY_CARD, Controller, legal_plays
+
+
+# ------------------ 动作标识 ------------------
+def _card_ref(board, card):
+    """把目标牌转成 (玩家索引, 牌区, 区内位置)，不随确定化改变"""
+    for p in board.players:
+        for zone_name in ("battlefield", "isolated", "hand"):
+            zone = board.get_player_zone(p, zone_name)
+            for i, c in enumerate(zone):
+                if c is card:
+                    return (p.index, zone_name, i)
+    return None
+
+
+def _legal_options(manager, player):
+    """当前玩家的全部合法行动 {动作标识: 行动结果}，包含结束回合"""
+    options = {(END_TURN,): {"type": END_TURN}}
+    board = manager.board
+    for card, targets, enemies in legal_plays(board, player):
+        key = (PLAY_CARD,
+               card.number if card.number is not None else card.name,
+               tuple(_card_ref(board, t) for t in targets),
+               tuple(e.index for e in enemies))
+        if key not in options:
+            options[key] = {"type": PLAY_CARD, "card": card, "targets": targets, "enemies": enemies}
+    return options
+
+
+# ------------------ 确定化与推演 ------------------
+def _determinize(manager, observer_index, rng):
+    """
+    按观察者视角重新抽样隐藏信息：对手手牌（孤立放置后同时留在手里的牌是公开的）与牌堆顺序
+    并为推演重新设定对局随机数
+    """
+    hidden = list(manager.deck.draw_pile)
+    redeal = []
+    for p in manager.players:
+        if p.index == observer_index:
+            continue
+        public = {id(c) for c in p.isolated_cards}
+        slots = [i for i, c in enumerate(p.hand) if id(c) not in public and c.number is not None]
+        hidden.extend(p.hand[i].number for i in slots)
+        redeal.append((p, slots))
+    rng.shuffle(hidden)
+    # 只替换未公开的位置，公开的牌留在原位
+    for p, slots in redeal:
+        hand = list(p.hand)
+        for i in slots:
+            hand[i] = create_card_by_number(hidden.pop())
+        p.hand[:] = hand
+    manager.deck.set_hidden(hidden)
+    manager.seed_rng(rng.getrandbits(64))
+
+
+def _random_turn(manager, rng):
+    """随机策略走一步（与 RandomController 相同的分布）"""
+    plays = legal_plays(manager.board, manager.current_player)
+    pick = rng.randrange(len(plays) + 1)
+    if pick == len(plays):
+        manager.play_turn({"type": END_TURN})
+    else:
+        card, targets, enemies = plays[pick]
+        manager.play_turn({"type": PLAY_CARD, "card": card, "targets": targets, "enemies": enemies})
+
+
+def _rollout(manager, rng, horizon):
+    """
+    随机推演到小局（horizon="round"）或大局（horizon="match"）结束
+    :return: 各座位收益列表，胜者平分 1
+    """
+    while manager.round_active:
+        _random_turn(manager, rng)
+    players = manager.players
+    if horizon == "match":
+        manager.finish_small_round()
+        while manager.current_round < manager.total_rounds and not manager.is_match_over():
+            manager.start_small_round()
+            while manager.round_active:
+                _random_turn(manager, rng)
+            manager.finish_small_round()
+        winners = set(manager.show_winner())
+        rewards = [0.0] * len(players)
+        for p in players:
+            if p.name in winners:
+                rewards[p.index] = 1.0 / len(winners)
+        return rewards
+
+    scores = [p.live_score for p in players]
+    best = max(scores)
+    share = 1.0 / scores.count(best)
+    return [share if s == best else 0.0 for s in scores]
+
+
+# ------------------ 搜索树 ------------------
+class _Node:
+    __slots__ = ("parent", "key", "player_index", "children", "visits", "reward", "avail")
+
+    def __init__(self, parent, key, player_index):
+        self.parent = parent
+        self.key = key                  # 到达本节点的动作
+        self.player_index = player_index  # 做出该动作的玩家
+        self.children = {}
+        self.visits = 0
+        self.reward = 0.0
+        self.avail = 1                  # 该动作在多少次确定化中可用（信息集 UCB）
+
+
+def _search(manager, player_index, iterations, time_limit, exploration, seed, horizon, determinize):
+    """
+    在 manager 上做一次搜索（结束后恢复原局面）
+    :return: ({动作标识: 访问次数}, 实际迭代次数)
+    """
+    rng = random.Random(seed)
+    root_state = manager.snapshot()
+    verbose = manager.verbose
+    manager.verbose = False
+    # 推演中的事件不能流到 UI 日志 / 录像等订阅者
+    events_enabled = manager.events.enabled
+    manager.events.enabled = False
+    root = _Node(None, None, player_index)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    done = 0
+    try:
+        while done < iterations and (deadline is None or time.perf_counter() < deadline):
+            root_state.restore(manager)
+            if determinize:
+                _determinize(manager, player_index, rng)
+            else:
+                manager.seed_rng(rng.getrandbits(64))
+                manager.deck.shuffle(rng)
+
+            # 选择 / 扩展（只在当前小局内建树）
+            node = root
+            while manager.round_active:
+                mover = manager.current_player
+                options = _legal_options(manager, mover)
+                children = node.children
+                untried = []
+                for k in options:
+                    child = children.get(k)
+                    if child is None:
+                        untried.append(k)
+                    else:
+                        child.avail += 1
+                if untried:
+                    k = untried[rng.randrange(len(untried))]
+                    child = _Node(node, k, mover.index)
+                    children[k] = child
+                    manager.play_turn(options[k])
+                    node = child
+                    break
+                best = None
+                best_value = -1.0
+                for k in options:
+                    c = children[k]
+                    value = c.reward / c.visits + exploration * math.sqrt(math.log(c.avail) / c.visits)
+                    if value > best_value:
+                        best, best_value = c, value
+                manager.play_turn(options[best.key])
+                node = best
+
+            # 推演与回传
+            rewards = _rollout(manager, rng, horizon)
+            while node is not None:
+                node.visits += 1
+                if node.key is not None:
+                    node.reward += rewards[node.player_index]
+                node = node.parent
+            done += 1
+    finally:
+        root_state.restore(manager)
+        manager.verbose = verbose
+        manager.events.enabled = events_enabled
+    return {k: c.visits for k, c in root.children.items()}, done
+
+
+def _search_worker(args):
+    """进程池入口：参数中的 manager 是主进程对局的独立副本"""
+    return _search(*args)
+
+
+class MCTSController(Controller):
+    """蒙特卡洛树搜索 AI"""
+
+    def __init__(self, iterations=2000, time_limit=None, exploration=0.7, horizon="round",
+                 determinize=True, workers=1, seed=None):
+        """
+        :param iterations: 每步最多迭代次数
+        :param time_limit: 每步最多思考秒数（None 表示只受迭代次数限制）
+        :param exploration: UCB 探索系数
+        :param horizon: 推演终点："round" 推演到小局结束，"match" 推演到大局结束
+        :param determinize: 是否对对手手牌做确定化抽样（手牌公开的热座模式可关闭）
+        :param workers: 根并行进程数，1 表示在当前进程搜索
+        :param seed: 搜索用随机种子
+        """
+        if horizon not in ("round", "match"):
+            raise ValueError(f"未知推演终点: {horizon}")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.horizon = horizon
+        self.determinize = determinize
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self.last_iterations = 0   # 上一步实际迭代次数（调试 / 统计用）
+        self._pool = None
+
+    def __getstate__(self):
+        # 进程池不可序列化（对局被发送到工作进程时会连同控制器一起序列化）
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def choose_action(self, manager, player):
+        options = _legal_options(manager, player)
+        if len(options) == 1:
+            return options[(END_TURN,)]
+
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            per_worker = max(1, self.iterations // self.workers)
+            jobs = [(manager, player.index, per_worker, self.time_limit, self.exploration,
+                     self.rng.getrandbits(64), self.horizon, self.determinize)
+                    for _ in range(self.workers)]
+            visits = {}
+            total = 0
+            for part, done in self._pool.map(_search_worker, jobs):
+                total += done
+                for k, v in part.items():
+                    visits[k] = visits.get(k, 0) + v
+        else:
+            visits, total = _search(manager, player.index, self.iterations, self.time_limit,
+                                    self.exploration, self.rng.getrandbits(64), self.horizon, self.determinize)
+        self.last_iterations = total
+
+        best = max(options, key=lambda k: visits.get(k, 0))
+        return options[best]
+
+    def choose_discards(self, manager, player, count):
+        """弃牌时留下基础点数高的牌"""
+        ranked = sorted(player.hand, key=lambda c: c.base_points)
+        return ranked[:min(count, len(ranked))]
+
+    def close(self):
+        """关闭根并行使用的进程池"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
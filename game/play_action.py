@@ -1,6 +1,15 @@
+import random
+
+from .events import EventBus, print_event
+
+# 没有 manager 时使用的事件总线：与旧行为一致，直接打印到控制台
+_CONSOLE_EVENTS = EventBus()
+_CONSOLE_EVENTS.subscribe(print_event)
+
+
 # >>> CHANGED: 新增 PlayAction，包含 manager 和 enemies（方便技能调用游戏管理器或选敌人）
 class PlayAction:
-    def __init__(self, owner, self_card, board, manager, targets, enemies=None, ui=None):
+    def __init__(self, owner, self_card, board, manager, targets, enemies=None, ui=None, controller=None, rng=None, events=None):
         """
         :param owner: 出牌玩家
         :param self_card: 被出的卡牌
@@ -8,7 +17,10 @@ class PlayAction:
         :param manager: GameManager（可选，许多技能需要调用 draw_card 等方法）
         :param targets: 卡牌目标列表（通常是牌对象）
         :param enemies: 敌方玩家列表（通常是 Player 对象）
-        :param ui: UI 实例，用于写入操作日志
+        :param ui: UI 实例（技能需要玩家二次选择时使用，例如选择弃牌）
+        :param controller: 出牌玩家的回合控制器（可选，技能需要玩家二次选择时优先询问它）
+        :param rng: 随机数发生器（默认取 manager.rng，没有 manager 时退回全局 random）
+        :param events: 事件总线（默认取 manager.events，没有 manager 时直接打印到控制台）
         """
         self.owner = owner
         self.self_card = self_card
@@ -17,6 +29,13 @@ class PlayAction:
         self.targets = targets or []
         self.enemies = enemies or []
         self.ui = ui
+        self.controller = controller
+        if rng is None:
+            rng = getattr(manager, 'rng', None) or random
+        self.rng = rng
+        if events is None:
+            events = getattr(manager, 'events', None) or _CONSOLE_EVENTS
+        self.events = events
 
     def add_target(self, t):
         self.targets.append(t)
@@ -1,4 +1,7 @@
 # game/player.py
+from .zone import Zone
+
+
 class Player:
     def __init__(self, name, index=0):
         """
@@ -8,9 +11,10 @@ class Player:
         """
         self.name = name
         self.index = index
-        self.hand = []            # 手牌列表（Card 对象）
-        self.battlefield_cards = []     # 战场牌列表
-        self.isolated_cards = []  # 孤立牌列表
+        # 三个牌区都是 Zone（带点数合计的列表），请原地修改（append / remove / zone[:] = ...），不要整体替换
+        self.hand = Zone(name="hand")                      # 手牌列表（Card 对象）
+        self.battlefield_cards = Zone(name="battlefield")  # 战场牌列表
+        self.isolated_cards = Zone(name="isolated")        # 孤立牌列表
         self.score = 0            # 玩家分数
         self.wins=0                 # 玩家胜小局数
         self.prev_round_won = False  # 上一小局是否获胜
@@ -18,7 +22,6 @@ class Player:
     def draw_card(self, card):
         """玩家抽一张牌加入手牌"""
         self.hand.append(card)
-        print(f"{self.name} 抽到卡牌 {card.name}")
 
     def play_card(self, action):
         """
@@ -37,10 +40,24 @@ class Player:
         card.play(action)
 
 
+    @property
+    def board_points(self):
+        """战场牌 + 孤立牌当前点数和（由牌区维护的合计直接得出，O(1)）"""
+        return self.battlefield_cards.total + self.isolated_cards.total
+
+    @property
+    def live_score(self):
+        """实时分数：已结算分数（含技能加分）+ 场上点数"""
+        return self.score + self.board_points
+
+    @property
+    def zones_version(self):
+        """三个牌区的版本号（任一牌区变化后都会不同）"""
+        return self.hand.version, self.battlefield_cards.version, self.isolated_cards.version
+
     def calculate_score(self):
         """计算当前分数：战场牌 + 孤立牌点数"""
-        total = sum(card.points for card in self.battlefield_cards + self.isolated_cards)
-        self.score += total
+        self.score += self.board_points
         return self.score
 
     # ------- 调试用方法 -------
@@ -0,0 +1,434 @@
+# game/replay.py
+"""
+对局录像：紧凑的二进制格式 + 录制 / 回放
+
+对局的随机性全部来自种子（GameManager.rng），因此录像只需要保存
+种子、玩家、小局数、牌堆构成，以及每个回合玩家的决策：
+  - 结束回合
+  - 出牌：手牌位置、目标牌 (玩家索引, 牌区, 区内位置)、敌方玩家索引
+  - 技能要求的弃牌选择（手牌位置）
+所有数字写成 varint，整个文件再用 zlib 压缩，一局通常只有一两百字节。
+
+录制：ReplayRecorder 订阅对局的决策事件（TurnAction / DiscardsChosen），每回合只追加几个字节。
+回放：ReplayController 坐在所有座位上按录像给出决策；ReplayPlayer 逐回合推进，
+并每隔若干回合拍一次快照，跳转（seek）时从最近的快照恢复后再往前走。
+"""
+
+import argparse
+import bisect
+import zlib
+
+from .controller import Controller, END_TURN, PLAY_CARD
+from .events import TurnAction, DiscardsChosen
+from .game_manager import GameManager
+from .player import Player
+
+MAGIC = b"RKR1"
+FORMAT_VERSION = 1
+
+# 录像记录类型
+REC_END = 0
+REC_PLAY = 1
+REC_DISCARD = 2
+
+ZONE_CODES = {"hand": 0, "battlefield": 1, "isolated": 2}
+ZONE_NAMES = ("hand", "battlefield", "isolated")
+
+
+# ------------------ varint 编解码 ------------------
+def write_varint(buf, value):
+    """把非负整数以 varint 追加到 bytearray"""
+    if value < 0:
+        raise ValueError(f"varint 只能编码非负整数: {value}")
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def read_varints(data, pos=0):
+    """把 data[pos:] 解码为整数列表"""
+    values = []
+    append = values.append
+    value = shift = 0
+    for b in memoryview(data)[pos:]:
+        value |= (b & 0x7F) << shift
+        if b & 0x80:
+            shift += 7
+        else:
+            append(value)
+            value = shift = 0
+    if shift:
+        raise ValueError("录像数据不完整：varint 被截断")
+    return values
+
+
+def _write_text(buf, text):
+    raw = text.encode("utf-8")
+    write_varint(buf, len(raw))
+    buf.extend(raw)
+
+
+def _read_text(data, pos):
+    """返回 (字符串, 新位置)"""
+    length, pos = _read_one(data, pos)
+    if pos + length > len(data):
+        raise ValueError("录像数据不完整：头部被截断")
+    return bytes(data[pos:pos + length]).decode("utf-8"), pos + length
+
+
+def _read_one(data, pos):
+    """读一个 varint，返回 (值, 新位置)"""
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("录像数据不完整：头部被截断")
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return value, pos
+        shift += 7
+
+
+# ------------------ 录像数据 ------------------
+class Replay:
+    def __init__(self, seed, names, total_rounds, composition, records=b""):
+        """
+        :param seed: 对局种子（非负整数）
+        :param names: 玩家名字列表（座位顺序）
+        :param total_rounds: 最多小局数
+        :param composition: 牌堆构成 {牌号: 张数}
+        :param records: 决策流（未压缩的 varint 字节串）
+        """
+        if not isinstance(seed, int) or seed < 0:
+            raise ValueError(f"录像只支持非负整数种子: {seed!r}")
+        self.seed = seed
+        self.names = list(names)
+        self.total_rounds = total_rounds
+        self.composition = dict(composition)
+        self.records = bytes(records)
+
+    @property
+    def num_players(self):
+        return len(self.names)
+
+    def turn_count(self):
+        """录像中的回合数（结束回合 + 出牌记录数）"""
+        return sum(1 for _ in _iter_turns(read_varints(self.records)))
+
+    # ---------- 序列化 ----------
+    def to_bytes(self):
+        """编码为压缩后的二进制"""
+        buf = bytearray()
+        write_varint(buf, FORMAT_VERSION)
+        write_varint(buf, self.seed)
+        write_varint(buf, self.total_rounds)
+        write_varint(buf, len(self.names))
+        for name in self.names:
+            _write_text(buf, name)
+        write_varint(buf, len(self.composition))
+        for number, count in sorted(self.composition.items()):
+            write_varint(buf, number)
+            write_varint(buf, count)
+        buf.extend(self.records)
+        return MAGIC + zlib.compress(bytes(buf), 9)
+
+    @classmethod
+    def from_bytes(cls, blob):
+        """从 to_bytes 的结果解码"""
+        if blob[:len(MAGIC)] != MAGIC:
+            raise ValueError("不是有效的录像文件")
+        try:
+            data = zlib.decompress(blob[len(MAGIC):])
+        except zlib.error as e:
+            raise ValueError(f"录像文件已损坏或被截断: {e}") from None
+        version, pos = _read_one(data, 0)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"不支持的录像版本: {version}")
+        seed, pos = _read_one(data, pos)
+        total_rounds, pos = _read_one(data, pos)
+        n, pos = _read_one(data, pos)
+        names = []
+        for _ in range(n):
+            name, pos = _read_text(data, pos)
+            names.append(name)
+        n, pos = _read_one(data, pos)
+        composition = {}
+        for _ in range(n):
+            number, pos = _read_one(data, pos)
+            count, pos = _read_one(data, pos)
+            composition[number] = count
+        return cls(seed, names, total_rounds, composition, data[pos:])
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    # ---------- 回放 ----------
+    def new_manager(self, controller=None, verbose=False):
+        """
+        按录像头部创建一局全新的对局（所有座位由 controller 控制）
+        :param controller: 回放控制器，默认新建 ReplayController
+        """
+        players = [Player(name, i) for i, name in enumerate(self.names)]
+        controller = controller or ReplayController(self)
+        gm = GameManager(players, total_rounds=self.total_rounds,
+                         controllers={i: controller for i in range(len(players))},
+                         verbose=verbose, seed=self.seed, deck_composition=self.composition)
+        gm.setup_board()
+        return gm
+
+
+def _iter_turns(values):
+    """遍历决策流中的回合记录，产出各回合起始位置"""
+    pos = 0
+    n = len(values)
+    while pos < n:
+        tag = values[pos]
+        if tag == REC_END:
+            yield pos
+            pos += 1
+        elif tag == REC_PLAY:
+            yield pos
+            pos += 2
+            pos += 1 + 3 * values[pos]
+            pos += 1 + values[pos]
+        elif tag == REC_DISCARD:
+            pos += 2 + values[pos + 1]
+        else:
+            raise ValueError(f"未知录像记录类型: {tag}")
+
+
+# ------------------ 录制 ------------------
+class ReplayRecorder:
+    """订阅对局决策事件，把决策编码进录像"""
+
+    def __init__(self, manager):
+        """
+        :param manager: 要录制的 GameManager
+        """
+        self.manager = manager
+        self.seed = None
+        self.names = []
+        self.records = bytearray()
+        self.active = False
+
+    def begin(self, seed=None):
+        """
+        开始录制一大局：用种子重置对局随机数，使录像可以从头复现
+        须在 setup_board / reset_for_new_game 之后、第一小局开始之前调用
+        :param seed: 新种子；None 时沿用 manager.seed（连续录多局时应每局传入新种子）
+        """
+        gm = self.manager
+        self.seed = gm.seed if seed is None else seed
+        gm.reseed(self.seed)
+        self.names = [p.name for p in gm.players]
+        self.records = bytearray()
+        if not self.active:
+            gm.events.subscribe(self._on_turn, TurnAction)
+            gm.events.subscribe(self._on_discards, DiscardsChosen)
+            self.active = True
+
+    def stop(self):
+        """停止录制"""
+        if self.active:
+            self.manager.events.unsubscribe(self._on_turn)
+            self.manager.events.unsubscribe(self._on_discards)
+            self.active = False
+
+    def replay(self):
+        """当前已录制内容对应的 Replay"""
+        gm = self.manager
+        return Replay(self.seed, self.names, gm.total_rounds, gm.deck.composition, self.records)
+
+    def save(self, path):
+        self.replay().save(path)
+
+    # ---------- 事件订阅 ----------
+    def _on_turn(self, event):
+        buf = self.records
+        result = event.result
+        if result["type"] == END_TURN:
+            buf.append(REC_END)
+            return
+        player = event.player
+        board = self.manager.board
+        buf.append(REC_PLAY)
+        write_varint(buf, _index_of(player.hand, result["card"]))
+        targets = result.get("targets") or []
+        write_varint(buf, len(targets))
+        for t in targets:
+            pidx, zone, idx = _locate(board, t)
+            write_varint(buf, pidx)
+            buf.append(zone)
+            write_varint(buf, idx)
+        enemies = result.get("enemies") or []
+        write_varint(buf, len(enemies))
+        for e in enemies:
+            write_varint(buf, e.index)
+
+    def _on_discards(self, event):
+        buf = self.records
+        hand = event.player.hand
+        buf.append(REC_DISCARD)
+        write_varint(buf, len(event.cards))
+        for c in event.cards:
+            write_varint(buf, _index_of(hand, c))
+
+
+def _index_of(zone, card):
+    """按对象身份查找卡牌位置"""
+    for i, c in enumerate(zone):
+        if c is card:
+            return i
+    raise ValueError(f"录制失败：{card.name} 不在指定牌区中")
+
+
+def _locate(board, card):
+    """目标牌的 (玩家索引, 牌区编码, 区内位置)"""
+    for p in board.players:
+        for zone_name in ("battlefield", "isolated", "hand"):
+            for i, c in enumerate(board.get_player_zone(p, zone_name)):
+                if c is card:
+                    return p.index, ZONE_CODES[zone_name], i
+    raise ValueError(f"录制失败：目标 {card.name} 不在任何牌区中")
+
+
+# ------------------ 回放 ------------------
+class ReplayController(Controller):
+    """按录像给出每个座位的决策"""
+
+    def __init__(self, replay):
+        self.values = read_varints(replay.records)
+        self.cursor = 0
+
+    def _next(self):
+        if self.cursor >= len(self.values):
+            raise ValueError("录像数据不完整：回合记录被截断")
+        value = self.values[self.cursor]
+        self.cursor += 1
+        return value
+
+    def choose_action(self, manager, player):
+        if self.cursor >= len(self.values):
+            raise ValueError("录像已结束，但对局仍在进行")
+        tag = self._next()
+        if tag == REC_END:
+            return {"type": END_TURN}
+        if tag != REC_PLAY:
+            raise ValueError(f"录像与对局不一致：第 {self.cursor - 1} 项应为回合记录，实际为 {tag}")
+        card = player.hand[self._next()]
+        targets = []
+        for _ in range(self._next()):
+            owner = manager.players[self._next()]
+            zone = manager.board.get_player_zone(owner, ZONE_NAMES[self._next()])
+            targets.append(zone[self._next()])
+        enemies = [manager.players[self._next()] for _ in range(self._next())]
+        return {"type": PLAY_CARD, "card": card, "targets": targets, "enemies": enemies}
+
+    def choose_discards(self, manager, player, count):
+        if self.cursor >= len(self.values) or self.values[self.cursor] != REC_DISCARD:
+            raise ValueError(f"录像与对局不一致：第 {self.cursor} 项应为弃牌记录")
+        self.cursor += 1
+        return [player.hand[self._next()] for _ in range(self._next())]
+
+
+class ReplayPlayer:
+    """逐回合回放录像，支持快速跳转"""
+
+    def __init__(self, replay, checkpoint_interval=32, verbose=False):
+        """
+        :param replay: Replay
+        :param checkpoint_interval: 每隔多少回合拍一次快照（跳转时从最近的快照开始重演）
+        :param verbose: 是否在控制台打印回放过程
+        """
+        self.replay = replay
+        self.controller = ReplayController(replay)
+        self.manager = replay.new_manager(self.controller, verbose=verbose)
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self.turn = 0
+        self.finished = False
+        self._checkpoint_turns = []
+        self._checkpoints = []
+        self.manager.start_small_round()
+        self._checkpoint()
+
+    def _checkpoint(self):
+        self._checkpoint_turns.append(self.turn)
+        self._checkpoints.append((self.manager.snapshot(), self.controller.cursor, self.finished))
+
+    def step(self):
+        """
+        回放一个回合（小局结束时自动结算并开始下一小局）
+        :return: 是否执行了回合（录像已放完时返回 False）
+        """
+        if self.finished:
+            return False
+        gm = self.manager
+        gm.play_turn(gm.request_action(gm.current_player))
+        self.turn += 1
+        if not gm.round_active:
+            gm.finish_small_round()
+            if gm.current_round >= gm.total_rounds or gm.is_match_over():
+                self.finished = True
+            else:
+                gm.start_small_round()
+        if self.turn % self.checkpoint_interval == 0 and self.turn > self._checkpoint_turns[-1]:
+            self._checkpoint()
+        return True
+
+    def run(self):
+        """无界面全速回放到结束，返回大局胜者名字列表"""
+        while self.step():
+            pass
+        return self.manager.show_winner()
+
+    def seek(self, turn):
+        """
+        跳转到第 turn 回合之后的局面（跳转过程中不发出事件）
+        :return: 实际到达的回合数（超过录像长度时停在结尾）
+        """
+        turn = max(0, turn)
+        if turn < self.turn or turn - self.turn > self.checkpoint_interval:
+            i = bisect.bisect_right(self._checkpoint_turns, turn) - 1
+            if self._checkpoint_turns[i] > self.turn or turn < self.turn:
+                state, cursor, finished = self._checkpoints[i]
+                state.restore(self.manager)
+                self.controller.cursor = cursor
+                self.finished = finished
+                self.turn = self._checkpoint_turns[i]
+        events = self.manager.events
+        enabled = events.enabled
+        events.enabled = False
+        try:
+            while self.turn < turn and self.step():
+                pass
+        finally:
+            events.enabled = enabled
+        return self.turn
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="萝卜昆特牌 无界面回放对局录像")
+    parser.add_argument("path", help="录像文件")
+    parser.add_argument("--turn", type=int, default=None, help="只回放到第 N 回合并打印当时的局面")
+    parser.add_argument("-v", "--verbose", action="store_true", help="打印回放过程")
+    args = parser.parse_args(argv)
+
+    player = ReplayPlayer(Replay.load(args.path), verbose=args.verbose)
+    if args.turn is None:
+        print(f"大局胜者: {player.run()}")
+    else:
+        player.seek(args.turn)
+        player.manager.board.show_board()
+    print(f"回合数: {player.turn}，小局战况: {player.manager.small_rounds_won}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+# game/simulator.py
+"""
+蒙特卡洛对局模拟器：
+
+在多进程（ProcessPoolExecutor）中批量运行完整的无界面对局，每个任务块使用独立种子的随机数，
+最后把各进程的统计结果归并为：各座位胜率、每种牌的出牌次数、每种牌的平均得分贡献、小局回合数等。
+
+命令行用法：
+    python -m game.simulator -n 100000 -p 3 --rounds 3 --workers 8
+    python -m game.simulator -n 10000000 -p 4 --vectorized   # numpy 向量化引擎（见 game/batch.py）
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .controller import PLAY_CARD, RandomController
+from .game_manager import GameManager
+from .player import Player
+
+
+class SimulationResult:
+    """模拟统计结果（可跨进程归并）"""
+
+    def __init__(self, num_players):
+        self.num_players = num_players
+        self.games = 0
+        self.small_rounds = 0
+        self.turns = 0
+        # 座位胜场（平局时按胜者人数平分）
+        self.seat_wins = [0.0] * num_players
+        # 牌号 -> 出牌次数 / 结算时累计点数 / 结算时在场张数
+        self.card_plays = {}
+        self.card_points = {}
+        self.card_scored = {}
+        # 小局回合数分布：回合数 -> 小局数
+        self.round_length_hist = {}
+
+    def merge(self, other):
+        """把另一个结果累加到自身，返回 self"""
+        self.games += other.games
+        self.small_rounds += other.small_rounds
+        self.turns += other.turns
+        for i, w in enumerate(other.seat_wins):
+            self.seat_wins[i] += w
+        for target, source in ((self.card_plays, other.card_plays),
+                               (self.card_points, other.card_points),
+                               (self.card_scored, other.card_scored),
+                               (self.round_length_hist, other.round_length_hist)):
+            for k, v in source.items():
+                target[k] = target.get(k, 0) + v
+        return self
+
+    @property
+    def win_rates(self):
+        """各座位胜率"""
+        return [w / self.games if self.games else 0.0 for w in self.seat_wins]
+
+    @property
+    def avg_card_score(self):
+        """每种牌在小局结算时的平均点数（即对玩家分数的平均贡献）"""
+        return {n: self.card_points[n] / self.card_scored[n] for n in sorted(self.card_scored)}
+
+    @property
+    def avg_round_length(self):
+        """平均每小局的行动次数（出牌 + 结束回合）"""
+        return self.turns / self.small_rounds if self.small_rounds else 0.0
+
+    @property
+    def avg_rounds_per_game(self):
+        """平均每大局进行的小局数"""
+        return self.small_rounds / self.games if self.games else 0.0
+
+    def summary(self):
+        """汇总为可直接打印 / 序列化的字典"""
+        return {
+            "games": self.games,
+            "num_players": self.num_players,
+            "win_rates": self.win_rates,
+            "card_plays": dict(sorted(self.card_plays.items())),
+            "avg_card_score": self.avg_card_score,
+            "avg_round_length": self.avg_round_length,
+            "avg_rounds_per_game": self.avg_rounds_per_game,
+            "round_length_hist": dict(sorted(self.round_length_hist.items())),
+        }
+
+
+def _run_chunk(args):
+    """工作进程：用给定种子连续跑 n_games 局，返回 SimulationResult"""
+    n_games, num_players, total_rounds, chunk_seed, deck_composition = args
+    rng = random.Random(chunk_seed)
+
+    result = SimulationResult(num_players)
+    # 控制器不自带随机数，使用每局 GameManager.policy_rng，单局可由其种子完整复现
+    controller = RandomController()
+    for _ in range(n_games):
+        players = [Player(f"玩家{i + 1}", i) for i in range(num_players)]
+        gm = GameManager(players, total_rounds=total_rounds,
+                         controllers={i: controller for i in range(num_players)},
+                         verbose=False, seed=rng.getrandbits(64), deck_composition=deck_composition)
+        gm.setup_board()
+        while gm.current_round < gm.total_rounds and not gm.is_match_over():
+            gm.start_small_round()
+            turns = 0
+            while not gm.is_round_over():
+                action = gm.request_action(gm.current_player)
+                if action["type"] == PLAY_CARD:
+                    number = int(action["card"].name)
+                    result.card_plays[number] = result.card_plays.get(number, 0) + 1
+                gm.play_turn(action)
+                turns += 1
+            # 结算前记录每张在场牌的点数贡献
+            for p in players:
+                for card in p.battlefield_cards + p.isolated_cards:
+                    number = int(card.name)
+                    result.card_points[number] = result.card_points.get(number, 0) + card.points
+                    result.card_scored[number] = result.card_scored.get(number, 0) + 1
+            gm.finish_small_round()
+            result.small_rounds += 1
+            result.turns += turns
+            result.round_length_hist[turns] = result.round_length_hist.get(turns, 0) + 1
+
+        winners = gm.show_winner()
+        share = 1.0 / len(winners)
+        for p in players:
+            if p.name in winners:
+                result.seat_wins[p.index] += share
+        result.games += 1
+    return result
+
+
+def simulate(n_games, num_players=2, total_rounds=3, workers=None, seed=None, chunk_size=1000,
+             deck_composition=None):
+    """
+    多进程运行 n_games 局随机策略对局并归并统计
+    :param n_games: 总局数
+    :param num_players: 玩家人数（2/3/4）
+    :param total_rounds: 每大局最多小局数
+    :param workers: 进程数，默认 os.cpu_count()；为 1 时在当前进程内运行
+    :param seed: 主种子，相同种子与分块得到相同结果；None 时随机
+    :param chunk_size: 每个任务块的局数（块越大调度开销越小）
+    :param deck_composition: 牌堆构成 {牌号: 张数}，用于平衡性调整，默认每种牌相同张数
+    :return: SimulationResult
+    """
+    if num_players not in (2, 3, 4):
+        raise ValueError(f"玩家人数必须为 2/3/4，传入 {num_players}")
+    master = random.Random(seed)
+    chunks = []
+    remaining = n_games
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        chunks.append((size, num_players, total_rounds, master.getrandbits(64), deck_composition))
+        remaining -= size
+
+    total = SimulationResult(num_players)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(chunks) == 1:
+        for c in chunks:
+            total.merge(_run_chunk(c))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_run_chunk, chunks):
+            total.merge(part)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="萝卜昆特牌 蒙特卡洛对局模拟")
+    parser.add_argument("-n", "--games", type=int, default=10000, help="模拟局数")
+    parser.add_argument("-p", "--players", type=int, default=2, help="玩家人数 2/3/4")
+    parser.add_argument("--rounds", type=int, default=3, help="每大局最多小局数")
+    parser.add_argument("--workers", type=int, default=None, help="进程数（默认 CPU 核数）")
+    parser.add_argument("--seed", type=int, default=None, help="随机种子")
+    parser.add_argument("--chunk", type=int, default=1000, help="每个任务块的局数")
+    parser.add_argument("--vectorized", action="store_true", help="使用 numpy 向量化批量引擎（近似规则，速度更快）")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if args.vectorized:
+        from .batch import simulate_batch
+        result = simulate_batch(args.games, args.players, args.rounds, args.seed)
+    else:
+        result = simulate(args.games, args.players, args.rounds, args.workers, args.seed, args.chunk)
+    elapsed = time.perf_counter() - start
+    summary = result.summary()
+
+    print(f"共 {summary['games']} 局，用时 {elapsed:.2f}s（{summary['games'] / elapsed:.0f} 局/秒）")
+    print("座位胜率: " + ", ".join(f"玩家{i + 1} {r:.3f}" for i, r in enumerate(summary["win_rates"])))
+    print(f"平均小局数: {summary['avg_rounds_per_game']:.2f}，平均每小局行动数: {summary['avg_round_length']:.2f}")
+    print("牌号  出牌次数  平均得分贡献")
+    for number, plays in summary["card_plays"].items():
+        avg = summary["avg_card_score"].get(number, 0.0)
+        print(f"{number:>4}  {plays:>8}  {avg:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,9 @@
 """
 
 from abc import ABC, abstractmethod
-import random
+
+from .events import (PointsChanged, ScoreChanged, CardDrawn, CardDiscarded, CardDestroyed,
+                     CardStolen, DiceRolled, Notice, DiscardsChosen)
 
 # -------------------- 技能基类 --------------------
 class Skill(ABC):
@@ -68,6 +70,7 @@ class Skill(ABC):
 
 
 # -------------------- 技能实现 --------------------
+# 技能只发出事件（action.events.emit），日志文字由订阅者（UI 日志面板 / 控制台）按需生成
 
 class Skill_1(Skill):
     """本牌上场时，根据己方场上牌数给自己加分"""
@@ -76,12 +79,10 @@ class Skill_1(Skill):
 
     def apply(self, action):
         cards_on_board = action.board.get_player_zone(action.owner, "battlefield")
-        action.self_card.points += len(cards_on_board)-1
-        msg = f"[{self.name}] {action.self_card.name} 点数增加到 {action.self_card.points}"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        card = action.self_card
+        old = card.points
+        card.add_points(len(cards_on_board)-1)
+        action.events.emit(PointsChanged, self.name, action.owner, card, old, card.points)
 
 
 class Skill_2(Skill):
@@ -92,10 +93,10 @@ class Skill_2(Skill):
     def apply(self, action):
         cards_on_board = action.board.get_player_zone(action.owner, "battlefield")
         if len(cards_on_board) == 1 and cards_on_board[0] == action.self_card:
-            action.self_card.points += 4
-            msg = f"[{self.name}] {action.self_card.name} 点数增加到 {action.self_card.points}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            card = action.self_card
+            old = card.points
+            card.add_points(4)
+            action.events.emit(PointsChanged, self.name, action.owner, card, old, card.points)
 
 
 class Skill_3(Skill):
@@ -107,9 +108,7 @@ class Skill_3(Skill):
         # 首先获取目标牌所在的玩家区域
         targets = self.validate_targets(action)
         if not targets:
-            msg = f"[{self.name}] 错误：没有选择目标卡牌"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "错误：没有选择目标卡牌")
             return
 
         target_card = targets[0]
@@ -123,18 +122,13 @@ class Skill_3(Skill):
                 break
 
         if not target_player:
-            msg = f"[{self.name}] 错误：找不到目标卡牌所属的玩家"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "错误：找不到目标卡牌所属的玩家")
             return
-        
+
         # 执行援助效果
-        target_card.points += 2
-        msg = f"[{self.name}] {target_player.name}的{target_card.name}被加2点，现在{target_card.points}点"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        old = target_card.points
+        target_card.add_points(2)
+        action.events.emit(PointsChanged, self.name, target_player, target_card, old, target_card.points)
 
 
 class Skill_4(Skill):
@@ -146,9 +140,7 @@ class Skill_4(Skill):
     def apply(self, action):
         if getattr(action.owner, "prev_round_won", False):
             action.owner.score += self.points
-            msg = f"[{self.name}] {action.owner.name} 得分 +{self.points}，总分 {action.owner.score}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(ScoreChanged, self.name, action.owner, self.points, action.owner.score)
 
 
 class Skill_5(Skill):
@@ -159,9 +151,7 @@ class Skill_5(Skill):
     def apply(self, action):
         if not getattr(action.owner, "prev_round_won", False):
             action.owner.score += 3
-            msg = f"[{self.name}] {action.owner.name} 上一回合失败，获得安慰奖 +3，总分 {action.owner.score}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(ScoreChanged, self.name, action.owner, 3, action.owner.score)
 
 
 class Skill_6(Skill):
@@ -175,13 +165,7 @@ class Skill_6(Skill):
         new_card = action.manager.draw_card_for_player(action.owner)
         if new_card:
             action.owner.hand.append(new_card)
-            msg = f"[{self.name}] {action.owner.name} 抽到 {new_card.name}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
-        else:
-            msg = f"[{self.name}] {action.owner.name} 没有抽到牌"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+        action.events.emit(CardDrawn, self.name, action.owner, new_card)
 
 
 class Skill_7(Skill):
@@ -195,11 +179,9 @@ class Skill_7(Skill):
             zone = action.board.get_player_zone(player, "battlefield")
             if target_card in zone:
                 zone.remove(target_card)
-                msg = f"[{self.name}] 消灭了 {player.name} 的 {target_card.name}"
-                if getattr(action, 'ui', None):
-                    action.ui.add_log(msg)
-                else:
-                    print(msg)
+                if getattr(action, 'manager', None):
+                    action.manager.discard_cards([target_card])
+                action.events.emit(CardDestroyed, self.name, player, target_card)
                 break
 
 
@@ -212,10 +194,10 @@ class Skill_8(Skill):
         cards_on_board = action.board.get_player_zone(action.owner, "battlefield")
         count_8 = sum(1 for c in cards_on_board if c.name == "8" and c != action.self_card)
         if count_8 > 0:
-            action.self_card.points += 3 * count_8
-            msg = f"[{self.name}] {action.self_card.name} 技能触发，加点后 {action.self_card.points}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            card = action.self_card
+            old = card.points
+            card.add_points(3 * count_8)
+            action.events.emit(PointsChanged, self.name, action.owner, card, old, card.points)
 
 
 class Skill_9(Skill):
@@ -232,52 +214,31 @@ class Skill_9(Skill):
         # >>> CHANGED: 使用 validate_enemies 取出目标玩家
         target_player = self.validate_enemies(action)[0]
 
-        owner_point = random.randint(1, 6)
-        target_point = random.randint(1, 6)
-        msg = f"[{self.name}] 拼点 {action.owner.name} 掷出 {owner_point} vs {target_player.name} 掷出 {target_point}"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        owner_point = action.rng.randint(1, 6)
+        target_point = action.rng.randint(1, 6)
+        action.events.emit(DiceRolled, self.name, action.owner, owner_point, target_player, target_point)
 
-        if owner_point > target_point:
-            # 出牌者获胜 → 出牌者摸牌，目标弃牌
-            if not getattr(action, 'manager', None):
-                raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌，请在创建 PlayAction 时传入 game manager")
-            new_card = action.manager.draw_card_for_player(action.owner)
-            action.owner.hand.append(new_card)
-            msg = f"[{self.name}] {action.owner.name} 获胜，抽到 {new_card.name}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
-
-            if target_player.hand:
-                discarded = random.choice(target_player.hand)
-                target_player.hand.remove(discarded)
-                msg = f"[{self.name}] {target_player.name} 弃掉 {discarded.name}"
-                if getattr(action, 'ui', None): action.ui.add_log(msg)
-                else: print(msg)
-
-        elif owner_point < target_point:
-            # 目标获胜 → 目标摸牌，出牌者弃牌
-            if not getattr(action, 'manager', None):
-                raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌，请在创建 PlayAction 时传入 game manager")
-            new_card = action.manager.draw_card_for_player(target_player)
-            target_player.hand.append(new_card)
-            msg = f"[{self.name}] {target_player.name} 获胜，抽到 {new_card.name}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
-
-            if action.owner.hand:
-                discarded = random.choice(action.owner.hand)
-                action.owner.hand.remove(discarded)
-                msg = f"[{self.name}] {action.owner.name} 弃掉 {discarded.name}"
-                if getattr(action, 'ui', None): action.ui.add_log(msg)
-                else: print(msg)
+        if owner_point == target_point:
+            action.events.emit(Notice, self.name, "平局，无事发生")
+            return
 
+        # 胜者摸牌，败者弃牌
+        if owner_point > target_point:
+            winner, loser = action.owner, target_player
         else:
-            msg = f"[{self.name}] 平局，无事发生"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            winner, loser = target_player, action.owner
+        if not getattr(action, 'manager', None):
+            raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌，请在创建 PlayAction 时传入 game manager")
+        new_card = action.manager.draw_card_for_player(winner)
+        if new_card:
+            winner.hand.append(new_card)
+        action.events.emit(CardDrawn, self.name, winner, new_card)
+
+        if loser.hand:
+            discarded = action.rng.choice(loser.hand)
+            loser.hand.remove(discarded)
+            action.manager.discard_cards([discarded])
+            action.events.emit(CardDiscarded, self.name, loser, discarded)
 
 
 class Skill_10(Skill):
@@ -286,13 +247,12 @@ class Skill_10(Skill):
         super().__init__("随机加点", targets_required=0, target_side="self")
 
     def apply(self, action):
-        rand_points = random.randint(1, 6)
-        action.self_card.points += rand_points
-        msg = f"[{self.name}] {action.self_card.name} 随机加 {rand_points} 点，现在 {action.self_card.points}"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        rand_points = action.rng.randint(1, 6)
+        card = action.self_card
+        old = card.points
+        card.add_points(rand_points)
+        action.events.emit(DiceRolled, self.name, action.owner, rand_points)
+        action.events.emit(PointsChanged, self.name, action.owner, card, old, card.points)
 
 class Skill_11(Skill):
     """
@@ -305,29 +265,25 @@ class Skill_11(Skill):
         if not getattr(action, 'manager', None):
             raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌，请在创建 PlayAction 时传入 game manager")
 
-        hand_size = len(action.owner.hand)
+        owner = action.owner
+        hand_size = len(owner.hand)
         if hand_size == 0:
-            msg = f"[{self.name}] {action.owner.name} 没有手牌，无法触发效果"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "{} 没有手牌，无法触发效果", owner.name)
             return
 
         # 弃掉所有手牌
-        discarded_cards = list(action.owner.hand)  # 复制以便打印
-        action.owner.hand.clear()
+        discarded_cards = list(owner.hand)
+        owner.hand.clear()
+        action.manager.discard_cards(discarded_cards)
+        for c in discarded_cards:
+            action.events.emit(CardDiscarded, self.name, owner, c)
 
         # 抽取等量新牌
-        new_cards = []
         for _ in range(hand_size):
-            new_card = action.manager.draw_card_for_player(action.owner)
+            new_card = action.manager.draw_card_for_player(owner)
             if new_card:
-                action.owner.hand.append(new_card)
-                new_cards.append(new_card)
-
-        msg = (f"[{self.name}] {action.owner.name} 弃掉了 {', '.join(c.name for c in discarded_cards)}，"
-               f"并抽取了 {len(new_cards)} 张新牌：{', '.join(c.name for c in new_cards)}")
-        if getattr(action, 'ui', None): action.ui.add_log(msg)
-        else: print(msg)
+                owner.hand.append(new_card)
+                action.events.emit(CardDrawn, self.name, owner, new_card)
 
 class Skill_16(Skill):
     """抽取两张牌到手牌区"""
@@ -338,22 +294,15 @@ class Skill_16(Skill):
         if not getattr(action, 'manager', None):
             raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌，请在创建 PlayAction 时传入 game manager")
 
-        new_cards = []
+        drew = False
         for _ in range(2):  # 抽两张牌
             card = action.manager.draw_card_for_player(action.owner)
             if card:
                 action.owner.hand.append(card)
-                new_cards.append(card)
-
-        if new_cards:
-            msg = f"[{self.name}] {action.owner.name} 抽到 {', '.join(c.name for c in new_cards)}"
-        else:
-            msg = f"[{self.name}] {action.owner.name} 没有抽到牌"
-
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+                action.events.emit(CardDrawn, self.name, action.owner, card)
+                drew = True
+        if not drew:
+            action.events.emit(CardDrawn, self.name, action.owner, None)
 
 class Skill_21(Skill):
     """选择一名玩家的战场牌，使其点数翻倍"""
@@ -364,9 +313,7 @@ class Skill_21(Skill):
         # 获取目标牌
         targets = self.validate_targets(action)
         if not targets:
-            msg = f"[{self.name}] 没有选择目标卡牌"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "没有选择目标卡牌")
             return
 
         target_card = targets[0]
@@ -379,17 +326,13 @@ class Skill_21(Skill):
                 break
 
         if not target_player:
-            msg = f"[{self.name}] 找不到目标卡牌所属玩家"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "找不到目标卡牌所属玩家")
             return
 
         # 执行翻倍效果
         old_points = target_card.points
-        target_card.points *= 2
-        msg = f"[{self.name}] {target_player.name} 的 {target_card.name} 点数 {old_points} -> {target_card.points}"
-        if getattr(action, 'ui', None): action.ui.add_log(msg)
-        else: print(msg)
+        target_card.add_points(target_card.points)
+        action.events.emit(PointsChanged, self.name, target_player, target_card, old_points, target_card.points)
 
 class Skill_23(Skill):
     """出牌时，点数增加玩家手牌数，但最多增加5点"""
@@ -400,12 +343,10 @@ class Skill_23(Skill):
         owner = action.owner
         hand_count = len(owner.hand)
         increment = min(hand_count, 5)  # 限制最多加5点
-        action.self_card.points += increment
-        msg = f"[{self.name}] {action.self_card.name} 出牌触发，手牌数 {hand_count}，点数增加 {increment} 到 {action.self_card.points}"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        card = action.self_card
+        old = card.points
+        card.add_points(increment)
+        action.events.emit(PointsChanged, self.name, owner, card, old, card.points)
 
 class Skill_26(Skill):
     """出牌时，选择一名敌人玩家，随机抽取一张手牌加入自己手牌区"""
@@ -417,23 +358,14 @@ class Skill_26(Skill):
         target_player = self.validate_enemies(action)[0]
 
         if not target_player.hand:
-            msg = f"[{self.name}] {target_player.name} 没有手牌可抽"
-            if getattr(action, 'ui', None): 
-                action.ui.add_log(msg)
-            else: 
-                print(msg)
+            action.events.emit(Notice, self.name, "{} 没有手牌可抽", target_player.name)
             return
 
         # 随机选择一张手牌
-        stolen_card = random.choice(target_player.hand)
+        stolen_card = action.rng.choice(target_player.hand)
         target_player.hand.remove(stolen_card)
         action.owner.hand.append(stolen_card)
-
-        msg = f"[{self.name}] {action.owner.name} 从 {target_player.name} 手牌中抽取 {stolen_card.name}"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+        action.events.emit(CardStolen, self.name, action.owner, target_player, stolen_card)
 
 class Skill_27(Skill):
     """敌人战场牌数多于自己时，选择任意玩家的战场牌+3"""
@@ -451,20 +383,21 @@ class Skill_27(Skill):
             # 验证玩家选择的目标牌
             targets = self.validate_targets(action)
             if not targets:
-                msg = f"[{self.name}] 错误：没有选择目标卡牌"
-                if getattr(action, 'ui', None): action.ui.add_log(msg)
-                else: print(msg)
+                action.events.emit(Notice, self.name, "错误：没有选择目标卡牌")
                 return
 
             target_card = targets[0]
-            target_card.points += 3
-            msg = f"[{self.name}] {target_card.name} 被加 3 点，当前点数 {target_card.points}"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            target_player = action.owner
+            for player in action.board.players:
+                if target_card in action.board.get_player_zone(player, "battlefield"):
+                    target_player = player
+                    break
+            old = target_card.points
+            target_card.add_points(3)
+            action.events.emit(PointsChanged, self.name, target_player, target_card, old, target_card.points)
         else:
-            msg = f"[{self.name}] 条件不满足，{enemy.name} 战场牌数 ({enemy_board_count}) ≤ {action.owner.name} 战场牌数 ({player_board_count})"
-            if getattr(action, 'ui', None): action.ui.add_log(msg)
-            else: print(msg)
+            action.events.emit(Notice, self.name, "条件不满足，{} 战场牌数 ({}) ≤ {} 战场牌数 ({})",
+                               enemy.name, enemy_board_count, action.owner.name, player_board_count)
 
 class Skill_28(Skill):
     """玩家打出这张牌，先抽两张牌到手牌，再弃掉自己选择的两张牌"""
@@ -477,48 +410,44 @@ class Skill_28(Skill):
         if not getattr(action, 'manager', None):
             raise RuntimeError(f"{self.name} 需要 PlayAction.manager 来抽牌")
 
-        new_cards = []
+        owner = action.owner
+        drew = False
         for _ in range(2):
-            new_card = action.manager.draw_card_for_player(action.owner)
+            new_card = action.manager.draw_card_for_player(owner)
             if new_card:
-                action.owner.hand.append(new_card)
-                new_cards.append(new_card)
-
-        if new_cards:
-            msg = f"[{self.name}] {action.owner.name} 抽到 {[c.name for c in new_cards]}"
-        else:
-            msg = f"[{self.name}] 未能抽到新牌"
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+                owner.hand.append(new_card)
+                action.events.emit(CardDrawn, self.name, owner, new_card)
+                drew = True
+        if not drew:
+            action.events.emit(CardDrawn, self.name, owner, None)
 
         # --- 第二步：弃掉玩家选择的两张牌（在抽牌后进行选择） ---
         discard_cards = []
         ui = getattr(action, 'ui', None)
-        owner = action.owner
+        controller = getattr(action, 'controller', None)
+        # 由控制器（AI/脚本）驱动的座位直接询问控制器
+        if controller is not None:
+            discard_cards = controller.choose_discards(action.manager, owner, 2)
         # 如果有 UI，弹出专用选择器让玩家从当前手牌中选择两张弃掉
-        if ui and hasattr(ui, 'select_cards_from_hand'):
+        elif ui and hasattr(ui, 'select_cards_from_hand'):
             prompt = "请选择要弃掉的两张手牌（再次点击可取消选择），然后点击确认"
             try:
                 discard_cards = ui.select_cards_from_hand(owner, 2, prompt)
             except Exception as e:
                 # 回退到随机选择
                 discard_cards = []
+        # 记录玩家的选择（录像用）；空列表表示下面由规则随机弃置
+        action.events.emit(DiscardsChosen, owner, list(discard_cards))
         # 无 UI 或选择失败时，随机弃置（尽力而为）
         if not discard_cards:
             take_n = min(2, len(owner.hand))
-            import random as _r
-            discard_cards = _r.sample(owner.hand, take_n) if take_n > 0 else []
+            discard_cards = action.rng.sample(owner.hand, take_n) if take_n > 0 else []
 
         for c in discard_cards:
             if c in owner.hand:
                 owner.hand.remove(c)
-                msg = f"[{self.name}] {owner.name} 弃掉 {c.name}"
-                if ui:
-                    ui.add_log(msg)
-                else:
-                    print(msg)
+                action.manager.discard_cards([c])
+                action.events.emit(CardDiscarded, self.name, owner, c)
 
 class Skill_29(Skill):
     """选择一名敌人，敌方战场比自己多的牌数 -> 本牌点数+1/张"""
@@ -533,15 +462,13 @@ class Skill_29(Skill):
         diff = target_board_count - owner_board_count
 
         if diff > 0:
-            action.self_card.points += diff
-            msg = f"[{self.name}] {action.self_card.name} 点数增加 {diff}，现在 {action.self_card.points}"
+            card = action.self_card
+            old = card.points
+            card.add_points(diff)
+            action.events.emit(PointsChanged, self.name, owner, card, old, card.points)
         else:
-            msg = f"[{self.name}] 技能无法生效：{target_player.name} 战场牌数不多于 {owner.name}"
-
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
+            action.events.emit(Notice, self.name, "技能无法生效：{} 战场牌数不多于 {}",
+                               target_player.name, owner.name)
 
 class Skill_35(Skill):
     """打出这张牌放入孤立区，同时玩家获得一张同名牌"""
@@ -561,15 +488,6 @@ class Skill_35(Skill):
             owner.isolated_cards.append(card)
 
         # 玩家再获得一张同名牌
-        try:
-            owner.hand.append(card)
-            msg = f"[{self.name}] {card.name} 被放入孤立区，同时 {owner.name} 获得一张同名牌 {card.name}"
-        except Exception:
-            # 如果实例化失败，则仅提示放入孤立区
-            msg = f"[{self.name}] {card.name} 被放入孤立区，但无法生成新牌"
-
-        if getattr(action, 'ui', None):
-            action.ui.add_log(msg)
-        else:
-            print(msg)
-
+        owner.hand.append(card)
+        action.events.emit(Notice, self.name, "{} 被放入孤立区，同时 {} 获得一张同名牌 {}",
+                           card.name, owner.name, card.name)
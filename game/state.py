@@ -0,0 +1,68 @@
+# game/state.py
+"""
+对局快照：GameState
+
+记录恢复一局所需的全部可变状态（各玩家三个牌区的内容、卡牌当前点数、分数/胜局、
+小局进度、回合指针、牌堆与随机数状态（规则随机数与控制器决策随机数）），用于搜索 AI 的反复推演、悔棋与预览。
+
+快照只保存对卡牌对象的引用与点数，不复制卡牌本身，因此拍快照 / 恢复都只需几微秒；
+恢复时原地改写玩家的牌区列表，外部持有的 Player / Card 引用保持有效。
+"""
+
+
+class GameState:
+    __slots__ = ("players", "card_points", "small_rounds_won", "current_round",
+                 "current_player_index", "starting_player_index", "players_done",
+                 "round_active", "rng_state", "policy_rng_state", "deck_state")
+
+    @classmethod
+    def capture(cls, manager):
+        """
+        为 GameManager 拍快照
+        :param manager: GameManager
+        :return: GameState
+        """
+        state = cls.__new__(cls)
+        players = []
+        card_points = {}
+        for p in manager.players:
+            hand = tuple(p.hand)
+            battlefield = tuple(p.battlefield_cards)
+            isolated = tuple(p.isolated_cards)
+            for zone in (hand, battlefield, isolated):
+                for c in zone:
+                    card_points[c] = c._points  # 即 c.points，搜索时每次迭代都要拍快照，省去属性调用
+            players.append((p, hand, battlefield, isolated, p.score, p.wins, p.prev_round_won))
+        state.players = tuple(players)
+        state.card_points = card_points
+        state.small_rounds_won = dict(manager.small_rounds_won)
+        state.current_round = manager.current_round
+        state.current_player_index = manager.current_player_index
+        state.starting_player_index = manager.starting_player_index
+        state.players_done = tuple(manager.players_done)
+        state.round_active = manager.round_active
+        state.rng_state = manager.rng.getstate()
+        state.policy_rng_state = manager.policy_rng.getstate()
+        state.deck_state = manager.deck.get_state()
+        return state
+
+    def restore(self, manager):
+        """把快照写回 GameManager（原地修改玩家与卡牌对象）"""
+        for p, hand, battlefield, isolated, score, wins, prev_round_won in self.players:
+            p.hand[:] = hand
+            p.battlefield_cards[:] = battlefield
+            p.isolated_cards[:] = isolated
+            p.score = score
+            p.wins = wins
+            p.prev_round_won = prev_round_won
+        for card, points in self.card_points.items():
+            card.set_points(points)
+        manager.small_rounds_won = dict(self.small_rounds_won)
+        manager.current_round = self.current_round
+        manager.current_player_index = self.current_player_index
+        manager.starting_player_index = self.starting_player_index
+        manager.players_done = list(self.players_done)
+        manager.round_active = self.round_active
+        manager.rng.setstate(self.rng_state)
+        manager.policy_rng.setstate(self.policy_rng_state)
+        manager.deck.set_state(self.deck_state)
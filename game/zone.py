@@ -0,0 +1,203 @@
+# game/zone.py
+"""
+牌区：带点数合计与变更通知的卡牌列表
+
+Zone 是 list 的子类，用法与原来的列表完全相同（下标、切片、遍历、in、len 都不变），
+但所有增删操作都会同步维护区域内的点数合计 total；卡牌记录自己所在的牌区，
+点数通过 Card.add_points / set_points（或直接给 points 赋值）修改时把差值加到这些牌区上。
+这样查询分数只需读取合计，不必每次遍历牌区求和。
+
+每次变化（牌进出、区内牌点数变化、重新排序、touch）都会给牌区换一个新的版本号 version，
+版本号全局唯一递增，界面只需比较版本号即可知道牌区是否变过，不必逐张比较；
+需要知道具体变化的一方可以 subscribe 监听，回调收到 (牌区, 操作, 卡牌)，操作为：
+  "add" / "remove"  某张牌进入 / 离开牌区（clear 与切片赋值逐张通知）
+  "points"          区内某张牌点数变化
+  "update"          牌区顺序变化或被 touch（卡牌为 None 或被 touch 的牌）
+
+同一张牌可以同时在多个牌区中（例如孤立放置后又回到手里的牌），也可以在同一牌区中出现多次，
+每出现一次就计入一次。
+"""
+
+import copy
+from itertools import count
+
+_WHOLE = slice(None)
+
+# 全局版本号来源：不同牌区（包括新对局新建的牌区）的版本号也不会重复
+_VERSIONS = count(1)
+
+
+class Zone(list):
+    """带点数合计与变更通知的牌区列表"""
+
+    __slots__ = ("name", "total", "version", "listeners")
+
+    def __init__(self, cards=(), name=None):
+        """
+        :param cards: 初始卡牌
+        :param name: 牌区名（"hand" / "battlefield" / "isolated"），便于监听者区分
+        """
+        list.__init__(self)
+        self.name = name
+        self.total = 0
+        self.version = next(_VERSIONS)
+        self.listeners = ()
+        self.extend(cards)
+
+    # ------- 变更通知 -------
+    def subscribe(self, listener):
+        """注册监听：listener(zone, op, card)"""
+        if listener not in self.listeners:
+            self.listeners = self.listeners + (listener,)
+
+    def unsubscribe(self, listener):
+        self.listeners = tuple(l for l in self.listeners if l != listener)
+
+    def _notify(self, op, card):
+        for listener in self.listeners:
+            listener(self, op, card)
+
+    def touch(self, card=None):
+        """标记牌区已变化（例如区内某张牌的显示状态变了），只换版本号并通知 "update" """
+        self.version = next(_VERSIONS)
+        if self.listeners:
+            self._notify("update", card)
+
+    def _points_changed(self, card, delta):
+        """区内 card 的点数变化了 delta（由 Card.add_points 调用）"""
+        self.total += delta
+        self.version = next(_VERSIONS)
+        if self.listeners:
+            self._notify("points", card)
+
+    # ------- 卡牌进出牌区 -------
+    # card.zones 通常只记一个牌区（直接保存 Zone），同时在多个牌区时才用列表
+    # 热路径上直接读 card._points（points 属性只是它的包装）
+    def _enter(self, card):
+        self.total += card._points
+        self.version = next(_VERSIONS)
+        zones = card.zones
+        if zones is None:
+            card.zones = self
+        elif type(zones) is list:
+            zones.append(self)
+        else:
+            card.zones = [zones, self]
+        if self.listeners:
+            self._notify("add", card)
+
+    def _leave(self, card):
+        self.total -= card._points
+        self.version = next(_VERSIONS)
+        zones = card.zones
+        if zones is self:
+            card.zones = None
+        else:
+            # 按身份移除（Zone 继承 list 的 ==，内容相同的不同牌区会被误判为相等）
+            for i, zone in enumerate(zones):
+                if zone is self:
+                    del zones[i]
+                    break
+            if len(zones) == 1:
+                card.zones = zones[0]
+        if self.listeners:
+            self._notify("remove", card)
+
+    def append(self, card):
+        list.append(self, card)
+        if card.zones is None and not self.listeners:
+            # 最常见的情况（牌不在其他牌区、无人监听）内联处理
+            self.total += card._points
+            self.version = next(_VERSIONS)
+            card.zones = self
+        else:
+            self._enter(card)
+
+    def insert(self, index, card):
+        list.insert(self, index, card)
+        self._enter(card)
+
+    def extend(self, cards):
+        cards = list(cards)
+        list.extend(self, cards)
+        for card in cards:
+            self._enter(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def remove(self, card):
+        list.remove(self, card)
+        if card.zones is self and not self.listeners:
+            self.total -= card._points
+            self.version = next(_VERSIONS)
+            card.zones = None
+        else:
+            self._leave(card)
+
+    def pop(self, index=-1):
+        card = list.pop(self, index)
+        self._leave(card)
+        return card
+
+    def clear(self):
+        cards = list(self)
+        list.clear(self)
+        for card in cards:
+            self._leave(card)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            if index == _WHOLE and list.__eq__(self, value):
+                return  # 整体替换为相同内容（恢复快照时多数牌区如此）
+            removed = self[index]
+            list.__setitem__(self, index, value)
+            for card in removed:
+                self._leave(card)
+            for card in value:
+                self._enter(card)
+        else:
+            removed = self[index]
+            list.__setitem__(self, index, value)
+            self._leave(removed)
+            self._enter(value)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        list.__delitem__(self, index)
+        for card in removed:
+            self._leave(card)
+
+    def __imul__(self, n):
+        if n <= 0:
+            self.clear()
+        else:
+            self.extend(list(self) * (n - 1))
+        return self
+
+    # ------- 只改变顺序 -------
+    def sort(self, *, key=None, reverse=False):
+        list.sort(self, key=key, reverse=reverse)
+        self.touch()
+
+    def reverse(self):
+        list.reverse(self)
+        self.touch()
+
+    # ------- 拷贝与序列化 -------
+    def __copy__(self):
+        # 浅拷贝与切片一样得到普通列表：卡牌是共享的，不能再登记到另一个牌区上
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        # 深拷贝出的卡牌是新对象（牌区记录不随卡牌复制），逐张登记到新牌区；监听者不复制
+        zone = Zone(name=self.name)
+        memo[id(self)] = zone
+        zone.extend([copy.deepcopy(card, memo) for card in self])
+        return zone
+
+    def __reduce__(self):
+        # 只用于 pickle（多进程搜索）：卡牌在反序列化时是新对象，重建牌区时重新登记；监听者不随之序列化
+        return Zone, (list(self), self.name)
@@ -1,16 +1,98 @@
-import pygame
+import time
+
+_T0 = time.perf_counter()
+
+import argparse
+import random
 import sys
-from game.game_manager import GameManager
-from ui.PygameUI import PygameUI
+
+import pygame
+
+from ui.constants import COLOR_BG, LOG_FILE_BACKUPS, LOG_FILE_MAX_BYTES, WINDOW_HEIGHT, WINDOW_WIDTH
+
+_T_PYGAME = time.perf_counter()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="萝卜昆特牌")
+    parser.add_argument("--ai", default="", help="由 AI 控制的座位（从 1 开始，逗号分隔），例如 --ai 2,3")
+    parser.add_argument("--ai-time", type=float, default=1.0, help="AI 每步思考秒数")
+    parser.add_argument("--record", default=None, help="把对局录像写入该文件（每大局结束后写入，多局时保留最近一局）")
+    parser.add_argument("--replay", default=None, help="回放录像文件")
+    parser.add_argument("--replay-speed", type=float, default=1.0, help="回放速度倍数（回放中可用 ↑/↓ 调整）")
+    parser.add_argument("--profile", action="store_true", help="启动时打开性能面板（游戏中按 F3 切换）")
+    parser.add_argument("--log-file", default=None, help="把操作记录同时写入该文件（按大小轮转，保留完整记录）")
+    parser.add_argument("--startup-timing", action="store_true", help="打印启动各阶段耗时")
+    return parser.parse_args(argv)
+
+
+def print_startup_timing(timings):
+    """打印启动各阶段耗时（毫秒）"""
+    print("启动耗时:")
+    for name, sec in timings:
+        print(f"{sec * 1000:>9.1f} ms  {name}")
 
 
 def main():
+    args = parse_args()
     pygame.init()
 
-    # 创建 UI 和游戏管理器
-    ui = PygameUI()
+    # 先打开窗口并铺上底色，界面与对局模块在窗口出现之后再导入
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("萝卜昆特牌")
+    screen.fill(COLOR_BG)
+    pygame.display.flip()
+    t_window = time.perf_counter()
+
+    from game.game_manager import GameManager
+    from ui.PygameUI import PygameUI
+    t_modules = time.perf_counter()
+
+    # 创建 UI 和游戏管理器：图片与字体在后台加载，先画出第一帧再加载音乐
+    ui = PygameUI(defer_loading=True)
     gm = GameManager(players=[])
     ui.set_manager(gm)
+    if args.profile:
+        ui.profiler.toggle()
+    if args.log_file:
+        ui.logs.spill_to(args.log_file, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS)
+    t_ui = time.perf_counter()
+    ui.draw_game()
+    t_frame = time.perf_counter()
+    ui.load_music()
+    if args.startup_timing:
+        print_startup_timing([
+            ("import pygame", _T_PYGAME - _T0),
+            ("打开窗口", t_window - _T_PYGAME),
+            ("import 模块", t_modules - t_window),
+            ("界面初始化", ui.startup_timings["ui_init"]),
+            ("  其中占位字体", ui.startup_timings["fonts"]),
+            ("首帧", t_frame - t_ui),
+            ("到首帧合计", t_frame - _T0),
+            ("背景音乐", ui.startup_timings["music"]),
+        ])
+        seconds = ui.fonts.resolve_seconds
+        print("字体解析（后台）: " + ("尚未完成" if seconds is None else f"{seconds * 1000:.1f} ms"
+                                     + ("（命中缓存）" if ui.fonts.from_cache else "")))
+
+    # 回放录像：结束后停在结束界面，回到菜单后沿用该对局管理器正常开局
+    if args.replay:
+        from game.replay import Replay, ReplayPlayer
+        replay_player = ReplayPlayer(Replay.load(args.replay))
+        ui.show_game_over(ui.play_replay(replay_player, args.replay_speed))
+        gm = replay_player.manager
+        gm.controllers.clear()
+
+    recorder = None
+    if args.record:
+        from game.replay import ReplayRecorder
+        recorder = ReplayRecorder(gm)
+
+    # 人机对战：指定座位交给 MCTS AI
+    if args.ai:
+        from game.mcts import MCTSController
+        for seat in args.ai.split(","):
+            gm.set_controller(int(seat) - 1, MCTSController(iterations=10 ** 6, time_limit=args.ai_time))
     
     # 如果音乐加载成功，则开始播放
     if ui.music_loaded:
@@ -20,10 +102,8 @@ def main():
     while ui.running:
         # ---------------- 菜单逻辑 ----------------
         if ui.state == "menu":
-            # 仅在菜单态处理事件与绘制
+            # 仅在菜单态处理事件与绘制（空闲时阻塞等待输入）
             ui.handle_events()
-            ui.draw_game()
-            ui.clock.tick(30)
 
         # ---------------- 游戏逻辑 ----------------
         elif ui.state == "game":
@@ -32,6 +112,10 @@ def main():
                 pygame.mixer.music.set_volume(0.7)
             
             # 将事件消费与界面刷新交给 GameManager/UI 的内部等待循环，避免重复消费事件
+            # 每大局开始时用新种子开始录制
+            if recorder is not None and gm.current_round == 0:
+                recorder.begin(random.getrandbits(64))
+
             if gm.current_round < gm.total_rounds:
                 winners = gm.play_small_round(ui)
                 if winners:
@@ -39,13 +123,16 @@ def main():
 
                 # 检查是否有大局胜利者（例如先至2胜）
                 overall_winners = gm.show_winner()
-                if any(gm.small_rounds_won[p.name] >= 2 for p in gm.players):
+                if gm.is_match_over():
                     # 展示游戏结束界面
                     ui.show_game_over(overall_winners)
             else:
                 # 到达预设小局数上限时，直接根据当前比分展示结束界面
                 overall_winners = gm.show_winner()
                 ui.show_game_over(overall_winners)
+
+            if recorder is not None and ui.state == "game_over":
+                recorder.save(args.record)
         
         # ---------------- 结束界面逻辑 ----------------
         elif ui.state == "game_over":
@@ -54,9 +141,8 @@ def main():
                 pygame.mixer.music.set_volume(1.0)
                 
             ui.handle_events()
-            ui.draw_game()
-            ui.clock.tick(30)
 
+    ui.logs.close()
     pygame.quit()
     sys.exit()
 
@@ -10,7 +10,9 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # pygame 在导入时会尝试加载 numpy（surfarray）与 pkg_resources（pkgdata），两者都是可选的；
+    # 游戏界面不使用 numpy 向量化引擎（game/batch.py 只用于命令行模拟），排除后包体更小、启动更快
+    excludes=['numpy', 'pkg_resources'],
     noarchive=False,
     optimize=0,
 )
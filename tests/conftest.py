@@ -0,0 +1,24 @@
+import pytest
+
+from game.controller import RandomController
+from game.game_manager import GameManager
+from game.player import Player
+
+
+@pytest.fixture
+def make_manager():
+    """
+    工厂：创建已 setup_board 的静默 GameManager（玩家名 P0、P1 ...）
+      make_manager(num_players=2, seed=0, composition=None, random_seats=(), start=False)
+    random_seats 中的座位交给 RandomController；start 为 True 时开始第一小局
+    """
+    def make(num_players=2, seed=0, composition=None, random_seats=(), start=False):
+        players = [Player(f"P{i}", i) for i in range(num_players)]
+        gm = GameManager(players, verbose=False, seed=seed, deck_composition=composition,
+                         controllers={i: RandomController() for i in random_seats})
+        gm.setup_board()
+        if start:
+            gm.start_small_round()
+        return gm
+
+    return make
@@ -0,0 +1,155 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game import card_factory
+from game.batch import BatchGames
+from game.card_factory import create_card_by_number
+from game.controller import PLAY_CARD
+from game.player import Player
+from game.skill import Skill_35
+
+
+def test_skill_35_returns_the_played_card(monkeypatch):
+    # 另一张带“孤立后回手”技能的牌：回到手里的应是这张牌本身，而不是 19 号
+    monkeypatch.setitem(card_factory.card_data_map, 20,
+                        {"points": 2, "is_isolated": True, "skills": [Skill_35()]})
+    games = BatchGames(200, num_players=2, seed=0, composition={20: 1})
+    games.run()
+    assert games.card_plays[20] > 0
+    assert set(np.unique(games.hand_ids)) <= {0, 20}
+    assert set(np.unique(games.iso_ids)) <= {0, 20}
+
+
+# ---------------- 与逐局引擎（GameManager）对拍 ----------------
+# 局面：P0 手牌全是要打出的牌（无论随机选中哪个位置都打出同一种牌），两名玩家的战场为给定的 (牌号, 点数)
+
+def batch_play(number, hand_size, boards, n_games=400, seed=0):
+    """在 n_games 个相同的局面上让 P0 走一步，返回 (引擎, P0 打出了牌的对局索引)"""
+    games = BatchGames(n_games, num_players=2, seed=seed)
+    for ids, n in ((games.hand_ids, games.hand_n), (games.bf_ids, games.bf_n), (games.iso_ids, games.iso_n)):
+        ids[:] = 0
+        n[:] = 0
+    games.bf_pts[:] = 0
+    games.iso_pts[:] = 0
+    games.hand_ids[:, 0, :hand_size] = number
+    games.hand_n[:, 0] = hand_size
+    for p, cards in enumerate(boards):
+        for k, (num, pts) in enumerate(cards):
+            games.bf_ids[:, p, k] = num
+            games.bf_pts[:, p, k] = pts
+        games.bf_n[:, p] = len(cards)
+    games.score[:] = 0
+    games.done[:] = False
+    games.counters["current"] = 0
+    games.step()
+    played = np.flatnonzero(games.bf_n[:, 0] == len(boards[0]) + 1)
+    assert len(played) > 0
+    return games, played
+
+
+def single_play(make_manager, number, hand_size, boards, target=None, seed=0):
+    """在 GameManager 上摆出同一局面并让 P0 打出一张牌；target 为 (玩家, 战场位置)"""
+    gm = make_manager(2, seed=seed, start=True)
+    for p, cards in zip(gm.players, boards):
+        p.hand[:] = []
+        p.battlefield_cards[:] = []
+        for num, pts in cards:
+            card = create_card_by_number(num)
+            card.set_points(pts)
+            p.battlefield_cards.append(card)
+    owner = gm.players[0]
+    owner.hand[:] = [create_card_by_number(number) for _ in range(hand_size)]
+    gm.current_player_index = 0
+    targets = [gm.players[target[0]].battlefield_cards[target[1]]] if target else []
+    gm.play_turn({"type": PLAY_CARD, "card": owner.hand[0], "targets": targets, "enemies": [gm.players[1]]})
+    return gm
+
+
+def board_of(games, g, p):
+    n = games.bf_n[g, p]
+    return list(zip(games.bf_ids[g, p, :n].tolist(), games.bf_pts[g, p, :n].tolist()))
+
+
+def assert_same_result(games, played, gm):
+    expected = [[(c.number, c.points) for c in p.battlefield_cards] for p in gm.players]
+    scores = [p.calculate_score() for p in gm.players]
+    for g in played:
+        assert [board_of(games, g, p) for p in range(2)] == expected
+    assert (games.live_scores(played) == scores).all()
+
+
+PARITY_CASES = [
+    # (技能, 牌号, 手牌张数, [P0 战场, P1 战场], 目标)
+    ("Skill_1", 1, 1, [[(3, 2), (8, 5)], [(4, 3)]], None),
+    ("Skill_2 独自上场", 2, 1, [[], [(4, 3)]], None),
+    ("Skill_2 已有牌", 2, 1, [[(4, 3)], []], None),
+    ("Skill_8", 8, 1, [[(8, 3), (8, 6), (1, 1)], []], None),
+    ("Skill_8 无同名", 8, 1, [[(1, 1)], [(8, 3)]], None),
+    ("Skill_21", 13, 1, [[], [(3, 4)]], (1, 0)),
+    ("Skill_21 己方", 13, 1, [[(5, -2)], []], (0, 0)),
+    ("Skill_23", 14, 3, [[], []], None),
+    ("Skill_23 上限", 14, 9, [[(1, 1)], []], None),
+    ("Skill_29", 18, 1, [[(1, 1)], [(3, 2), (4, 3), (5, 3), (6, 0)]], None),
+    ("Skill_29 不多于", 18, 1, [[(1, 1), (2, 2)], [(3, 2)]], None),
+]
+
+
+@pytest.mark.parametrize("name, number, hand_size, boards, target", PARITY_CASES,
+                         ids=[case[0] for case in PARITY_CASES])
+def test_point_skill_parity(make_manager, name, number, hand_size, boards, target):
+    games, played = batch_play(number, hand_size, boards)
+    gm = single_play(make_manager, number, hand_size, boards, target)
+    assert_same_result(games, played, gm)
+    assert (games.hand_n[played, 0] == len(gm.players[0].hand)).all()
+
+
+def test_skill_10_dice_parity(make_manager):
+    # 掷骰加点：两边的结果都应恰好覆盖 1~6
+    boards = [[(4, 3)], [(5, 3)]]
+    games, played = batch_play(10, 1, boards, n_games=600)
+    batch_rolls = {pts for g in played for num, pts in board_of(games, g, 0) if num == 10}
+    single_rolls = set()
+    for seed in range(60):
+        gm = single_play(make_manager, 10, 1, boards, seed=seed)
+        assert [(c.number, c.points) for c in gm.players[1].battlefield_cards] == [(5, 3)]
+        single_rolls.update(c.points for c in gm.players[0].battlefield_cards if c.number == 10)
+    assert batch_rolls == single_rolls == set(range(1, 7))
+
+
+def test_live_scores_match_calculate_score():
+    games = BatchGames(50, num_players=3, seed=1)
+    for _ in range(15):
+        games.step()
+    scores = games.live_scores()
+    for g in range(50):
+        players = [Player(f"P{i}", i) for i in range(3)]
+        for p, player in enumerate(players):
+            player.score = int(games.score[g, p])
+            for ids, pts, n, zone in ((games.bf_ids, games.bf_pts, games.bf_n, player.battlefield_cards),
+                                      (games.iso_ids, games.iso_pts, games.iso_n, player.isolated_cards)):
+                for k in range(n[g, p]):
+                    card = create_card_by_number(int(ids[g, p, k]))
+                    card.set_points(int(pts[g, p, k]))
+                    zone.append(card)
+        assert scores[g].tolist() == [player.calculate_score() for player in players]
+
+
+def test_finite_deck_conserves_cards():
+    # 抽牌堆 + 弃牌堆 + 各牌区（回到手里的孤立放置牌只算一次）= 整副牌
+    games = BatchGames(300, num_players=4, seed=3)
+    slots = np.arange(games.capacity)[None, None, :]
+    owner = np.broadcast_to(np.arange(games.n_games)[:, None, None], games.hand_ids.shape)
+    while True:
+        held = np.zeros_like(games.discard)
+        for ids, n, skip in ((games.hand_ids, games.hand_n, None), (games.bf_ids, games.bf_n, None),
+                             (games.iso_ids, games.iso_n, games.returns_to_hand)):
+            mask = slots < n[:, :, None]
+            if skip is not None:
+                mask &= ~skip[ids]
+            np.add.at(held, (owner[mask], ids[mask].astype(np.intp)), 1)
+        total = held + games.remaining_counts() + games.discard
+        assert (total == games.composition).all()
+        if games.step() == 0:
+            break
+    assert games.counters["finished"].all()
@@ -0,0 +1,29 @@
+import copy
+import pickle
+
+from game.card import Card
+from game.card_factory import create_card_by_number
+from game.zone import Zone
+
+
+def test_direct_assignment_updates_zone_totals():
+    card = create_card_by_number(3)
+    other = create_card_by_number(4)
+    hand, isolated = Zone([card, other]), Zone([card])
+    card.points = 10
+    assert card.points == 10
+    assert hand.total == 10 + other.points and isolated.total == 10
+    card.points += 5
+    other.points -= 1
+    assert hand.total == 15 + other.points and isolated.total == 15
+    version = hand.version
+    card.points = card.points   # 没有变化：不换版本号
+    assert hand.version == version
+
+
+def test_points_round_trip():
+    card = Card("x", 3)
+    card.add_points(2)
+    assert pickle.loads(pickle.dumps(card)).points == 5
+    assert copy.deepcopy(card).points == 5
+    assert copy.deepcopy(card).zones is None
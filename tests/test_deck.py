@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from game.card_factory import card_data_map
+from game.deck import DEFAULT_COPIES, Deck
+
+
+def test_default_composition_has_every_card():
+    deck = Deck(rng=random.Random(0))
+    assert len(deck) == len(card_data_map) * DEFAULT_COPIES
+    assert deck.remaining_counts() == {n: DEFAULT_COPIES for n in card_data_map}
+
+
+def test_invalid_composition():
+    with pytest.raises(ValueError):
+        Deck({999: 1})
+    with pytest.raises(ValueError):
+        Deck({1: -1})
+
+
+def test_draw_updates_counts():
+    deck = Deck({1: 2, 2: 1}, rng=random.Random(1))
+    drawn = [deck.draw() for _ in range(3)]
+    assert sorted(drawn) == [1, 1, 2]
+    assert len(deck) == 0
+    assert deck.remaining_counts() == {1: 0, 2: 0}
+
+
+def test_draw_n_matches_single_draws():
+    a = Deck(rng=random.Random(7))
+    b = Deck(rng=random.Random(7))
+    assert a.draw_n(10) == [b.draw() for _ in range(10)]
+    assert a.get_state() == b.get_state()
+
+
+def test_exhaustion_returns_none():
+    deck = Deck({3: 2}, rng=random.Random(0))
+    assert deck.draw_n(5) == [3, 3]
+    assert deck.draw() is None
+    assert deck.draw_n(2) == []
+
+
+def test_reshuffle_discards_when_empty():
+    deck = Deck({1: 1, 2: 1}, rng=random.Random(0))
+    first = deck.draw_n(2)
+    deck.discard(first[0])
+    assert deck.draw() == first[0]
+    assert deck.discard_pile == []
+    assert deck.draw() is None
+
+
+def test_probabilities():
+    deck = Deck({1: 3, 2: 1}, rng=random.Random(0))
+    assert deck.probability(1) == pytest.approx(0.75)
+    assert deck.draw_probabilities() == pytest.approx({1: 0.75, 2: 0.25})
+
+
+def test_state_round_trip():
+    deck = Deck(rng=random.Random(3))
+    deck.draw_n(5)
+    deck.discard(4)
+    state = deck.get_state()
+    rng_state = deck.rng.getstate()
+    after = deck.draw_n(20)
+    deck.set_state(state)
+    deck.rng.setstate(rng_state)
+    assert deck.draw_n(20) == after
+
+
+def test_set_hidden_keeps_counts_in_sync():
+    deck = Deck({1: 3, 2: 2}, rng=random.Random(0))
+    deck.draw()
+    deck.discard(1)
+    deck.set_hidden([2, 1, 2])
+    assert deck.draw_pile == [2, 1, 2]
+    assert deck.remaining_counts() == {1: 1, 2: 2}
+    assert deck.discard_pile == [1]
+    assert deck.draw() == 2
+    assert deck.remaining_counts() == {1: 1, 2: 1}
+
+
+def test_shuffle_keeps_counts():
+    deck = Deck(rng=random.Random(1))
+    before = sorted(deck.draw_pile), deck.remaining_counts()
+    deck.shuffle(random.Random(2))
+    assert (sorted(deck.draw_pile), deck.remaining_counts()) == before
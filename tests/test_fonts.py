@@ -0,0 +1,154 @@
+import json
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from ui import fonts
+from ui.fonts import FontRegistry
+
+
+@pytest.fixture
+def font_env(tmp_path, monkeypatch):
+    """临时字体目录 + 计数的 match_font：返回 (字体文件, 调用记录)"""
+    font_dir = tmp_path / "fonts"
+    (font_dir / "cjk").mkdir(parents=True)
+    font_file = font_dir / "cjk" / "fake.ttf"
+    font_file.write_bytes(b"")
+    calls = []
+
+    def match_font(names):
+        calls.append(list(names))
+        return str(font_file)
+
+    monkeypatch.setattr(fonts, "font_dirs", lambda: [str(font_dir), str(tmp_path / "missing")])
+    monkeypatch.setattr(pygame.font, "match_font", match_font)
+    return font_file, calls
+
+
+def bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_miss_then_hit(tmp_path, font_env):
+    font_file, calls = font_env
+    cache = tmp_path / "cache" / "fonts.json"
+    first = FontRegistry(["A", "B"], cache_path=str(cache))
+    assert first.resolve() == str(font_file)
+    assert not first.from_cache and len(calls) == 1
+    assert first.resolve() == str(font_file) and len(calls) == 1   # 同一实例只解析一次
+    assert cache.exists() and not os.path.exists(str(cache) + ".tmp")
+    data = json.loads(cache.read_text(encoding="utf-8"))
+    assert data["path"] == str(font_file) and data["fingerprint"]["candidates"] == ["A", "B"]
+
+    second = FontRegistry(["A", "B"], cache_path=str(cache))
+    assert second.resolve() == str(font_file)
+    assert second.from_cache and len(calls) == 1
+
+
+def test_candidates_change_invalidates(tmp_path, font_env):
+    _, calls = font_env
+    cache = str(tmp_path / "fonts.json")
+    FontRegistry(["A"], cache_path=cache).resolve()
+    registry = FontRegistry(["B"], cache_path=cache)
+    registry.resolve()
+    assert not registry.from_cache and len(calls) == 2
+    assert calls[-1] == ["B"]
+
+
+def test_font_dir_mtime_invalidates(tmp_path, font_env):
+    font_file, calls = font_env
+    cache = str(tmp_path / "fonts.json")
+    FontRegistry(["A"], cache_path=cache).resolve()
+    bump_mtime(font_file.parent.parent)   # 系统字体目录：指纹变化
+    registry = FontRegistry(["A"], cache_path=cache)
+    registry.resolve()
+    assert not registry.from_cache and len(calls) == 2
+    bump_mtime(font_file.parent)          # 字体所在子目录：dir_mtime 变化
+    registry = FontRegistry(["A"], cache_path=cache)
+    registry.resolve()
+    assert not registry.from_cache and len(calls) == 3
+    registry = FontRegistry(["A"], cache_path=cache)
+    registry.resolve()
+    assert registry.from_cache and len(calls) == 3
+
+
+def test_missing_font_file_invalidates(tmp_path, font_env):
+    font_file, calls = font_env
+    cache = str(tmp_path / "fonts.json")
+    FontRegistry(["A"], cache_path=cache).resolve()
+    st = os.stat(font_file.parent)
+    os.remove(font_file)
+    os.utime(font_file.parent, ns=(st.st_atime_ns, st.st_mtime_ns))   # 只有字体文件不见了
+    registry = FontRegistry(["A"], cache_path=cache)
+    registry.resolve()
+    assert not registry.from_cache and len(calls) == 2
+
+
+def test_no_match_is_cached(tmp_path, monkeypatch):
+    calls = []
+    (tmp_path / "fonts").mkdir()
+    monkeypatch.setattr(fonts, "font_dirs", lambda: [str(tmp_path / "fonts")])
+    monkeypatch.setattr(pygame.font, "match_font", lambda names: calls.append(names))
+    cache = str(tmp_path / "fonts.json")
+    assert FontRegistry(["X"], cache_path=cache).resolve() is None
+    registry = FontRegistry(["X"], cache_path=cache)
+    assert registry.resolve() is None and registry.from_cache and len(calls) == 1
+
+
+def test_corrupt_cache_is_rewritten(tmp_path, font_env):
+    font_file, calls = font_env
+    cache = tmp_path / "fonts.json"
+    cache.write_text("{not json", encoding="utf-8")
+    assert FontRegistry(["A"], cache_path=str(cache)).resolve() == str(font_file)
+    assert json.loads(cache.read_text(encoding="utf-8"))["path"] == str(font_file)
+    assert len(calls) == 1
+
+
+def test_disk_cache_disabled(tmp_path, font_env):
+    _, calls = font_env
+    for _ in range(2):
+        registry = FontRegistry(["A"], cache_path=False)
+        registry.resolve()
+        assert not registry.from_cache
+    assert len(calls) == 2
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_unwritable_cache_dir_does_not_raise(tmp_path, font_env):
+    font_file, calls = font_env
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    registry = FontRegistry(["A"], cache_path=str(blocker / "fonts.json"))
+    assert registry.resolve() == str(font_file)
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() == 0, reason="root 不受目录权限限制")
+def test_read_only_cache_dir_does_not_raise(tmp_path, font_env):
+    font_file, _ = font_env
+    ro = tmp_path / "ro"
+    ro.mkdir()
+    ro.chmod(0o500)
+    try:
+        assert FontRegistry(["A"], cache_path=str(ro / "fonts.json")).resolve() == str(font_file)
+    finally:
+        ro.chmod(0o700)
+
+
+def test_preload_resolves_in_background(tmp_path, font_env):
+    font_file, calls = font_env
+    registry = FontRegistry(["A"], cache_path=str(tmp_path / "fonts.json"))
+    registry.preload(done_event=None)
+    registry.wait()
+    assert registry.ready and registry.resolve_seconds is not None
+    assert registry.resolve() == str(font_file) and len(calls) == 1
+
+
+def test_default_font_needs_no_resolve(tmp_path, font_env):
+    _, calls = font_env
+    pygame.font.init()
+    registry = FontRegistry(["A"], cache_path=False)
+    assert registry.default_font(16) is registry.default_font(16)
+    assert not registry.ready and calls == []
@@ -0,0 +1,65 @@
+def test_first_round_deals_six_then_two(make_manager):
+    gm = make_manager(3)
+    gm.start_small_round()
+    assert [len(p.hand) for p in gm.players] == [6, 6, 6]
+    gm.round_active = False
+    gm.start_small_round()
+    assert [len(p.hand) for p in gm.players] == [8, 8, 8]
+
+
+def test_deal_draws_from_finite_deck(make_manager):
+    gm = make_manager(2)
+    total = len(gm.deck)
+    gm.start_small_round()
+    assert len(gm.deck) == total - 12
+    dealt = sorted(c.number for p in gm.players for c in p.hand)
+    remaining = gm.deck.remaining_counts()
+    for number, count in gm.deck.composition.items():
+        assert dealt.count(number) + remaining[number] == count
+
+
+def test_board_cleared_into_discard_pile(make_manager):
+    gm = make_manager(2)
+    gm.start_small_round()
+    p = gm.players[0]
+    played = p.hand[:2]
+    for card in played:
+        p.hand.remove(card)
+        p.battlefield_cards.append(card)
+    gm.start_small_round()
+    assert p.battlefield_cards == [] and p.isolated_cards == []
+    assert sorted(gm.deck.discard_pile) == sorted(c.number for c in played)
+
+
+def test_card_still_in_hand_is_not_discarded(make_manager):
+    gm = make_manager(2)
+    gm.start_small_round()
+    p = gm.players[0]
+    card = p.hand[0]
+    p.isolated_cards.append(card)  # 孤立放置后仍留在手里
+    gm.start_small_round()
+    assert card in p.hand
+    assert gm.deck.discard_pile == []
+
+
+def test_deal_can_reshuffle_previous_board(make_manager):
+    # 牌堆只剩 1 张时开新小局：上一小局的场上牌先进弃牌堆，发牌时洗回来补足 2 张
+    gm = make_manager(1, composition={1: 7})
+    gm.start_small_round()
+    p = gm.players[0]
+    for card in p.hand[:2]:
+        p.hand.remove(card)
+        p.battlefield_cards.append(card)
+    assert len(gm.deck) == 1
+    gm.start_small_round()
+    assert len(p.hand) == 6
+    assert len(gm.deck) == 1 and gm.deck.discard_pile == []
+
+
+def test_same_seed_replays_same_match(make_manager):
+    def play(seed):
+        gm = make_manager(3, seed=seed, random_seats=range(3))
+        winners = gm.play_match()
+        return winners, [p.score for p in gm.players]
+
+    assert play(5) == play(5)
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from ui.layout import ZONES, HitIndex, PlayerLayout
+
+
+class Seat:
+    def __init__(self, index):
+        self.index = index
+
+
+def random_rect(rng, cell):
+    # 一半矩形贴着网格线放，保证有跨格子边界的矩形
+    if rng.random() < 0.5:
+        x = rng.randrange(1, 10) * cell + rng.randrange(-3, 3)
+        y = rng.randrange(1, 10) * cell + rng.randrange(-3, 3)
+    else:
+        x, y = rng.randrange(0, 600), rng.randrange(0, 600)
+    return pygame.Rect(x, y, rng.randrange(1, 3 * cell), rng.randrange(1, 3 * cell))
+
+
+def random_layouts(rng, players, cell):
+    layouts = {}
+    for p in players:
+        card_rects = {}
+        for zone in ZONES:
+            rects = [random_rect(rng, cell) for _ in range(rng.randrange(0, 8))]
+            if rects and rng.random() < 0.5:
+                rects.append(pygame.Rect(rects[0]))  # 完全重合：应命中靠前的一张
+            card_rects[zone] = rects
+        area = random_rect(rng, cell).inflate(rng.randrange(0, 200), rng.randrange(0, 200))
+        layouts[p.index] = PlayerLayout(area, 0, 0, 0, 0, {}, card_rects)
+    return layouts
+
+
+def linear_card_at(players, layouts, x, y, player=None, zone=None):
+    for p in players:
+        if player is not None and p is not player:
+            continue
+        for z in ZONES:
+            if zone is not None and z != zone:
+                continue
+            for i, rect in enumerate(layouts[p.index].card_rects[z]):
+                if rect.collidepoint(x, y):
+                    return p, z, i
+    return None
+
+
+def linear_player_at(players, layouts, x, y):
+    for p in players:
+        if layouts[p.index].area_rect.collidepoint(x, y):
+            return p
+    return None
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("cell", [16, 64])
+def test_hit_index_matches_linear_scan(seed, cell):
+    rng = random.Random(seed)
+    players = [Seat(i) for i in range(rng.randrange(2, 5))]
+    layouts = random_layouts(rng, players, cell)
+    index = HitIndex(players, layouts, cell=cell)
+
+    points = [(rng.randrange(-10, 900), rng.randrange(-10, 900)) for _ in range(300)]
+    # 矩形的四角与边外一像素（右 / 下边不属于矩形）
+    for lay in layouts.values():
+        for rect in [lay.area_rect] + [r for z in ZONES for r in lay.card_rects[z]]:
+            for x in (rect.left - 1, rect.left, rect.right - 1, rect.right):
+                for y in (rect.top - 1, rect.top, rect.bottom - 1, rect.bottom):
+                    points.append((x, y))
+
+    for x, y in points:
+        assert index.card_at(x, y) == linear_card_at(players, layouts, x, y)
+        assert index.player_at(x, y) == linear_player_at(players, layouts, x, y)
+        p = rng.choice(players)
+        z = rng.choice(ZONES)
+        assert index.card_at(x, y, player=p) == linear_card_at(players, layouts, x, y, player=p)
+        assert index.card_at(x, y, zone=z) == linear_card_at(players, layouts, x, y, zone=z)
+        assert index.card_at(x, y, p, z) == linear_card_at(players, layouts, x, y, p, z)
+
+
+def test_overlap_prefers_earlier_entry():
+    players = [Seat(0), Seat(1)]
+    rect = pygame.Rect(60, 60, 10, 10)  # 跨越 64 像素网格线
+    layouts = {
+        0: PlayerLayout(pygame.Rect(0, 0, 200, 200), 0, 0, 0, 0, {},
+                        {"hand": [], "battlefield": [rect, pygame.Rect(rect)], "isolated": [rect]}),
+        1: PlayerLayout(pygame.Rect(0, 0, 200, 200), 0, 0, 0, 0, {},
+                        {"hand": [rect], "battlefield": [], "isolated": []}),
+    }
+    index = HitIndex(players, layouts, cell=64)
+    for x, y in ((60, 60), (63, 63), (64, 64), (69, 69)):
+        assert index.card_at(x, y) == (players[0], "battlefield", 0)
+        assert index.card_at(x, y, zone="isolated") == (players[0], "isolated", 0)
+        assert index.card_at(x, y, player=players[1]) == (players[1], "hand", 0)
+        assert index.player_at(x, y) is players[0]
+    assert index.card_at(70, 70) is None
@@ -0,0 +1,126 @@
+import logging
+import os
+import subprocess
+import sys
+
+from ui import log_store
+from ui.log_store import LogStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n").split("\t", 1)[1] for line in f]
+
+
+def test_ring_buffer_eviction():
+    logs = LogStore(capacity=4)
+    for i in range(10):
+        assert logs.append(f"第{i}条") == i
+    assert len(logs) == 4
+    assert [e.seq for e in logs] == [6, 7, 8, 9]
+    assert [e.text for e in logs.last(2)] == ["第8条", "第9条"]
+    assert [e.seq for e in logs.last(100)] == [6, 7, 8, 9]
+    assert logs.last(0) == []
+
+
+def test_partial_buffer():
+    logs = LogStore(capacity=5)
+    logs.append("a")
+    logs.append("b")
+    assert [e.text for e in logs] == ["a", "b"]
+    assert [e.text for e in logs.last(5)] == ["a", "b"]
+
+
+def test_version_changes_on_append_and_clear():
+    logs = LogStore(capacity=3)
+    seen = {logs.version}
+    for i in range(5):
+        logs.append(str(i))
+        assert logs.version not in seen
+        seen.add(logs.version)
+    logs.clear()
+    assert len(logs) == 0 and list(logs) == []
+    assert logs.version not in seen
+    assert logs.append("x") == 5   # 清空后序号继续递增
+    assert [e.text for e in logs] == ["x"]
+
+
+def test_evicted_entry_drops_surface():
+    logs = LogStore(capacity=2)
+    logs.append("a")
+    logs.last(1)[0].surface = object()
+    logs.append("b")
+    logs.append("c")
+    assert all(e.surface is None for e in logs)
+
+
+def test_spill_rotation(tmp_path):
+    path = tmp_path / "sub" / "game.log"
+    logs = LogStore(capacity=3)
+    logs.spill_to(str(path), max_bytes=200, backups=2)
+    texts = [f"玩家{i} 打出了一张牌" for i in range(40)]
+    for text in texts:
+        logs.append(text)
+    logs.close()
+
+    files = sorted(p.name for p in path.parent.iterdir())
+    assert files == ["game.log", "game.log.1", "game.log.2"]
+    for p in path.parent.iterdir():
+        assert p.stat().st_size <= 200
+    # 最新的日志在 game.log，旧文件依次为 .1、.2，内容首尾相接
+    lines = read_lines(str(path) + ".2") + read_lines(str(path) + ".1") + read_lines(path)
+    assert lines == [f"{i}\t{t}" for i, t in enumerate(texts)][-len(lines):]
+    assert len(logs) == 3
+
+
+def test_spill_close_and_respill(tmp_path):
+    first, second = tmp_path / "a.log", tmp_path / "b.log"
+    logs = LogStore()
+    logs.spill_to(str(first))
+    logs.append("one")
+    logs.spill_to(str(second))   # 重新指定文件时关闭旧文件
+    logs.append("two")
+    logs.spill_to(None)
+    logs.append("three")
+    assert read_lines(first) == ["0\tone"]
+    assert read_lines(second) == ["1\ttwo"]
+
+
+def test_spill_does_not_register_loggers(tmp_path):
+    before = set(logging.root.manager.loggerDict)
+    for i in range(5):
+        logs = LogStore()
+        logs.spill_to(str(tmp_path / f"{i}.log"))
+        logs.append("x")
+        logs.close()
+    assert set(logging.root.manager.loggerDict) == before
+
+
+def test_spill_closed_at_exit_without_close(tmp_path):
+    path = tmp_path / "exit.log"
+    script = (
+        "import sys\n"
+        "from ui.log_store import LogStore\n"
+        "logs = LogStore()\n"
+        f"logs.spill_to({str(path)!r})\n"
+        "logs.append('最后一条')\n"
+        "sys.exit()\n"   # 与关闭窗口时相同：不调用 close() 直接退出
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+    assert read_lines(path) == ["0\t最后一条"]
+
+
+def test_close_unregisters_atexit_hook(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(log_store.atexit, "register", registered.append)
+    monkeypatch.setattr(log_store.atexit, "unregister", registered.remove)
+    logs = LogStore()
+    logs.spill_to(str(tmp_path / "a.log"))
+    assert registered == [logs.close]
+    logs.spill_to(str(tmp_path / "b.log"))   # 换文件：旧的钩子注销、新的注册
+    assert registered == [logs.close]
+    logs.close()
+    logs.close()
+    assert registered == []
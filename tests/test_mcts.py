@@ -0,0 +1,100 @@
+import random
+from collections import Counter
+
+from game.controller import END_TURN, PLAY_CARD, legal_plays
+from game.mcts import MCTSController, _card_ref, _determinize, _legal_options, _random_turn
+
+
+def hidden_numbers(gm, observer):
+    """观察者看不到的牌：抽牌堆 + 对手手牌中未公开的牌"""
+    numbers = Counter(gm.deck.draw_pile)
+    for p in gm.players:
+        if p.index != observer:
+            public = {id(c) for c in p.isolated_cards}
+            numbers.update(c.number for c in p.hand if id(c) not in public)
+    return numbers
+
+
+def test_determinize_keeps_hidden_cards(make_manager):
+    for seed in range(10):
+        gm = make_manager(3, seed=seed, random_seats=range(3), start=True)
+        rng = random.Random(seed)
+        for _ in range(rng.randrange(0, 8)):
+            _random_turn(gm, rng)
+        observer = gm.current_player_index
+        before = hidden_numbers(gm, observer)
+        own_hand = list(gm.players[observer].hand)
+        sizes = [len(p.hand) for p in gm.players]
+        pile_size = len(gm.deck)
+        discards = list(gm.deck.discard_pile)
+
+        _determinize(gm, observer, random.Random(seed + 100))
+
+        assert hidden_numbers(gm, observer) == before
+        assert [len(p.hand) for p in gm.players] == sizes
+        assert len(gm.deck) == pile_size
+        assert gm.deck.discard_pile == discards
+        # 牌堆的剩余张数与抽牌堆一致，总张数不变
+        assert {n: c for n, c in gm.deck.counts.items() if c} == Counter(gm.deck.draw_pile)
+        assert sum(gm.deck.counts.values()) == pile_size
+        # 观察者自己的手牌是同一批对象
+        assert all(a is b for a, b in zip(gm.players[observer].hand, own_hand))
+
+
+def test_determinize_leaves_public_hand_cards_in_place(make_manager):
+    gm = make_manager(3, seed=4, random_seats=range(3), start=True)
+    opponent = gm.players[1]
+    public = opponent.hand[2]
+    opponent.isolated_cards.append(public)   # 孤立放置后同时留在手里：对所有人公开
+    for seed in range(20):
+        _determinize(gm, 0, random.Random(seed))
+        assert opponent.hand[2] is public
+        assert opponent.isolated_cards[0] is public
+
+
+def test_determinize_changes_opponent_hands(make_manager):
+    gm = make_manager(3, seed=5, random_seats=range(3), start=True)
+    before = [c.number for c in gm.players[1].hand] + [c.number for c in gm.players[2].hand]
+    changed = False
+    for seed in range(20):
+        _determinize(gm, 0, random.Random(seed))
+        changed |= [c.number for c in gm.players[1].hand] + [c.number for c in gm.players[2].hand] != before
+    assert changed
+
+
+def test_legal_options_match_legal_plays(make_manager):
+    for seed in range(10):
+        gm = make_manager(3, seed=seed, random_seats=range(3), start=True)
+        rng = random.Random(seed)
+        while gm.round_active:
+            player = gm.current_player
+            plays = legal_plays(gm.board, player)
+            options = _legal_options(gm, player)
+            assert options[(END_TURN,)] == {"type": END_TURN}
+            keys = set()
+            for card, targets, enemies in plays:
+                key = (PLAY_CARD, card.number, tuple(_card_ref(gm.board, t) for t in targets),
+                       tuple(e.index for e in enemies))
+                assert key in options
+                chosen = options[key]
+                assert chosen["card"].number == card.number
+                assert [_card_ref(gm.board, t) for t in chosen["targets"]] == list(key[2])
+                assert [e.index for e in chosen["enemies"]] == list(key[3])
+                keys.add(key)
+            assert set(options) == keys | {(END_TURN,)}
+            _random_turn(gm, rng)
+
+
+def test_root_parallel_search(make_manager):
+    gm = make_manager(3, seed=2, random_seats=range(3), start=True)
+    before = [[c.number for c in p.hand] for p in gm.players]
+    ai = MCTSController(iterations=40, workers=2, seed=0)
+    try:
+        action = ai.choose_action(gm, gm.current_player)
+    finally:
+        ai.close()
+    assert ai.last_iterations == 40
+    assert action["type"] in (END_TURN, PLAY_CARD)
+    if action["type"] == PLAY_CARD:
+        assert any(action["card"] is c for c in gm.current_player.hand)
+    assert [[c.number for c in p.hand] for p in gm.players] == before
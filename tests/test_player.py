@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from game.mcts import _random_turn
+
+
+def assert_totals(gm):
+    """增量维护的合计与逐张重新求和一致"""
+    for p in gm.players:
+        for zone in (p.hand, p.battlefield_cards, p.isolated_cards):
+            assert zone.total == sum(c.points for c in zone)
+        on_board = sum(c.points for c in p.battlefield_cards) + sum(c.points for c in p.isolated_cards)
+        assert p.board_points == on_board
+        assert p.live_score == p.score + on_board
+    assert gm.board.board_points() == {p.name: p.board_points for p in gm.players}
+
+
+def random_edit(gm, rng):
+    """直接对牌区做一次随机的偷牌 / 摧毁 / 移区 / 改点数"""
+    players = gm.players
+    zones = [z for p in players for z in (p.hand, p.battlefield_cards, p.isolated_cards) if z]
+    if not zones:
+        return
+    zone = rng.choice(zones)
+    card = rng.choice(zone)
+    op = rng.randrange(5)
+    if op == 0:    # 偷到某人手里
+        zone.remove(card)
+        rng.choice(players).hand.append(card)
+    elif op == 1:  # 摧毁
+        del zone[zone.index(card)]
+    elif op == 2:  # 移到任意牌区的任意位置
+        zone.pop(zone.index(card))
+        target = rng.choice([z for p in players for z in (p.hand, p.battlefield_cards, p.isolated_cards)])
+        target.insert(rng.randrange(len(target) + 1), card)
+    elif op == 3:  # 技能加减分
+        card.add_points(rng.randrange(-5, 6))
+    else:          # 直接设定点数
+        card.set_points(rng.randrange(-3, 15))
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_incremental_totals_match_recount(make_manager, seed):
+    rng = random.Random(seed)
+    num_players = 2 + seed % 3
+    gm = make_manager(num_players, seed=seed, random_seats=range(num_players))
+    snapshots = []
+    for _ in range(gm.total_rounds):
+        gm.start_small_round()
+        assert_totals(gm)
+        while gm.round_active:
+            if rng.random() < 0.2:
+                random_edit(gm, rng)
+            else:
+                _random_turn(gm, rng)
+            assert_totals(gm)
+            if rng.random() < 0.1:
+                snapshots.append(gm.snapshot())
+            elif snapshots and rng.random() < 0.05:
+                gm.restore(rng.choice(snapshots))
+                assert_totals(gm)
+        gm.finish_small_round()
+        assert_totals(gm)
+        if gm.is_match_over():
+            break
+
+
+def test_card_in_two_zones_counts_in_both(make_manager):
+    gm = make_manager(3, start=True)
+    p = gm.players[0]
+    card = p.hand[0]
+    p.isolated_cards.append(card)   # 同时在手牌与孤立区
+    card.add_points(4)
+    assert_totals(gm)
+    p.hand.remove(card)
+    card.add_points(-1)
+    assert_totals(gm)
+    assert card.zones is p.isolated_cards
@@ -0,0 +1,125 @@
+import pytest
+
+from ui import profiler as profiler_module
+from ui.profiler import FrameProfiler
+
+
+class FakeClock:
+    """可手动推进的 perf_counter"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms / 1000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(profiler_module.time, "perf_counter", fake)
+    return fake
+
+
+def run_frame(prof, clock, ms, phases=()):
+    """推进一帧：先执行各 (阶段, 毫秒)，再补足到 ms 毫秒"""
+    prof.begin_frame()
+    spent = 0
+    for name, phase_ms in phases:
+        with prof.phase(name):
+            clock.advance(phase_ms)
+        spent += phase_ms
+    clock.advance(ms - spent)
+    prof.end_frame()
+
+
+def test_percentiles(clock):
+    prof = FrameProfiler(history=200)
+    prof.toggle()
+    for ms in range(100, -1, -1):   # 0..100 毫秒各一帧，乱序进入
+        run_frame(prof, clock, ms)
+
+    assert len(prof.frames) == 101
+    for q in (0, 50, 95, 99, 100):
+        assert prof.percentile(q) == pytest.approx(q)
+    summary = prof.summary()
+    assert summary["frames"] == 101
+    assert summary["frame_ms"]["p95"] == pytest.approx(95)
+
+
+def test_history_keeps_only_latest_frames(clock):
+    prof = FrameProfiler(history=10)
+    prof.toggle()
+    for ms in range(1, 21):
+        run_frame(prof, clock, ms)
+
+    assert len(prof.frames) == 10
+    assert prof.percentile(0) == pytest.approx(11)
+    assert prof.percentile(100) == pytest.approx(20)
+
+
+def test_phase_totals(clock):
+    prof = FrameProfiler()
+    prof.toggle()
+    # 同一帧内同名阶段累加；事件处理发生在 begin_frame 之前，计入下一帧
+    with prof.phase("events"):
+        clock.advance(3)
+    run_frame(prof, clock, 10, [("draw_zone", 2), ("draw_zone", 2), ("present", 1)])
+    run_frame(prof, clock, 6, [("draw_zone", 4)])
+
+    first, second = prof.frames
+    assert first[1] * 1000 == pytest.approx(13)    # 绘制 10 + 事件 3
+    assert first[2]["draw_zone"] * 1000 == pytest.approx(4)
+    assert first[2]["events"] * 1000 == pytest.approx(3)
+    assert second[1] * 1000 == pytest.approx(6)
+    assert "events" not in second[2]
+
+    means = prof.phase_means()
+    assert means["draw_zone"] == pytest.approx(4)
+    assert means["present"] == pytest.approx(0.5)
+    assert means["events"] == pytest.approx(1.5)
+
+
+def test_alloc_counter_per_frame(clock):
+    allocs = [0]
+    prof = FrameProfiler(alloc_counter=lambda: allocs[0])
+    prof.toggle()
+    for new in (3, 0, 5):
+        prof.begin_frame()
+        allocs[0] += new
+        prof.end_frame()
+
+    assert [f[3] for f in prof.frames] == [3, 0, 5]
+    assert prof.allocs_per_frame() == pytest.approx(8 / 3)
+
+
+def test_disabled_phase_is_shared_noop(clock):
+    calls = []
+    prof = FrameProfiler(alloc_counter=lambda: calls.append(1) or 0)
+
+    first = prof.phase("draw_zone")
+    assert prof.phase("present") is first
+    with first:
+        clock.advance(5)
+    prof.begin_frame()
+    prof.end_frame()
+
+    assert not prof.frames
+    assert not prof._pending
+    assert not calls   # 关闭时不调用分配计数
+    assert prof.summary()["frame_ms"] == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    assert prof.phase_means() == {}
+
+
+def test_toggle_clears_history(clock):
+    prof = FrameProfiler()
+    assert prof.toggle() is True
+    run_frame(prof, clock, 5)
+    assert prof.toggle() is False
+    assert not prof.frames
+    assert prof.toggle() is True
+    assert not prof.frames
+    assert prof.phase("draw_zone") is not prof.phase("draw_zone")
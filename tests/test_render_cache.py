@@ -0,0 +1,98 @@
+import os
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from ui.fonts import font_dirs
+from ui.render_cache import TextLayout
+
+
+def system_font_file():
+    """字体目录里的一个 TrueType 字体（有中文字体时优先），没有时返回 None"""
+    found = []
+    for d in font_dirs():
+        for root, _, files in os.walk(d) if d else ():
+            found += [os.path.join(root, f) for f in files if f.lower().endswith((".ttf", ".ttc", ".otf"))]
+    cjk = [f for f in found if any(k in f.lower() for k in ("cjk", "wqy", "hei", "song", "ming"))]
+    return (sorted(cjk) or sorted(found) or [None])[0]
+
+
+def reference_wrap(text, font, max_width):
+    """原 PygameUI._wrap_text：逐字累积，用 font.size 量整串，超宽换行"""
+    if not text:
+        return [""]
+    lines = []
+    current = ""
+    for ch in text:
+        test = current + ch
+        if font.size(test)[0] <= max_width or not current:
+            current = test
+        else:
+            lines.append(current)
+            current = ch
+    if current:
+        lines.append(current)
+    return lines
+
+
+@pytest.fixture(scope="module")
+def fonts():
+    pygame.font.init()
+    fonts = [pygame.font.Font(None, size) for size in (12, 20, 32)]
+    path = system_font_file()
+    if path:
+        fonts.append(pygame.font.Font(path, 18))
+    yield fonts
+    pygame.font.quit()
+
+
+TEXTS = [
+    "",
+    "a",
+    "中",
+    "玩家1 打出了 萝卜 (+3分)，AVA 的战场点数变为 12",
+    "WAVE AVATAR Tokyo VA Te fi ffl",
+    "混合mixed文本text，带标点！?…——",
+    "   前后空格   ",
+    "一二三四五六七八九十" * 5,
+    "x" * 40,
+]
+
+
+@pytest.mark.parametrize("max_width", [0, 1, 5, 13, 40, 97, 250, 10000])
+def test_wrap_matches_per_character_reference(fonts, max_width):
+    layout = TextLayout()
+    for font in fonts:
+        for text in TEXTS:
+            expected = reference_wrap(text, font, max_width)
+            assert list(layout.wrap(font, text, max_width)) == expected
+            assert "".join(expected) == text
+
+
+def test_wrap_random_strings(fonts):
+    rng = random.Random(0)
+    alphabet = "abcdefgWMil.,! 0123AVTo中文萝卜牌战场孤立，。（）"
+    layout = TextLayout(capacity=8)   # 容量很小：同时覆盖缓存淘汰后的重算
+    for _ in range(300):
+        font = rng.choice(fonts)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 60)))
+        max_width = rng.randrange(0, 200)
+        assert list(layout.wrap(font, text, max_width)) == reference_wrap(text, font, max_width)
+
+
+def test_width_smaller_than_one_glyph(fonts):
+    font = fonts[0]
+    layout = TextLayout()
+    lines = layout.wrap(font, "中文abc", 1)
+    assert lines == ("中", "文", "a", "b", "c")
+    assert layout.wrap(font, "中文abc", 1) is lines   # 命中缓存返回同一对象
+
+
+def test_width_matches_font_size(fonts):
+    layout = TextLayout()
+    for font in fonts:
+        for text in TEXTS:
+            assert layout.width(font, text) == font.size(text)[0]
+            assert layout.width(font, text) == font.size(text)[0]
@@ -0,0 +1,111 @@
+import zlib
+
+import pytest
+
+from game.replay import MAGIC, Replay, ReplayPlayer, ReplayRecorder, read_varints, write_varint
+
+
+@pytest.fixture
+def record_match(make_manager):
+    """工厂：随机策略打完一整局并录像，返回 (对局管理器, 胜者, 录像)"""
+    def record(seed, num_players=3):
+        gm = make_manager(num_players, seed=seed, random_seats=range(num_players))
+        recorder = ReplayRecorder(gm)
+        recorder.begin(seed)
+        winners = gm.play_match()
+        recorder.stop()
+        return gm, winners, recorder.replay()
+
+    return record
+
+
+def fingerprint(gm):
+    return (
+        [(tuple(c.number for c in p.hand), tuple((c.number, c.points) for c in p.battlefield_cards),
+          tuple((c.number, c.points) for c in p.isolated_cards), p.score, p.wins) for p in gm.players],
+        dict(gm.small_rounds_won), gm.current_round, gm.current_player_index,
+    )
+
+
+def test_varint_round_trip():
+    values = [0, 1, 127, 128, 300, 2 ** 32, 2 ** 64 - 1]
+    buf = bytearray()
+    for v in values:
+        write_varint(buf, v)
+    assert read_varints(buf) == values
+    with pytest.raises(ValueError):
+        write_varint(bytearray(), -1)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 7, 42, 2 ** 40])
+@pytest.mark.parametrize("num_players", [2, 4])
+def test_encode_decode_replay_same_result(record_match, seed, num_players):
+    gm, winners, replay = record_match(seed, num_players)
+    decoded = Replay.from_bytes(replay.to_bytes())
+    assert (decoded.seed, decoded.names, decoded.total_rounds, decoded.composition) == \
+        (replay.seed, replay.names, replay.total_rounds, replay.composition)
+    assert decoded.records == replay.records
+
+    player = ReplayPlayer(decoded)
+    assert sorted(player.run()) == sorted(winners)
+    assert player.manager.small_rounds_won == gm.small_rounds_won
+    assert [p.score for p in player.manager.players] == [p.score for p in gm.players]
+    assert player.turn == decoded.turn_count()
+
+
+def test_save_and_load(record_match, tmp_path):
+    _, winners, replay = record_match(3)
+    path = tmp_path / "match.rkr"
+    replay.save(path)
+    assert sorted(ReplayPlayer(Replay.load(path)).run()) == sorted(winners)
+
+
+def test_seek_matches_stepping(record_match):
+    _, _, replay = record_match(11, 4)
+    total = replay.turn_count()
+    reference = ReplayPlayer(replay)
+    states = [fingerprint(reference.manager)]
+    while reference.step():
+        states.append(fingerprint(reference.manager))
+
+    player = ReplayPlayer(replay, checkpoint_interval=8)
+    player.run()
+    for turn in (0, total // 2, 3, total - 1, 17, total, 1):
+        assert player.seek(turn) == turn
+        assert fingerprint(player.manager) == states[turn]
+    assert player.seek(total + 10) == total
+
+
+def test_bad_magic():
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"NOPE" + b"\x00" * 10)
+
+
+def test_truncated_file(record_match):
+    _, _, replay = record_match(5)
+    blob = replay.to_bytes()
+    for cut in (len(MAGIC) + 1, len(blob) // 2, len(blob) - 1):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(blob[:cut])
+
+
+def test_corrupt_file(record_match):
+    _, _, replay = record_match(5)
+    blob = bytearray(replay.to_bytes())
+    blob[len(blob) // 2] ^= 0xFF
+    with pytest.raises(ValueError):
+        Replay.from_bytes(bytes(blob))
+
+
+def test_truncated_header():
+    with pytest.raises(ValueError):
+        Replay.from_bytes(MAGIC + zlib.compress(bytes([1, 5, 3, 2, 10, 65])))
+
+
+def test_truncated_records(record_match):
+    _, _, replay = record_match(9)
+    cut = Replay(replay.seed, replay.names, replay.total_rounds, replay.composition,
+                 replay.records[:len(replay.records) // 2])
+    player = ReplayPlayer(Replay.from_bytes(cut.to_bytes()))
+    with pytest.raises(ValueError):
+        player.run()
@@ -0,0 +1,62 @@
+import copy
+from collections import Counter
+
+import pytest
+
+from game.simulator import SimulationResult, _run_chunk, simulate
+
+
+def chunk(seed, n_games=5, num_players=3):
+    return _run_chunk((n_games, num_players, 3, seed, None))
+
+
+def test_workers_do_not_change_results():
+    single = simulate(24, num_players=3, seed=7, workers=1, chunk_size=5)
+    parallel = simulate(24, num_players=3, seed=7, workers=2, chunk_size=5)
+    assert parallel.summary() == single.summary()
+    assert single.games == 24
+
+
+def test_same_seed_same_results():
+    first = simulate(12, num_players=2, seed=3, workers=1, chunk_size=4)
+    again = simulate(12, num_players=2, seed=3, workers=1, chunk_size=4)
+    other = simulate(12, num_players=2, seed=4, workers=1, chunk_size=4)
+    assert first.summary() == again.summary()
+    assert first.summary() != other.summary()
+
+
+def test_merge_adds_up():
+    parts = [chunk(seed) for seed in (1, 2, 3)]
+    merged = SimulationResult(3)
+    for part in parts:
+        merged.merge(part)
+    assert merged.games == sum(p.games for p in parts) == 15
+    assert merged.small_rounds == sum(p.small_rounds for p in parts)
+    assert merged.turns == sum(p.turns for p in parts)
+    assert merged.card_plays == dict(sum((Counter(p.card_plays) for p in parts), Counter()))
+    assert merged.card_scored == dict(sum((Counter(p.card_scored) for p in parts), Counter()))
+    assert merged.round_length_hist == dict(sum((Counter(p.round_length_hist) for p in parts), Counter()))
+    assert sum(merged.round_length_hist.values()) == merged.small_rounds
+    assert sum(k * v for k, v in merged.round_length_hist.items()) == merged.turns
+    assert sum(merged.seat_wins) == pytest.approx(merged.games)
+
+
+def test_merge_is_associative():
+    a, b, c = (chunk(seed) for seed in (10, 11, 12))
+    left = copy.deepcopy(a).merge(b).merge(c)
+    right = copy.deepcopy(a).merge(copy.deepcopy(b).merge(c))
+    assert left.seat_wins == pytest.approx(right.seat_wins)
+    for attr in ("games", "small_rounds", "turns", "card_plays", "card_points", "card_scored",
+                 "round_length_hist"):
+        assert getattr(left, attr) == getattr(right, attr)
+
+
+def test_merge_with_empty_is_identity():
+    a = chunk(5)
+    before = a.summary()
+    assert a.merge(SimulationResult(3)).summary() == before
+
+
+def test_rejects_bad_player_count():
+    with pytest.raises(ValueError):
+        simulate(1, num_players=5, workers=1)
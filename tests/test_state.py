@@ -0,0 +1,37 @@
+from game.controller import RandomController
+from game.mcts import MCTSController
+
+
+def fingerprint(gm):
+    return (
+        [(tuple(c.number for c in p.hand), tuple((c.number, c.points) for c in p.battlefield_cards),
+          tuple(c.number for c in p.isolated_cards), p.score, p.wins) for p in gm.players],
+        gm.current_player_index, gm.current_round, gm.deck.get_state(),
+    )
+
+
+def test_restore_is_exact(make_manager):
+    gm = make_manager(3, seed=1, random_seats=(1, 2), start=True)
+    state = gm.snapshot()
+    before = fingerprint(gm)
+    rng_next = gm.rng.random()
+    policy_next = gm.policy_rng.random()
+    gm.restore(state)
+    gm.set_controller(0, RandomController())
+    gm.play_match()
+    gm.restore(state)
+    assert fingerprint(gm) == before
+    assert gm.rng.random() == rng_next
+    assert gm.policy_rng.random() == policy_next
+
+
+def test_search_does_not_disturb_policy_rng(make_manager):
+    # 全部是“先抽再弃”：推演中随机控制器座位会用 policy_rng 选择弃牌
+    gm = make_manager(3, seed=2, composition={17: 60}, random_seats=(1, 2), start=True)
+    state = gm.snapshot()
+    expected = gm.policy_rng.random()
+    gm.restore(state)
+    before = fingerprint(gm)
+    MCTSController(iterations=50, seed=0).choose_action(gm, gm.current_player)
+    assert fingerprint(gm) == before
+    assert gm.policy_rng.random() == expected
@@ -0,0 +1,137 @@
+import copy
+import pickle
+
+from game.card import Card
+from game.player import Player
+from game.zone import Zone
+
+
+def zones_of(card):
+    """卡牌登记的牌区（按身份比较：Zone 继承 list 的 ==）"""
+    zones = card.zones if type(card.zones) is list else [card.zones]
+    return [id(z) for z in zones]
+
+
+def make_cards(*points):
+    return [Card(f"牌{i}", p, number=i) for i, p in enumerate(points)]
+
+
+def test_total_tracks_changes():
+    a, b, c = make_cards(3, 5, 7)
+    zone = Zone([a, b], name="hand")
+    assert zone.total == 8 and a.zones is zone
+    zone.append(c)
+    b.add_points(2)
+    assert zone.total == 17
+    zone.remove(a)
+    assert zone.total == 14 and a.zones is None
+    zone[:] = [a]
+    assert zone.total == 3 and b.zones is None and c.zones is None
+
+
+def test_version_changes_on_every_mutation():
+    a, b = make_cards(1, 2)
+    zone = Zone(name="hand")
+    seen = [zone.version]
+
+    def changed():
+        assert zone.version not in seen
+        seen.append(zone.version)
+
+    for op in (lambda: zone.append(a), lambda: zone.insert(0, b), lambda: a.add_points(3),
+               lambda: zone.sort(key=lambda c: c.points), lambda: zone.reverse(), lambda: zone.touch(a),
+               lambda: zone.pop(), lambda: zone.clear()):
+        op()
+        changed()
+    before = zone.version
+    a.add_points(0)
+    zone[:] = []   # 内容没变
+    assert zone.version == before
+
+
+def test_versions_unique_across_zones():
+    assert len({Zone().version for _ in range(100)}) == 100
+
+
+def test_listeners():
+    a, b = make_cards(1, 2)
+    zone = Zone([a], name="battlefield")
+    events = []
+
+    def listener(z, op, card):
+        events.append((z.name, op, card))
+
+    zone.subscribe(listener)
+    zone.subscribe(listener)   # 重复订阅只算一次
+    zone.append(b)
+    b.add_points(1)
+    zone.sort(key=lambda c: c.points)
+    zone.touch(a)
+    zone.remove(a)
+    zone.clear()
+    assert events == [("battlefield", "add", b), ("battlefield", "points", b), ("battlefield", "update", None),
+                      ("battlefield", "update", a), ("battlefield", "remove", a), ("battlefield", "remove", b)]
+    zone.unsubscribe(listener)
+    zone.append(a)
+    assert len(events) == 6
+
+
+def test_card_in_two_zones():
+    (a,) = make_cards(4)
+    hand, isolated = Zone([a]), Zone([a])
+    assert zones_of(a) == [id(hand), id(isolated)]
+    a.add_points(1)
+    assert hand.total == isolated.total == 5
+    hand.remove(a)
+    assert a.zones is isolated
+
+
+def test_copy_does_not_register_cards():
+    a, b = make_cards(1, 2)
+    zone = Zone([a, b], name="hand")
+    shallow = copy.copy(zone)
+    assert shallow == [a, b] and type(shallow) is list
+    assert a.zones is zone and b.zones is zone
+    a.add_points(1)
+    assert zone.total == 4
+
+
+def test_deepcopy_registers_new_cards():
+    a, b = make_cards(1, 2)
+    zone = Zone([a, b], name="hand")
+    zone.subscribe(lambda *args: None)
+    clone = copy.deepcopy(zone)
+    assert type(clone) is Zone and clone.name == "hand" and clone.listeners == ()
+    assert [c.points for c in clone] == [1, 2] and clone[0] is not a
+    assert a.zones is zone and clone[0].zones is clone
+    clone[0].add_points(5)
+    assert clone.total == 8 and zone.total == 3
+
+
+def test_deepcopy_player_keeps_shared_cards_shared():
+    p = Player("P", 0)
+    a, b = make_cards(1, 2)
+    p.hand.extend([a, b])
+    p.isolated_cards.append(a)
+    q = copy.deepcopy(p)
+    qa = q.hand[0]
+    assert q.isolated_cards[0] is qa and zones_of(qa) == [id(q.hand), id(q.isolated_cards)]
+    qa.add_points(10)
+    assert q.hand.total == 13 and q.isolated_cards.total == 11
+    assert p.hand.total == 3 and zones_of(a) == [id(p.hand), id(p.isolated_cards)]
+
+
+def test_pickle_round_trip():
+    p = Player("P", 0)
+    a, b, c = make_cards(1, 2, 3)
+    p.hand.extend([a, b])
+    p.battlefield_cards.append(c)
+    p.isolated_cards.append(a)
+    p.hand.subscribe(print)
+    q = pickle.loads(pickle.dumps(p))
+    assert [x.points for x in q.hand] == [1, 2] and q.hand.name == "hand"
+    assert q.hand.listeners == ()
+    assert q.board_points == p.board_points == 4
+    qa = q.hand[0]
+    assert q.isolated_cards[0] is qa and zones_of(qa) == [id(q.hand), id(q.isolated_cards)]
+    assert zones_of(a) == [id(p.hand), id(p.isolated_cards)]
@@ -1,11 +1,23 @@
 import pygame
 import os
 import sys
+import time
 from typing import Optional, Dict, Any, List, Tuple, cast
 from game.player import Player
 from game.card import Card
 from game.game_manager import GameManager
+from game.events import PLAY_EVENTS
 from ui.constants import *
+from ui.assets import ASSETS_LOADED, AssetManager
+from ui.fonts import FONTS_LOADED, FontRegistry
+from ui.log_store import LogStore
+from ui.layout import ZONES, HitIndex, LayoutCache, PlayerLayout
+from ui.profiler import FrameProfiler
+from ui.render_cache import LRUCache, TextCache, TextLayout
+
+# 签名比较用的占位对象（组件在上一帧不存在）
+_MISSING = object()
+
 
 class PygameUI:
     # 类级默认值用于静态检查（实例会在 __init__ 中覆盖）
@@ -21,29 +33,33 @@ class PygameUI:
     fixed_card_width: Optional[int]
     card_bg: Optional[pygame.Surface]
     card_bg_scaled: Optional[pygame.Surface]
-    logs: List[str]
+    logs: LogStore
     max_logs: int
-    def __init__(self):
+    def __init__(self, defer_loading: bool = False):
+        """
+        :param defer_loading: 为 True 时图片解码与字体解析在后台线程进行、背景音乐留给 load_music，
+            构造函数立即返回，第一帧先用纯色占位与内置字体（main.py 以此缩短启动到首帧的时间）
+        """
+        start = time.perf_counter()
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # main.py 可能已经先打开了窗口：尺寸相同时直接沿用
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != (WINDOW_WIDTH, WINDOW_HEIGHT):
+            screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = screen
         pygame.display.set_caption("萝卜昆特牌")
 
         # 选择更稳妥的中文字体（带回退列表），确保宽度测量与渲染一致
-        font_candidates = [
-            "Microsoft YaHei UI",
-            "Microsoft YaHei",
-            "SimHei",
-            "msyh",
-            "Arial Unicode MS",
-        ]
-        self.font = pygame.font.SysFont(font_candidates, 24)
-        self.small_font = pygame.font.SysFont(font_candidates, 16)
-        self.player_info_font = pygame.font.SysFont(font_candidates, 20)  # 玩家信息专用字体
-        # 背景水印字号放大以增强区域辨识度
-        self.wm_font = pygame.font.SysFont(font_candidates, 40)
-        # 主页大标题字体
-        self.title_font = pygame.font.SysFont(font_candidates, 72)
-        self.clock = pygame.time.Clock()
+        # 候选列表只解析一次（结果缓存在磁盘上），各字号都由同一个字体文件构造
+        font_start = time.perf_counter()
+        self.fonts = FontRegistry(FONT_CANDIDATES)
+        self.fonts_ready = False
+        if defer_loading:
+            self.fonts.preload()
+            self._set_fonts(self.fonts.default_font)
+        else:
+            self._set_fonts(self.fonts.font)
+            self.fonts_ready = True
         # 游戏状态与UI状态
         self.running = True
         self.state = "menu"
@@ -53,10 +69,21 @@ class PygameUI:
         self.enemy_list = []
         self.message = ""
         self.message_timer = 0
+        self._message_deadline = 0  # 消息过期时刻（pygame.time.get_ticks() 毫秒）
 
         # 底部日志
-        self.logs = []
+        self.logs = LogStore(LOG_CAPACITY)
         self.max_logs = 6
+        # 合成好的日志框（有新日志或窗口尺寸变化时重新合成）
+        self._log_panel = None
+        self._log_panel_key = None
+        self._log_surfaces = 0  # 日志框累计新建的 Surface 数（性能面板统计用）
+
+        # 脏矩形渲染：上一帧各组件的内容签名与屏幕区域
+        self._frame_sigs: Dict[Any, Any] = {}
+        self._bounds: Dict[Any, pygame.Rect] = {}
+        self._dirty_extra: List[pygame.Rect] = []
+        self._full_redraw = True
 
         # Manager 绑定与结束信息
         self.gm = None
@@ -68,6 +95,8 @@ class PygameUI:
         self.card_spacing = 10
         self.card_left = 150
         self.fixed_card_width = None
+        # 玩家区域布局缓存（窗口尺寸 / 卡宽 / 张数变化时重算）
+        self.layout_cache = LayoutCache(HIT_GRID_CELL)
 
         # 自适应策略：在空间不足时优先“缩小卡宽”，可选：'shrink-cards' | 'none'（预留 'grow-window' 方案）
         self.auto_fit_mode = 'shrink-cards'
@@ -76,50 +105,94 @@ class PygameUI:
         # 卡牌背景图
         self.card_bg = None
         self.card_bg_scaled = None
-        try:
-            img_path = os.path.join(os.path.dirname(__file__), "images", "card.png")
-            if os.path.exists(img_path):
-                self.card_bg = pygame.image.load(img_path).convert_alpha()
-        except Exception:
-            self.card_bg = None
-
-        # 全局背景图
+        # 合成好的卡面缓存（卡宽变化时清空）
+        self.card_faces = LRUCache(CARD_FACE_CACHE_SIZE)
+        # 文字渲染缓存（所有界面文字共用）
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        # 文字排版缓存（逐字宽度与换行结果）
+        self.text_layout = TextLayout(TEXT_LAYOUT_CACHE_SIZE)
+        # 半透明纯色遮罩缓存（禁用按钮等）
+        self.overlays = LRUCache(OVERLAY_CACHE_SIZE)
+        # 图片资源：只加载一次，缩放版本按尺寸缓存
+        self.assets = AssetManager(scaled_capacity=ASSET_SCALED_CACHE_SIZE)
+        # 帧耗时统计与性能面板（F3 切换）
+        self.profiler = FrameProfiler(PROFILER_HISTORY, alloc_counter=self._surface_allocs)
+        # 全局背景图、通用按钮背景图、标题背景图（图片就绪前为 None，绘制时用纯色占位）
         self.bg_image = None
-        self.bg_scaled = None
-        try:
-            bg_path = os.path.join(os.path.dirname(__file__), "images", "Background.png")
-            if os.path.exists(bg_path):
-                self.bg_image = pygame.image.load(bg_path).convert()
-        except Exception:
-            self.bg_image = None
-
-        # 通用按钮背景图
         self.btn_image = None
-        try:
-            btn_path = os.path.join(os.path.dirname(__file__), "images", "botton.png")
-            if os.path.exists(btn_path):
-                self.btn_image = pygame.image.load(btn_path).convert_alpha()
-        except Exception:
-            self.btn_image = None
-
-        # 标题背景图（主页大标题横幅）
         self.title_image = None
-        try:
-            title_dir = os.path.join(os.path.dirname(__file__), "images")
-            for name in ("title.png", "title.jpg", "title.jpeg"):
-                p = os.path.join(title_dir, name)
-                if os.path.exists(p):
-                    # png 用 alpha，jpg 用 convert
-                    if name.endswith(".png"):
-                        self.title_image = pygame.image.load(p).convert_alpha()
-                    else:
-                        self.title_image = pygame.image.load(p).convert()
-                    break
-        except Exception:
-            self.title_image = None
+        self.assets_ready = False
+        # 启动各阶段耗时（秒），main.py --startup-timing 时打印
+        self.startup_timings: Dict[str, float] = {"fonts": time.perf_counter() - font_start}
 
         # 背景音乐
         self.music_loaded = False
+        if defer_loading:
+            self.assets.preload(STARTUP_IMAGES)
+        else:
+            self._apply_assets()
+            self.load_music()
+
+        # 悬停提示（技能说明）
+        self.hover_card = None            # 当前鼠标悬停的卡牌
+        self.hover_start_ms = 0           # 开始悬停的时间戳（ms）
+        self.hover_delay_ms = 600         # 悬停多少毫秒后显示提示
+        self.mouse_pos = (0, 0)           # 记录鼠标位置用于提示框定位
+    
+        self.startup_timings["ui_init"] = time.perf_counter() - start
+
+    def _set_fonts(self, make_font) -> None:
+        """按各用途字号创建界面字体（make_font(size) -> Font）"""
+        self.font = make_font(24)
+        self.small_font = make_font(16)
+        self.player_info_font = make_font(20)  # 玩家信息专用字体
+        # 背景水印字号放大以增强区域辨识度
+        self.wm_font = make_font(40)
+        # 主页大标题字体
+        self.title_font = make_font(72)
+
+    def _apply_fonts(self) -> None:
+        """换上解析好的中文字体（必要时等待后台解析）；只执行一次，之后重新测量卡宽并整屏重绘"""
+        if self.fonts_ready:
+            return
+        self.fonts_ready = True
+        self.fonts.wait()
+        self._set_fonts(self.fonts.font)
+        # 用占位字体渲染 / 测量的结果作废
+        for entry in self.logs:
+            entry.surface = None
+        self._log_panel_key = None
+        if self.fixed_card_width is not None:
+            self.fix_card_width_for_round()
+        self.invalidate()
+
+    def _apply_assets(self):
+        """取出（必要时等待）启动图片并换上；只执行一次，之后整屏重绘"""
+        if self.assets_ready:
+            return
+        start = time.perf_counter()
+        self.assets_ready = True
+        self.card_bg = self.assets.image(CARD_IMAGE)
+        self.bg_image = self.assets.image(BACKGROUND_IMAGE)
+        # 界面上的按钮尺寸固定，预先缩放并打包进图集
+        self.btn_image = self.assets.image(BUTTON_IMAGE)
+        if ASSET_ATLAS:
+            self.assets.pack_atlas([(BUTTON_IMAGE, size) for size in BUTTON_SIZES])
+        # 主页大标题横幅
+        self.title_image = self.assets.first_image(*TITLE_IMAGES)
+        if self.fixed_card_width:
+            self._update_card_bg_scaled()
+        self.invalidate()
+        self.startup_timings["assets"] = time.perf_counter() - start
+
+    def wait_for_assets(self):
+        """阻塞直到启动图片与字体全部就绪（例如截图 / 基准测试前需要完整画面时）"""
+        self._apply_fonts()
+        self._apply_assets()
+
+    def load_music(self) -> bool:
+        """加载背景音乐，返回是否成功（文件不存在时静默跳过）"""
+        start = time.perf_counter()
         try:
             # 音乐文件路径，待替换为实际音乐文件路径
             music_path = os.path.join(os.path.dirname(__file__), "music", "background.mp3")
@@ -128,13 +201,28 @@ class PygameUI:
                 self.music_loaded = True
         except Exception as e:
             print(f"无法加载音乐: {e}")
+        self.startup_timings["music"] = time.perf_counter() - start
+        return self.music_loaded
+
+    def _surface_allocs(self) -> int:
+        """累计新建的 Surface 数：各渲染缓存每次未命中都会生成一个 Surface"""
+        return (self.card_faces.misses + self.text_cache.misses + self.assets.scaled.misses
+                + self.overlays.misses + self._log_surfaces)
+
+    def _overlay(self, size: Tuple[int, int], rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+        """尺寸为 size、填充 rgba 的半透明 Surface（经遮罩缓存；返回共享对象，不要修改）"""
+        key = (size, rgba)
+        surf = self.overlays.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            surf.fill(rgba)
+            self.overlays.put(key, surf)
+        return surf
+
+    def _text(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int], alpha: Optional[int] = None) -> pygame.Surface:
+        """渲染文字（抗锯齿，经文字缓存；返回的 Surface 为共享对象，不要修改）"""
+        return self.text_cache.render(font, text, True, color, alpha)
 
-        # 悬停提示（技能说明）
-        self.hover_card = None            # 当前鼠标悬停的卡牌
-        self.hover_start_ms = 0           # 开始悬停的时间戳（ms）
-        self.hover_delay_ms = 600         # 悬停多少毫秒后显示提示
-        self.mouse_pos = (0, 0)           # 记录鼠标位置用于提示框定位
-    
     def _build_card_rects(self, cards: List[Card], y: int, x_left: Optional[int] = None) -> List[pygame.Rect]:
         """根据固定卡宽生成等宽矩形；若未固定，则按全卡池计算一次固定卡宽。
         :param x_left: 覆盖默认的卡牌起始 X（用于三人布局的分区内绘制）
@@ -181,13 +269,12 @@ class PygameUI:
         self._ensure_fixed_card_width()
 
     def _update_card_bg_scaled(self) -> None:
-        """根据当前固定卡宽与卡高，缩放卡牌背景图。"""
+        """根据当前固定卡宽与卡高，缩放卡牌背景图（缓存的卡面与布局随之失效）。"""
+        self.card_faces.clear()
+        self.layout_cache.invalidate()
         if self.card_bg and self.fixed_card_width:
-            try:
-                size = (int(self.fixed_card_width), int(self.card_height))
-                self.card_bg_scaled = pygame.transform.smoothscale(self.card_bg, size)
-            except Exception:
-                self.card_bg_scaled = None
+            size = (int(self.fixed_card_width), int(self.card_height))
+            self.card_bg_scaled = self.assets.scaled_image(CARD_IMAGE, size)
         else:
             self.card_bg_scaled = None
 
@@ -206,12 +293,12 @@ class PygameUI:
             pass
         # 重新设置窗口尺寸
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        # 清空已缓存的缩放背景以便重算
-        self.bg_scaled = None
+        self.layout_cache.invalidate()
+        self.invalidate()
 
     def compute_live_score(self, player: Player) -> int:
-        """实时计算玩家当前分数（战场+孤立区点数和）。"""
-        return sum(c.points for c in player.battlefield_cards + player.isolated_cards)
+        """实时分数（战场+孤立区点数和，由牌区维护的合计直接读取）。"""
+        return player.board_points
 
     def _get_player_area(self, player: Player, total_h: int) -> Tuple[pygame.Rect, int, int, int, int]:
         """根据玩家数量返回该玩家的区域矩形与绘制参数。
@@ -329,32 +416,106 @@ class PygameUI:
             area_rect = pygame.Rect(140, base_y - 30, WINDOW_WIDTH - 280, area_height)
             return area_rect, base_y, 140, WINDOW_WIDTH - 140, 150
 
+    def _build_player_layout(self, player: Player) -> PlayerLayout:
+        """计算单个玩家的区域与各区域卡牌矩形（仅在布局缓存失效时调用）"""
+        gap = ZONE_MARGIN
+        h_hand, h_battle, h_iso = HAND_HEIGHT, BATTLE_HEIGHT, ISO_HEIGHT
+        total_h = h_hand + h_battle + h_iso + gap * 2
+        area_rect, base_y, x1, x2, cards_x_left = self._get_player_area(player, total_h)
+        zone_y = {
+            "hand": base_y,
+            "battlefield": base_y + h_hand + gap,
+            "isolated": base_y + h_hand + gap + h_battle + gap,
+        }
+        card_rects = {z: self._build_card_rects(self._zone_cards(player, z), zone_y[z], x_left=cards_x_left) for z in ZONES}
+        return PlayerLayout(area_rect, base_y, x1, x2, cards_x_left, zone_y, card_rects)
+
+    def player_layout(self, player: Player) -> PlayerLayout:
+        """取玩家的布局几何（经布局缓存）"""
+        players = self.gm.players if self.gm else [player]
+        with self.profiler.phase("layout"):
+            layouts = self.layout_cache.get(players, self._build_player_layout)
+        lay = layouts.get(player.index)
+        return lay if lay is not None else self._build_player_layout(player)
+
+    def hit_index(self, player: Optional[Player] = None) -> HitIndex:
+        """取当前布局的点击 / 悬停空间索引（无对局管理器时只索引 player）"""
+        players = self.gm.players if self.gm else [player]
+        with self.profiler.phase("layout"):
+            return self.layout_cache.hit_index(players, self._build_player_layout)
 
     def set_manager(self, gm: GameManager) -> None:
-        """设置游戏管理器"""
+        """设置游戏管理器，并订阅其出牌过程事件写入日志框"""
+        old = getattr(self, 'gm', None)
+        if old is not None:
+            old.events.unsubscribe(self._on_game_event)
         self.gm = gm
+        self.layout_cache.invalidate()
+        gm.events.subscribe(self._on_game_event, *PLAY_EVENTS)
+
+    def _on_game_event(self, event) -> None:
+        """事件总线订阅者：把出牌 / 技能事件格式化后写入日志框"""
+        self.add_log(event.format())
+
+    def play_replay(self, player, speed: float = 1.0) -> List[str]:
+        """
+        在界面中回放录像
+        按键：空格 暂停/继续，↑/↓ 加速/减速，←/→ 后退/前进一回合
+        :param player: game.replay.ReplayPlayer
+        :param speed: 初始回放速度（1 倍速每回合 REPLAY_TURN_MS 毫秒）
+        :return: 大局胜者名字列表
+        """
+        self.set_manager(player.manager)
+        self.state = "game"
+        paused = False
+        last_round = None
+        next_turn_ms = pygame.time.get_ticks()
+        while self.running:
+            # 暂停或已播完时没有定时推进，只等待按键
+            deadline = None if paused or player.finished else next_turn_ms
+            for event in self.wait_events(deadline=deadline):
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_UP:
+                        speed = min(speed * 2, REPLAY_MAX_SPEED)
+                    elif event.key == pygame.K_DOWN:
+                        speed = max(speed / 2, REPLAY_MIN_SPEED)
+                    elif event.key == pygame.K_LEFT:
+                        player.seek(player.turn - 1)
+                    elif event.key == pygame.K_RIGHT:
+                        player.seek(player.turn + 1)
+                    state_text = "（暂停）" if paused else ""
+                    self.show_message(f"回放 第 {player.turn} 回合  速度 x{speed:g}{state_text}", 1500)
+
+            now = pygame.time.get_ticks()
+            if not paused and not player.finished and now >= next_turn_ms:
+                player.step()
+                next_turn_ms = now + int(REPLAY_TURN_MS / speed)
+            if player.manager.current_round != last_round:
+                last_round = player.manager.current_round
+                self.fix_card_width_for_round()
+            if player.finished and not paused:
+                break
+        return player.manager.show_winner()
 
     def show_message(self, text: str, duration: int = 2000) -> None:
         """显示消息"""
         self.message = text
         self.message_timer = duration
+        self._message_deadline = pygame.time.get_ticks() + duration
 
     def add_log(self, text: str) -> None:
         """追加一条日志到底部日志框。"""
         if not isinstance(text, str):
             text = str(text)
         self.logs.append(text)
-        if len(self.logs) > 200:
-            # 控制日志总量
-            self.logs = self.logs[-200:]
 
     def select_card(self, player: Player) -> Optional[Card]:
         """等待玩家选择卡牌"""
         self.selected_card = None
         while self.running and self.selected_card is None:
             self.handle_events()
-            self.draw_game()
-            self.clock.tick(30)
         card = self.selected_card
         self.selected_card = None
         return card
@@ -376,20 +537,32 @@ class PygameUI:
 
         # 放在更靠左的位置，避免与“出牌/结束回合”按钮重叠
         confirm_rect = pygame.Rect(WINDOW_WIDTH - 450, WINDOW_HEIGHT - 60, 120, 40)
+        overlay_rect = pygame.Rect(0, WINDOW_HEIGHT - 90, WINDOW_WIDTH, 90)
+
+        def draw_with_overlay() -> None:
+            # 绘制界面（按钮与已选高亮）；确认按钮与已选列表叠加在日志框上，每次都重画这块区域
+            self.invalidate(overlay_rect)
+            drawn = self.draw_game(present=False) or overlay_rect
+            # 绘制确认按钮（覆盖在底部日志上层）
+            self._draw_btn(confirm_rect, "确认", enabled=(len(chosen) == count))
+
+            # 在当前玩家手牌中高亮已选卡牌
+            # 这里不直接改 card.highlight，避免干扰 hover；只在按钮旁边列出已选
+            if chosen:
+                names = ", ".join(c.name for c in chosen)
+                info = self._text(self.small_font, f"已选：{names}", COLOR_TEXT)
+                self.screen.blit(info, (confirm_rect.x - 260, confirm_rect.y + 10))
+
+            pygame.display.update(drawn.union(overlay_rect))
+
         while self.running:
             # 提示文案
             remain = max(0, count - len(chosen))
             tip = f"{prompt}（还需选择 {remain} 张）"
             self.show_message(tip)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.MOUSEMOTION:
-                    self.handle_mouse_motion(event.pos)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+            for event in self.wait_events(redraw=draw_with_overlay):
+                if event.type == pygame.MOUSEBUTTONDOWN:
                     x, y = event.pos
                     # 选择/取消选择手牌
                     card = self.check_click_card(player, x, y, "hand")
@@ -410,21 +583,6 @@ class PygameUI:
                         self.show_message("")
                         return chosen
 
-            # 绘制界面（按钮与已选高亮）
-            self.draw_game()
-            # 绘制确认按钮（覆盖在底部日志上层）
-            self._draw_btn(confirm_rect, "确认", enabled=(len(chosen) == count))
-
-            # 在当前玩家手牌中高亮已选卡牌
-            # 这里不直接改 card.highlight，避免干扰 hover；只在按钮旁边列出已选
-            if chosen:
-                names = ", ".join(c.name for c in chosen)
-                info = self.small_font.render(f"已选：{names}", True, COLOR_TEXT)
-                self.screen.blit(info, (confirm_rect.x - 260, confirm_rect.y + 10))
-
-            pygame.display.flip()
-            self.clock.tick(30)
-
         # 退出时恢复现场
         self.selected_card = prev_selected
         self.target_list = prev_targets
@@ -463,15 +621,8 @@ class PygameUI:
                 ui_message += "\n点击[出牌]按钮确认出牌"
                 self.show_message(ui_message)
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.MOUSEMOTION:
-                    # 更新悬停状态以支持提示
-                    self.handle_mouse_motion(event.pos)
-                elif event.type == pygame.MOUSEBUTTONDOWN:
+            for event in self.wait_events():
+                if event.type == pygame.MOUSEBUTTONDOWN:
                     x, y = event.pos
 
                     # 1) 当前玩家手牌点击：选择/切换/取消
@@ -578,22 +729,55 @@ class PygameUI:
                         waiting = False
                         break
 
-            self.draw_game()
-            self.clock.tick(30)
-
         # 重置选择状态
         self.selected_card = None
         self.target_list = []
         self.enemy_list = []
         return result
 
+    def wait_for_targets(self, player: Player, result: Dict[str, Any]) -> Dict[str, Any]:
+        """出牌时若尚未选好目标卡牌/敌方玩家，阻塞等待玩家补选，返回补全后的行动结果。"""
+        card = result["card"]
+        # 直接使用 UI 返回的选择（防止被重置而丢失）
+        targets = result.get("targets", [])
+        enemies = result.get("enemies", [])
+        needs_target = card.requires_target and not targets
+        needs_enemy = card.requires_enemy and not enemies
+        if not needs_target and not needs_enemy:
+            return result
+
+        message = []
+        if needs_target:
+            message.append("选择目标卡牌")
+        if needs_enemy:
+            message.append("选择敌方玩家")
+        self.show_message(f"{player.name} 请{' 和 '.join(message)}！")
+
+        while (needs_target or needs_enemy) and self.running:
+            self.handle_events()   # 刷新 UI 并等待、处理玩家操作
+
+            if needs_enemy and self.enemy_list:
+                enemies = self.enemy_list
+                needs_enemy = False
+
+            if needs_target and self.target_list:
+                targets = self.target_list
+                needs_target = False
+
+        return {**result, "targets": targets, "enemies": enemies}
+
+    def quit(self) -> None:
+        """关闭窗口时退出程序：先关闭日志文件，保证最后的日志已写入磁盘"""
+        self.running = False
+        self.logs.close()
+        pygame.quit()
+        sys.exit()
+
     def player_end_turn(self, player: Player) -> bool:
         """检查玩家是否结束回合"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                self.running = False
-                pygame.quit()
-                sys.exit()
+                self.quit()
             elif event.type == pygame.MOUSEMOTION:
                 # 更新悬停提示
                 self.handle_mouse_motion(event.pos)
@@ -609,14 +793,58 @@ class PygameUI:
         
         return False
 
+    # ------------------ 事件调度 ------------------
+    def _next_timer_ms(self, deadline: Optional[int] = None) -> Optional[int]:
+        """距最近一个待触发定时器（消息过期、悬停提示延迟、调用方给定的时刻）的毫秒数，没有定时器时返回 None"""
+        due = []
+        if self.message_timer > 0:
+            due.append(self._message_deadline)
+        if self.hover_card and self.hover_start_ms and not self._tooltip_visible():
+            due.append(self.hover_start_ms + self.hover_delay_ms)
+        if deadline is not None:
+            due.append(deadline)
+        if self.profiler.enabled:
+            # 性能面板打开时定期刷新（FPS 等数据随时间变化）
+            due.append(pygame.time.get_ticks() + PROFILER_HUD_REFRESH_MS)
+        if not due:
+            return None
+        # event.wait(0) 表示无限等待，已到期的定时器至少等 1 毫秒
+        return max(1, min(due) - pygame.time.get_ticks())
+
+    def wait_events(self, deadline: Optional[int] = None, redraw=None):
+        """
+        统一的事件调度器：刷新有变化的界面区域后阻塞在 pygame.event.wait 上，
+        直到有输入事件或最近的定时器到期，空闲时不占用 CPU
+        退出、鼠标悬停、性能面板开关（F3）与后台图片加载完成在这里统一处理，其余事件逐个产出给调用方；
+        调用方中途 return / break 时，队列里剩余的事件留给下一次调度
+        :param deadline: 额外的唤醒时刻（pygame.time.get_ticks() 毫秒），例如回放的下一回合
+        :param redraw: 替代 draw_game 的绘制函数（界面上有叠加层时使用）
+        """
+        (redraw or self.draw_game)()
+        timeout = self._next_timer_ms(deadline)
+        event = pygame.event.wait(timeout) if timeout is not None else pygame.event.wait()
+        with self.profiler.phase("events"):
+            while event.type != pygame.NOEVENT:
+                if event.type == pygame.QUIT:
+                    self.quit()
+                elif event.type == pygame.MOUSEMOTION:
+                    if self.state == "game":
+                        self.handle_mouse_motion(event.pos)
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.type == ASSETS_LOADED:
+                    self._apply_assets()
+                elif event.type == FONTS_LOADED:
+                    self._apply_fonts()
+                else:
+                    yield event
+                # 一次唤醒把已排队的事件都处理完，再统一重绘
+                event = pygame.event.poll()
+
     def handle_events(self) -> None:
-        """处理所有事件"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+        """等待并处理一批事件（菜单 / 结束界面的主循环与各等待循环共用）"""
+        for event in self.wait_events():
+            if event.type == pygame.MOUSEBUTTONDOWN:
                 x, y = event.pos
                 if self.state == "menu":
                     self.handle_menu_click(x, y)
@@ -624,20 +852,16 @@ class PygameUI:
                     self.handle_game_click(x, y)
                 elif self.state == "game_over":
                     self.handle_game_over_click(x, y)
-            elif event.type == pygame.MOUSEMOTION and self.state == "game":
-                self.handle_mouse_motion(event.pos)
 
     def _get_card_under_mouse(self, x: int, y: int) -> Optional[Card]:
         """返回鼠标下的卡牌（任意玩家任意区域），若无则返回 None。"""
         if not self.gm:
             return None
-        for player in self.gm.players:
-            # 依次检查手牌/战场/孤立
-            for zone in ("hand", "battlefield", "isolated"):
-                card = self.check_click_card(player, x, y, zone)
-                if card:
-                    return card
-        return None
+        hit = self.hit_index().card_at(x, y)
+        if hit is None:
+            return None
+        player, zone, i = hit
+        return self._zone_cards(player, zone)[i]
 
     def _get_card_rect(self, card: Card) -> Optional[pygame.Rect]:
         """获取某张卡牌当前屏幕上的矩形（查找所有玩家与区域）。"""
@@ -668,13 +892,15 @@ class PygameUI:
                 lines.append(f"【{getattr(s, 'name', s.__class__.__name__)}】无技能说明")
         return lines
 
+    def _tooltip_visible(self) -> bool:
+        """悬停是否已达到显示提示框的延迟"""
+        if not self.hover_card or self.hover_start_ms == 0:
+            return False
+        return pygame.time.get_ticks() - self.hover_start_ms >= self.hover_delay_ms
+
     def _draw_tooltip(self) -> None:
         """在需要时绘制悬停提示框。"""
-        if not self.hover_card:
-            return
-        # 是否达到延迟
-        now = pygame.time.get_ticks()
-        if self.hover_start_ms == 0 or now - self.hover_start_ms < self.hover_delay_ms:
+        if not self._tooltip_visible():
             return
 
         lines = self._collect_skill_tooltip_lines(self.hover_card)
@@ -694,8 +920,7 @@ class PygameUI:
         padding = 8
         text_w = 0
         for seg in wrapped:
-            w, _ = self.small_font.size(seg)
-            text_w = max(text_w, w)
+            text_w = max(text_w, self.text_layout.width(self.small_font, seg))
         box_w = min(max_width, text_w + padding * 2)
         box_h = padding * 2 + line_h * len(wrapped)
 
@@ -713,11 +938,12 @@ class PygameUI:
         border_color = (200, 200, 200)
         pygame.draw.rect(self.screen, bg_color, pygame.Rect(x, y, box_w, box_h))
         pygame.draw.rect(self.screen, border_color, pygame.Rect(x, y, box_w, box_h), 1)
+        self._bounds["tooltip"] = pygame.Rect(x, y, box_w, box_h)
 
         # 绘制文本
         ty = y + padding
         for seg in wrapped:
-            surf = self.small_font.render(seg, True, (255, 255, 255))  # 白色字体
+            surf = self._text(self.small_font, seg, (255, 255, 255))  # 白色字体
             self.screen.blit(surf, (x + padding, ty))
             ty += line_h
 
@@ -835,26 +1061,100 @@ class PygameUI:
             self.hover_card = hovered_card
             self.hover_start_ms = pygame.time.get_ticks() if hovered_card else 0
         current_player = self.gm.current_player
-        for card in current_player.hand:
-            rect = self.get_card_rect_for_card(card, current_player)
-            if rect and rect.collidepoint(x, y):
-                card.highlight = True
-            else:
-                card.highlight = False
+        hit = self.hit_index().card_at(x, y, current_player, "hand")
+        hovered_index = hit[2] if hit else -1
+        hand = current_player.hand
+        changed = False
+        for i, card in enumerate(hand):
+            highlight = i == hovered_index
+            if card.highlight != highlight:
+                card.highlight = highlight
+                changed = True
+        if changed:
+            hand.touch()  # 高亮画在卡面上，手牌区需要重绘
+
+    # ------------------ 脏矩形渲染 ------------------
+    def invalidate(self, rect: Optional[pygame.Rect] = None) -> None:
+        """标记下一次 draw_game 需要重绘的区域（None 表示整屏），用于界面外部直接在屏幕上叠加绘制之后"""
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_extra.append(pygame.Rect(rect))
 
-    def draw_game(self) -> None:
-        """绘制游戏界面"""
+    def _frame_signatures(self) -> Dict[Any, Any]:
+        """
+        收集各界面组件的内容签名：签名不变的组件本帧无需重绘
+        "global" 变化（界面状态、窗口尺寸、卡宽）时整屏重绘
+        """
+        sigs: Dict[Any, Any] = {"global": (self.state, WINDOW_WIDTH, WINDOW_HEIGHT, self.fixed_card_width)}
+        if self.state == "menu":
+            sigs["menu"] = self.selected_num
+        elif self.state == "game_over":
+            standings = tuple(self.gm.small_rounds_won.items()) if self.gm else ()
+            sigs["game_over"] = (tuple(self.game_over_winners), standings)
+        elif self.state == "game" and self.gm:
+            selected = self.selected_card
+            selection = (id(selected) if selected else None,
+                         tuple(map(id, self.target_list)), tuple(map(id, self.enemy_list)))
+            current = self.gm.current_player
+            for p in self.gm.players:
+                # 牌区版本号涵盖了牌的进出、点数与悬停高亮的变化，不必逐张比较
+                sigs[("player", p.index)] = (selection, p is current, p.name, p.wins, p.zones_version)
+            sigs["log"] = self.logs.version
+            sigs["buttons"] = selected is not None
+            sigs["message"] = self.message if self.message and self.message_timer > 0 else None
+            sigs["tooltip"] = (id(self.hover_card), self.mouse_pos) if self._tooltip_visible() else None
+        if self.profiler.enabled:
+            sigs["hud"] = tuple(self.profiler.hud_lines(self._cache_hit_rates()))
+        return sigs
+
+    def draw_game(self, present: bool = True) -> Optional[pygame.Rect]:
+        """
+        绘制游戏界面：只重绘内容发生变化的组件所在区域，并只把这些区域提交到屏幕
+        :param present: 为 False 时只画到屏幕缓冲、不提交（调用方还要在上面叠加绘制）
+        :return: 本帧重绘的区域；无变化时返回 None
+        """
+        # 消息倒计时按真实时间计算（空闲时不会逐帧调用本方法）
+        if self.message_timer > 0:
+            self.message_timer = max(0, self._message_deadline - pygame.time.get_ticks())
+
+        sigs = self._frame_signatures()
+        prev = self._frame_sigs
+        screen_rect = self.screen.get_rect()
+        changed = [k for k, sig in sigs.items() if prev.get(k, _MISSING) != sig]
+        changed.extend(k for k in prev if k not in sigs)
+        if self._full_redraw or "global" in changed:
+            dirty = [screen_rect]
+        else:
+            # 组件旧位置与（已知的）新位置都要重绘；位置未知的组件整屏重绘
+            dirty = self._dirty_extra + [self._bounds.get(k, screen_rect) for k in changed]
+        self._frame_sigs = sigs
+        self._full_redraw = False
+        self._dirty_extra = []
+        if not dirty:
+            return None
+
+        clip = dirty[0].unionall(dirty[1:]).clip(screen_rect)
+        self.profiler.begin_frame()
+        self._draw_scene(clip)
+        # 组件本帧的新位置超出了裁剪区（例如提示框跟随鼠标移动）时补画一次
+        grown = clip.unionall([self._bounds[k] for k in changed if k in self._bounds]).clip(screen_rect)
+        if grown != clip:
+            clip = grown
+            self._draw_scene(clip)
+        if present:
+            with self.profiler.phase("present"):
+                pygame.display.update(clip)
+        self.profiler.end_frame()
+        return clip
+
+    def _draw_scene(self, clip: Optional[pygame.Rect] = None) -> None:
+        """在裁剪区内绘制完整画面（clip 为 None 时整屏）"""
+        self.screen.set_clip(clip)
         # 全局背景：若有图则平滑缩放铺满，否则使用纯色
-        if self.bg_image:
-            if (not self.bg_scaled) or (self.bg_scaled.get_width() != WINDOW_WIDTH or self.bg_scaled.get_height() != WINDOW_HEIGHT):
-                try:
-                    self.bg_scaled = pygame.transform.smoothscale(self.bg_image, (WINDOW_WIDTH, WINDOW_HEIGHT))
-                except Exception:
-                    self.bg_scaled = None
-            if self.bg_scaled:
-                self.screen.blit(self.bg_scaled, (0, 0))
-            else:
-                self.screen.fill(COLOR_BG)
+        bg = self.assets.scaled_image(BACKGROUND_IMAGE, (WINDOW_WIDTH, WINDOW_HEIGHT)) if self.bg_image else None
+        if bg:
+            self.screen.blit(bg, (0, 0))
         else:
             self.screen.fill(COLOR_BG)
         
@@ -862,11 +1162,14 @@ class PygameUI:
             self.draw_menu()
         elif self.state == "game" and self.gm:
             # 绘制所有玩家区域
+            prof = self.profiler
             for idx, player in enumerate(self.gm.players):
-                self.draw_player_zones(player, idx, player == self.gm.current_player)
+                with prof.phase("draw_player_zones"):
+                    self.draw_player_zones(player, idx, player == self.gm.current_player)
 
             # 先绘制底部日志框，按钮稍后再画在其上层
-            self.draw_log_panel()
+            with prof.phase("draw_log_panel"):
+                self.draw_log_panel()
 
             # 绘制出牌/结束回合按钮（在日志之上）
             play_card_rect = pygame.Rect(WINDOW_WIDTH - 300, WINDOW_HEIGHT - 60, 120, 40)
@@ -876,22 +1179,44 @@ class PygameUI:
 
             # 绘制消息
             if self.message and self.message_timer > 0:
-                msg_surface = self.font.render(self.message, True, (0, 0, 0))  # 黑色字体
-                self.screen.blit(msg_surface, (WINDOW_WIDTH // 2 - msg_surface.get_width() // 2, 10))
-                self.message_timer = max(0, self.message_timer - self.clock.get_time())
+                msg_surface = self._text(self.font, self.message, (0, 0, 0))  # 黑色字体
+                self._bounds["message"] = self.screen.blit(msg_surface, (WINDOW_WIDTH // 2 - msg_surface.get_width() // 2, 10))
 
             # 绘制悬停提示（技能说明）
-            self._draw_tooltip()
+            with prof.phase("tooltip"):
+                self._draw_tooltip()
         elif self.state == "game_over":
             self.draw_game_over()
+        if self.profiler.enabled:
+            self._draw_profiler_hud()
+        self.screen.set_clip(None)
+
+    def _cache_hit_rates(self) -> List[Tuple[str, float]]:
+        """性能面板显示的各缓存命中率"""
+        return [
+            ("卡面", self.card_faces.hit_rate),
+            ("文字", self.text_cache.hit_rate),
+            ("排版", self.text_layout.cache.hit_rate),
+            ("图片", self.assets.scaled.hit_rate),
+        ]
 
-        pygame.display.flip()
+    def _draw_profiler_hud(self) -> None:
+        """在左上角绘制性能面板（文字直接渲染，不进文字缓存，避免不断变化的数字挤掉常用文字）"""
+        lines = self._frame_sigs.get("hud") or self.profiler.hud_lines(self._cache_hit_rates())
+        line_h = self.small_font.get_height() + 2
+        surfs = [self.small_font.render(line, True, (0, 255, 0)) for line in lines]
+        width = max(surf.get_width() for surf in surfs) + 16
+        rect = pygame.Rect(8, 8, width, line_h * len(surfs) + 12)
+        self.screen.blit(self._overlay(rect.size, (0, 0, 0, 170)), rect.topleft)
+        for i, surf in enumerate(surfs):
+            self.screen.blit(surf, (rect.x + 8, rect.y + 6 + i * line_h))
+        self._bounds["hud"] = rect
 
     def draw_menu(self) -> None:
         """绘制菜单界面（显示 2/3/4 人选项）"""
         # 提示语
         prompt_y = WINDOW_HEIGHT // 2 - 150  # 将提示语放在窗口中间偏上位置
-        title = self.font.render("请选择玩家人数", True, (0, 0, 0))  # 黑色字体
+        title = self._text(self.font, "请选择玩家人数", (0, 0, 0))  # 黑色字体
         self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, prompt_y))
 
 
@@ -914,22 +1239,22 @@ class PygameUI:
     def draw_game_over(self) -> None:
         """绘制大局结束界面（比分、胜者与操作按钮）"""
         # 标题
-        title = self.font.render("大局结束", True, (0, 0, 0))  # 黑色字体
+        title = self._text(self.font, "大局结束", (0, 0, 0))  # 黑色字体
         self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 80))
 
         # 胜者
         winners_text = ", ".join(self.game_over_winners) if self.game_over_winners else "无"
-        winners_surface = self.font.render(f"胜利者: {winners_text}", True, (0, 0, 0))  # 黑色字体
+        winners_surface = self._text(self.font, f"胜利者: {winners_text}", (0, 0, 0))  # 黑色字体
         self.screen.blit(winners_surface, (WINDOW_WIDTH // 2 - winners_surface.get_width() // 2, 140))
 
         # 大比分（小局胜场）
         if self.gm:
             y = 200
-            score_title = self.font.render("比分（小局胜场）:", True, (0, 0, 0))  # 黑色字体
+            score_title = self._text(self.font, "比分（小局胜场）:", (0, 0, 0))  # 黑色字体
             self.screen.blit(score_title, (WINDOW_WIDTH // 2 - score_title.get_width() // 2, y))
             y += 40
             for name, wins in self.gm.small_rounds_won.items():
-                line = self.font.render(f"{name}: {wins}", True, (0, 0, 0))  # 黑色字体
+                line = self._text(self.font, f"{name}: {wins}", (0, 0, 0))  # 黑色字体
                 self.screen.blit(line, (WINDOW_WIDTH // 2 - line.get_width() // 2, y))
                 y += 30
 
@@ -945,24 +1270,19 @@ class PygameUI:
         - border=True 时绘制高亮边框（用于菜单选择态）。
         """
         # 背景
-        if self.btn_image:
-            try:
-                scaled = pygame.transform.smoothscale(self.btn_image, (rect.width, rect.height))
-                self.screen.blit(scaled, rect.topleft)
-            except Exception:
-                pygame.draw.rect(self.screen, COLOR_ZONE, rect)
+        scaled = self.assets.scaled_image(BUTTON_IMAGE, rect.size) if self.btn_image else None
+        if scaled:
+            self.screen.blit(scaled, rect.topleft)
         else:
             pygame.draw.rect(self.screen, COLOR_ZONE, rect)
 
         # 禁用态遮罩
         if not enabled:
-            dim = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            dim.fill((0, 0, 0, 110))
-            self.screen.blit(dim, rect.topleft)
+            self.screen.blit(self._overlay(rect.size, (0, 0, 0, 110)), rect.topleft)
 
         # 文字
         use_font = font or self.font
-        label = use_font.render(text, True, (0, 0, 0))  # 黑色字体
+        label = self._text(use_font, text, (0, 0, 0))  # 黑色字体
         text_x = rect.x + (rect.width - label.get_width()) // 2
         text_y = rect.y + (rect.height - label.get_height()) // 2
         self.screen.blit(label, (text_x, text_y))
@@ -1005,8 +1325,8 @@ class PygameUI:
         """绘制玩家区域"""
         gap = ZONE_MARGIN
         h_hand, h_battle, h_iso = HAND_HEIGHT, BATTLE_HEIGHT, ISO_HEIGHT
-        total_h = h_hand + h_battle + h_iso + gap * 2
-        area_rect, base_y, x1, x2, cards_x_left = self._get_player_area(player, total_h)
+        lay = self.player_layout(player)
+        area_rect, base_y, x1, x2, cards_x_left = lay.area_rect, lay.base_y, lay.x1, lay.x2, lay.cards_x_left
 
         border_color = COLOR_CURRENT_PLAYER if is_current else COLOR_OTHER_PLAYER
         # 如果当前有选中卡牌且需要选择目标，显示玩家区域的可选状态
@@ -1031,15 +1351,16 @@ class PygameUI:
         pygame.draw.line(self.screen, sep_color, (x1, y_sep2), (x2, y_sep2), 1)
 
         # 绘制各个区域（传入区域的 x/width 与卡牌起始 x）
-        self.draw_zone("手牌", player.hand, player, "hand", base_y, h_hand, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
-        self.draw_zone("战场", player.battlefield_cards, player, "battlefield", base_y + h_hand + gap, h_battle, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
-        self.draw_zone("孤立", player.isolated_cards, player, "isolated", base_y + h_hand + gap + h_battle + gap, h_iso, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
+        with self.profiler.phase("draw_zone"):
+            self.draw_zone("手牌", player.hand, player, "hand", base_y, h_hand, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
+            self.draw_zone("战场", player.battlefield_cards, player, "battlefield", base_y + h_hand + gap, h_battle, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
+            self.draw_zone("孤立", player.isolated_cards, player, "isolated", base_y + h_hand + gap + h_battle + gap, h_iso, x=area_rect.x, width=area_rect.width, cards_x_left=cards_x_left)
 
         # 绘制玩家信息：放在各自区域左外侧或顶部，避免遮挡
         live_score = self.compute_live_score(player)
-        name_surf = self.font.render(player.name, True, (255, 255, 255))
-        score_surf = self.small_font.render(f"分数: {live_score}", True, (255, 255, 255))
-        wins_surf = self.small_font.render(f"胜局: {player.wins}", True, (255, 255, 255))
+        name_surf = self._text(self.font, player.name, (255, 255, 255))
+        score_surf = self._text(self.small_font, f"分数: {live_score}", (255, 255, 255))
+        wins_surf = self._text(self.small_font, f"胜局: {player.wins}", (255, 255, 255))
 
         max_text_width = max(name_surf.get_width(), score_surf.get_width(), wins_surf.get_width())
         info_width = max_text_width + 20
@@ -1132,21 +1453,44 @@ class PygameUI:
             highlight_color = (255, 0, 0) if player in self.enemy_list else (0, 255, 0)
             pygame.draw.rect(self.screen, highlight_color, area_rect, 4, border_radius=12)
 
+        # 记录本玩家组件占用的屏幕区域（脏矩形重绘用）
+        self._bounds[("player", player.index)] = area_rect.union(info_rect).inflate(4, 4)
+
 
     def draw_log_panel(self) -> None:
-        """在底部绘制一个日志框，显示最近的操作。"""
+        """在底部绘制一个日志框，显示最近的操作（合成结果缓存，只有新日志到来时才重新合成）。"""
         panel_height = 90
         panel_rect = pygame.Rect(0, WINDOW_HEIGHT - panel_height, WINDOW_WIDTH, panel_height)
-        pygame.draw.rect(self.screen, (20, 20, 20), panel_rect)
-        pygame.draw.rect(self.screen, (80, 80, 80), panel_rect, 2)
-
-        # 面板与按钮约束
-        panel_top = WINDOW_HEIGHT - panel_height
-        bottom_safe_y = WINDOW_HEIGHT - 70  # 按钮上沿之上留出安全距离
+        # 出牌 / 结束回合按钮画在日志框之上，两者共用这块区域
+        self._bounds["log"] = self._bounds["buttons"] = panel_rect
+        key = (self.logs.version, panel_rect.size, self.max_logs)
+        if key != self._log_panel_key:
+            self._log_panel = self._compose_log_panel(panel_rect)
+            self._log_panel_key = key
+        self.screen.blit(self._log_panel, panel_rect)
+
+    def _log_surface(self, entry) -> pygame.Surface:
+        """日志条目的文字 Surface（首次使用时渲染，随条目一起淘汰）"""
+        if entry.surface is None:
+            entry.surface = self.small_font.render(entry.text, True, (255, 255, 255))  # 白色字体
+            self._log_surfaces += 1
+        return entry.surface
+
+    def _compose_log_panel(self, panel_rect: pygame.Rect) -> pygame.Surface:
+        """把日志框背景、标题与最近几条日志合成到一张与日志框等大的 Surface 上"""
+        panel = pygame.Surface(panel_rect.size).convert()
+        self._log_surfaces += 1
+        local_rect = panel.get_rect()
+        pygame.draw.rect(panel, (20, 20, 20), local_rect)
+        pygame.draw.rect(panel, (80, 80, 80), local_rect, 2)
+
+        # 面板与按钮约束（以下坐标相对日志框左上角）
+        panel_top = 0
+        bottom_safe_y = panel_rect.height - 70  # 按钮上沿之上留出安全距离
         line_h = self.small_font.get_height() + 2
 
         # 在空间足够时绘制标题；不足则让出空间给日志
-        title_surface = self.small_font.render("操作记录", True, (255, 255, 255))  # 白色字体
+        title_surface = self._text(self.small_font, "操作记录", (255, 255, 255))  # 白色字体
         title_h = title_surface.get_height()
         # 预估最小需要高度：标题 + 一行日志
         need_for_title_and_one = 8 + title_h + 4 + line_h
@@ -1155,28 +1499,27 @@ class PygameUI:
 
         y_title = panel_top + 8
         if draw_title:
-            self.screen.blit(title_surface, (10, y_title))
+            panel.blit(title_surface, (10, y_title))
             logs_top = y_title + title_h + 4
         else:
             logs_top = panel_top + 6
 
         # 取最后若干条日志，自底向上绘制，保证至少尝试一行
-        lines = self.logs[-self.max_logs:]
-        if not lines:
-            return
+        entries = self.logs.last(self.max_logs)
+        if not entries:
+            return panel
         # 从底部向上画，直到触达 logs_top
         drawn = 0
-        for i, line in enumerate(reversed(lines)):
-            text_surface = self.small_font.render(line, True, (255, 255, 255))  # 白色字体
+        for i, entry in enumerate(reversed(entries)):
             y = bottom_safe_y - (i + 1) * line_h
             if y < logs_top:
                 break
-            self.screen.blit(text_surface, (10, y))
+            panel.blit(self._log_surface(entry), (10, y))
             drawn += 1
         # 如果一行都没画出来（空间极其有限），强制在 logs_top 位置画一行
         if drawn == 0:
-            text_surface = self.small_font.render(lines[-1], True, (255, 255, 255))  # 白色字体
-            self.screen.blit(text_surface, (10, logs_top))
+            panel.blit(self._log_surface(entries[-1]), (10, logs_top))
+        return panel
 
     def draw_zone(self, label: str, cards: List[Card], player: Player, zone_name: str, y: int, height: int = ZONE_HEIGHT, *, x: Optional[int] = None, width: Optional[int] = None, cards_x_left: Optional[int] = None) -> None:
         """绘制卡牌区域（仅大号水印 + 卡牌）
@@ -1210,150 +1553,140 @@ class PygameUI:
                         self._update_card_bg_scaled()
 
         # 中心水印（放大字号、低透明度）- 改为黑色
-        wm = self.wm_font.render(label, True, (0, 0, 0))  # 黑色字体
-        wm.set_alpha(40)
+        wm = self._text(self.wm_font, label, (0, 0, 0), alpha=40)  # 黑色字体
         wm_x = zone_rect.x + (zone_rect.width - wm.get_width()) // 2
         wm_y = zone_rect.y + (zone_rect.height - wm.get_height()) // 2
         self.screen.blit(wm, (wm_x, wm_y))
-        # 卡牌绘制
+        # 卡牌绘制：整张卡面按内容缓存，只有点数 / 选中状态 / 卡宽变化时才重新合成
         rects = self._build_card_rects(cards, y, x_left=cards_x_left if cards_x_left is not None else (zone_x + 10))
+        faces = self.card_faces
         for card, rect in zip(cards, rects):
-            # 背景：使用卡牌背景图；若无则使用灰色填充
-            if self.card_bg_scaled:
-                self.screen.blit(self.card_bg_scaled, rect.topleft)
-            else:
-                pygame.draw.rect(self.screen, (80, 80, 80), rect)
-
-            # 文字可读性（更柔和）：浅色渐变叠加 + 轻微描边阴影，而非纯黑遮罩
-            # 顶部标题区域：从透明过渡到浅白（不破坏背景饱和度）
-            title_band_h = 26
-            if title_band_h > 0:
-                title_grad = pygame.Surface((rect.width - 10, title_band_h), pygame.SRCALPHA)
-                for i in range(title_band_h):
-                    alpha = int(60 * (i / max(1, title_band_h - 1)))  # 0 -> 60
-                    pygame.draw.line(title_grad, (255, 255, 255, alpha), (0, i), (rect.width - 10, i))
-                self.screen.blit(title_grad, (rect.x + 5, rect.y + 4))
-
-            # 技能区域：从透明到更轻的浅白，避免压暗背景
-            line_y_start = rect.y + 35
-            skill_band_h = max(0, rect.height - (line_y_start - rect.y) - 6)
-            if skill_band_h > 0:
-                skill_grad = pygame.Surface((rect.width - 10, skill_band_h), pygame.SRCALPHA)
-                for i in range(skill_band_h):
-                    alpha = int(40 * (i / max(1, skill_band_h - 1)))  # 0 -> 40
-                    pygame.draw.line(skill_grad, (255, 255, 255, alpha), (0, i), (rect.width - 10, i))
-                self.screen.blit(skill_grad, (rect.x + 5, line_y_start))
-
-            # 边框颜色（状态反馈，采用更高对比度并加粗）
             if card == self.selected_card:
-                border_color = (255, 200, 0)  # 选中：金色
-                border_thick = 3
+                state = 1
             elif card in self.target_list:
-                border_color = (50, 220, 120)  # 目标：明亮绿
-                border_thick = 3
+                state = 2
             else:
-                # 普通：浅灰
-                border_color = (180, 180, 180)
-                border_thick = 2
-            pygame.draw.rect(self.screen, border_color, rect, border_thick)
-
-            # 如果鼠标悬停在卡牌上（进一步强调）
-            if hasattr(card, "highlight") and card.highlight:
-                pygame.draw.rect(self.screen, (255, 255, 0), rect, 3)
-
-            # 绘制卡牌基本信息（卡名必须完整显示，卡片宽度已动态调整）
-            card_info = f"{card.name}({card.points})"
-            card_text = self.font.render(card_info, True, (255, 255, 255))  # 白色字体
-            self.screen.blit(card_text, (rect.x + 5, rect.y + 5))
-
-            # 绘制技能名称：自动换行显示完整技能名，尽量在可用高度内展示
-            if card.skills:
-                line_y_start = rect.y + 35
-                line_h = 16
-                max_lines = max(0, (self.card_height - (line_y_start - rect.y) - 6) // line_h)
-                avail_w = rect.width - 10
-                names = [getattr(s, 'name', str(s)) for s in card.skills]
-                wrapped_lines: List[str] = []
-                for name in names:
+                state = 0
+            key = (card.proto, card.points, rect.width, rect.height, state, bool(card.highlight))
+            face = faces.get(key)
+            if face is None:
+                face = self._render_card_face(card, rect.width, rect.height, state, bool(card.highlight))
+                faces.put(key, face)
+            self.screen.blit(face, rect.topleft)
+
+    def _render_card_face(self, card: Card, width: int, height: int, state: int, highlight: bool) -> pygame.Surface:
+        """合成一张完整卡面（背景、渐变、边框、卡名点数、技能名）
+        :param state: 0 普通 / 1 选中 / 2 目标
+        :param highlight: 鼠标悬停高亮
+        """
+        face = pygame.Surface((width, height), pygame.SRCALPHA)
+        rect = face.get_rect()
+        # 背景：使用卡牌背景图；若无则使用灰色填充
+        if self.card_bg_scaled:
+            face.blit(self.card_bg_scaled, (0, 0))
+        else:
+            pygame.draw.rect(face, (80, 80, 80), rect)
+
+        # 文字可读性（更柔和）：浅色渐变叠加 + 轻微描边阴影，而非纯黑遮罩
+        # 顶部标题区域：从透明过渡到浅白（不破坏背景饱和度）
+        title_band_h = 26
+        if title_band_h > 0:
+            title_grad = pygame.Surface((rect.width - 10, title_band_h), pygame.SRCALPHA)
+            for i in range(title_band_h):
+                alpha = int(60 * (i / max(1, title_band_h - 1)))  # 0 -> 60
+                pygame.draw.line(title_grad, (255, 255, 255, alpha), (0, i), (rect.width - 10, i))
+            face.blit(title_grad, (5, 4))
+
+        # 技能区域：从透明到更轻的浅白，避免压暗背景
+        line_y_start = 35
+        skill_band_h = max(0, rect.height - line_y_start - 6)
+        if skill_band_h > 0:
+            skill_grad = pygame.Surface((rect.width - 10, skill_band_h), pygame.SRCALPHA)
+            for i in range(skill_band_h):
+                alpha = int(40 * (i / max(1, skill_band_h - 1)))  # 0 -> 40
+                pygame.draw.line(skill_grad, (255, 255, 255, alpha), (0, i), (rect.width - 10, i))
+            face.blit(skill_grad, (5, line_y_start))
+
+        # 边框颜色（状态反馈，采用更高对比度并加粗）
+        if state == 1:
+            border_color = (255, 200, 0)  # 选中：金色
+            border_thick = 3
+        elif state == 2:
+            border_color = (50, 220, 120)  # 目标：明亮绿
+            border_thick = 3
+        else:
+            # 普通：浅灰
+            border_color = (180, 180, 180)
+            border_thick = 2
+        pygame.draw.rect(face, border_color, rect, border_thick)
+
+        # 如果鼠标悬停在卡牌上（进一步强调）
+        if highlight:
+            pygame.draw.rect(face, (255, 255, 0), rect, 3)
+
+        # 绘制卡牌基本信息（卡名必须完整显示，卡片宽度已动态调整）
+        card_info = f"{card.name}({card.points})"
+        card_text = self._text(self.font, card_info, (255, 255, 255))  # 白色字体
+        face.blit(card_text, (5, 5))
+
+        # 绘制技能名称：自动换行显示完整技能名，尽量在可用高度内展示
+        if card.skills:
+            line_h = 16
+            max_lines = max(0, (self.card_height - line_y_start - 6) // line_h)
+            avail_w = rect.width - 10
+            names = [getattr(s, 'name', str(s)) for s in card.skills]
+            wrapped_lines: List[str] = []
+            for name in names:
+                if max_lines and len(wrapped_lines) >= max_lines:
+                    break
+                wrapped = self._wrap_text(name, self.small_font, avail_w)
+                for seg in wrapped:
                     if max_lines and len(wrapped_lines) >= max_lines:
                         break
-                    wrapped = self._wrap_text(name, self.small_font, avail_w)
-                    for seg in wrapped:
-                        if max_lines and len(wrapped_lines) >= max_lines:
-                            break
-                        wrapped_lines.append(seg)
-                # 绘制最终行
-                for j, line in enumerate(wrapped_lines):
-                    skill_text = self.small_font.render(line, True, (255, 255, 255))  # 白色字体
-                    self.screen.blit(skill_text, (rect.x + 5, line_y_start + j * line_h))
+                    wrapped_lines.append(seg)
+            # 绘制最终行
+            for j, line in enumerate(wrapped_lines):
+                skill_text = self._text(self.small_font, line, (255, 255, 255))  # 白色字体
+                face.blit(skill_text, (5, line_y_start + j * line_h))
+        return face
 
     def check_click_card(self, player: Player, x: int, y: int, zone: str = "hand") -> Optional[Card]:
         """检查是否点击到卡牌
         
         :param zone: 要检查的区域，可以是 "hand"/"battlefield"/"isolated"
         """
-        gap = ZONE_MARGIN
-        h_hand, h_battle, h_iso = HAND_HEIGHT, BATTLE_HEIGHT, ISO_HEIGHT
-        total_h = h_hand + h_battle + h_iso + gap * 2
-        area_rect, base_y, _x1, _x2, cards_x_left = self._get_player_area(player, total_h)
-
-        if zone == "hand":
-            cards = player.hand
-            y_offset = 0
-        elif zone == "battlefield":
-            cards = player.battlefield_cards
-            y_offset = h_hand + gap
-        elif zone == "isolated":
-            cards = player.isolated_cards
-            y_offset = h_hand + gap + h_battle + gap
-        else:
+        if zone not in ZONES:
+            return None
+        hit = self.hit_index(player).card_at(x, y, player, zone)
+        if hit is None:
             return None
+        return self._zone_cards(player, zone)[hit[2]]
 
-        rects = self._build_card_rects(cards, base_y + y_offset, x_left=cards_x_left)
-        for card, rect in zip(cards, rects):
-            if rect.collidepoint(x, y):
-                return card
-        return None
+    @staticmethod
+    def _zone_cards(player: Player, zone: str) -> List[Card]:
+        """玩家某区域的卡牌列表"""
+        if zone == "hand":
+            return player.hand
+        if zone == "battlefield":
+            return player.battlefield_cards
+        return player.isolated_cards
 
     def check_click_target(self, current_player: Player, x: int, y: int) -> Optional[Player]:
         """检查是否点击到目标玩家区域"""
         if not self.gm:
             return None
-        gap = ZONE_MARGIN
-        h_hand, h_battle, h_iso = HAND_HEIGHT, BATTLE_HEIGHT, ISO_HEIGHT
-        total_h = h_hand + h_battle + h_iso + gap * 2
-        for player in self.gm.players:
-            area_rect, _base_y, _x1, _x2, _cards_x_left = self._get_player_area(player, total_h)
-            if area_rect.collidepoint(x, y):
-                return player
-        return None
+        return self.hit_index().player_at(x, y)
 
     def get_card_rect_for_card(self, card: Card, player: Player, zone: str = "hand") -> Optional[pygame.Rect]:
         """获取卡牌的矩形区域
         
         :param zone: 要检查的区域，可以是 "hand"/"battlefield"/"isolated"
         """
-        gap = ZONE_MARGIN
-        h_hand, h_battle, h_iso = HAND_HEIGHT, BATTLE_HEIGHT, ISO_HEIGHT
-        total_h = h_hand + h_battle + h_iso + gap * 2
-        area_rect, base_y, _x1, _x2, cards_x_left = self._get_player_area(player, total_h)
-
-        # 确定要搜索的卡牌列表和纵向偏移
-        if zone == "hand":
-            cards = player.hand
-            y_offset = 0
-        elif zone == "battlefield":
-            cards = player.battlefield_cards
-            y_offset = h_hand + gap
-        elif zone == "isolated":
-            cards = player.isolated_cards
-            y_offset = h_hand + gap + h_battle + gap
-        else:
+        rects = self.player_layout(player).card_rects.get(zone)
+        if rects is None:
             return None
-
         # 在指定区域中查找卡牌
-        rects = self._build_card_rects(cards, base_y + y_offset, x_left=cards_x_left)
-        for c, r in zip(cards, rects):
+        for c, r in zip(self._zone_cards(player, zone), rects):
             if c == card:
                 return r
         return None
@@ -1361,18 +1694,6 @@ class PygameUI:
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
         """将字符串按像素宽度换行，适配中英文混排。
         规则：逐字累积，超过 max_width 则换行；不添加省略号。
+        结果按 (字体, 文本, 宽度) 缓存，逐字宽度也已缓存，稳定状态下不再测量文字。
         """
-        if not text:
-            return [""]
-        lines: List[str] = []
-        current = ""
-        for ch in text:
-            test = current + ch
-            if font.size(test)[0] <= max_width or not current:
-                current = test
-            else:
-                lines.append(current)
-                current = ch
-        if current:
-            lines.append(current)
-        return lines
+        return list(self.text_layout.wrap(font, text, max_width))
@@ -0,0 +1,171 @@
+# ui/assets.py
+"""
+界面图片资源管理
+
+ui/images 下的图片只从磁盘加载一次；绘制需要的缩放版本按 (图片, 目标尺寸) 缓存，
+同一尺寸只 smoothscale 一次，超出容量时淘汰最久未用的尺寸。
+尺寸固定的小图（例如各种按钮）可以预先缩放并打包进一张图集，启动后绘制不再做任何缩放。
+启动时可以用 preload 在后台线程解码图片（pygame.image.load 解码期间释放 GIL），
+界面先用纯色占位画出第一帧，解码完成后投递 ASSETS_LOADED 事件再换上图片。
+"""
+
+import os
+import threading
+
+import pygame
+
+from ui.render_cache import LRUCache
+
+IMAGE_DIR = os.path.join(os.path.dirname(__file__), "images")
+
+# 后台解码全部完成时投递的事件类型
+ASSETS_LOADED = pygame.event.custom_type()
+
+
+class AssetManager:
+    """图片加载与缩放版本缓存"""
+
+    def __init__(self, image_dir=IMAGE_DIR, scaled_capacity=32):
+        """
+        :param image_dir: 图片目录
+        :param scaled_capacity: 最多缓存的缩放版本数量（图集内的不计入、不淘汰）
+        """
+        self.image_dir = image_dir
+        self._images = {}          # 文件名 -> Surface（加载失败 / 不存在为 None）
+        self.scaled = LRUCache(scaled_capacity)
+        self.atlas = None          # 图集 Surface
+        self._atlas_regions = {}   # (文件名, 尺寸) -> 图集中的子 Surface
+        self._decoded = {}         # 后台线程解码好、尚未转换像素格式的图片
+        self._preloading = set()
+        self._loader = None
+
+    def _decode(self, name):
+        """从磁盘解码图片（可在后台线程调用），不存在或失败时返回 None"""
+        path = os.path.join(self.image_dir, name)
+        try:
+            if os.path.exists(path):
+                return pygame.image.load(path)
+        except Exception:
+            pass
+        return None
+
+    def preload(self, names, done_event=ASSETS_LOADED):
+        """
+        在后台线程解码一组图片，全部完成后投递 done_event（None 表示不投递）
+        像素格式转换（convert / convert_alpha）依赖显示模式，留到主线程首次使用时进行
+        """
+        names = [n for n in names if n not in self._images]
+        self._preloading.update(names)
+
+        def work():
+            for name in names:
+                self._decoded[name] = self._decode(name)
+            if done_event is not None:
+                pygame.event.post(pygame.event.Event(done_event))
+
+        self._loader = threading.Thread(target=work, name="asset-preload", daemon=True)
+        self._loader.start()
+
+    @property
+    def loading(self):
+        """后台解码是否仍在进行"""
+        return self._loader is not None and self._loader.is_alive()
+
+    def wait(self):
+        """阻塞直到后台解码完成"""
+        if self._loader is not None:
+            self._loader.join()
+
+    def image(self, name, wait=True):
+        """
+        加载原图（只加载一次）；png 保留透明通道，其余格式转换为屏幕格式
+        :param wait: 图片正在后台解码时是否等待；为 False 时直接返回 None（调用方先画占位）
+        :return: Surface，文件不存在或加载失败（或尚未解码完且不等待）时返回 None
+        """
+        if name in self._images:
+            return self._images[name]
+        if name in self._preloading:
+            if name not in self._decoded:
+                if not wait:
+                    return None
+                self.wait()
+            surf = self._decoded.pop(name)
+            self._preloading.discard(name)
+        else:
+            surf = self._decode(name)
+        if surf is not None:
+            try:
+                surf = surf.convert_alpha() if name.lower().endswith(".png") else surf.convert()
+            except Exception:
+                surf = None
+        self._images[name] = surf
+        return surf
+
+    def first_image(self, *names):
+        """按顺序返回第一张存在的图片，都不存在时返回 None"""
+        for name in names:
+            surf = self.image(name)
+            if surf is not None:
+                return surf
+        return None
+
+    def scaled_image(self, name, size):
+        """
+        取缩放到 size 的图片（共享对象，调用方不要修改）
+        :param size: (宽, 高)
+        :return: Surface；原图不存在或缩放失败时返回 None
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (name, size)
+        region = self._atlas_regions.get(key)
+        if region is not None:
+            return region
+        surf = self.scaled.get(key)
+        if surf is not None:
+            return surf
+        src = self.image(name)
+        if src is None or size[0] <= 0 or size[1] <= 0:
+            return None
+        try:
+            surf = pygame.transform.smoothscale(src, size)
+        except Exception:
+            return None
+        self.scaled.put(key, surf)
+        return surf
+
+    def pack_atlas(self, entries, max_width=1024):
+        """
+        把若干固定尺寸的缩放版本预先生成并打包进一张图集（按行货架式排列）
+        之后 scaled_image 对这些 (图片, 尺寸) 直接返回图集中的子 Surface
+        :param entries: [(文件名, (宽, 高)), ...]；原图不存在的条目跳过
+        :param max_width: 图集宽度上限
+        :return: 打包的条目数
+        """
+        items = []
+        for name, size in entries:
+            surf = self.scaled_image(name, size)
+            if surf is not None:
+                items.append(((name, (int(size[0]), int(size[1]))), surf))
+        if not items:
+            return 0
+        # 按高度从高到低逐行摆放
+        items.sort(key=lambda item: item[1].get_height(), reverse=True)
+        placements = []
+        x = y = row_h = atlas_w = 0
+        for key, surf in items:
+            w, h = surf.get_size()
+            if x and x + w > max_width:
+                x, y = 0, y + row_h
+                row_h = 0
+            placements.append((key, surf, x, y))
+            x += w
+            row_h = max(row_h, h)
+            atlas_w = max(atlas_w, x)
+        atlas = pygame.Surface((atlas_w, y + row_h), pygame.SRCALPHA)
+        regions = {}
+        for key, surf, px, py in placements:
+            atlas.blit(surf, (px, py), special_flags=pygame.BLEND_RGBA_MAX)
+            regions[key] = atlas.subsurface(pygame.Rect(px, py, *surf.get_size()))
+        self.atlas = atlas
+        self._atlas_regions = regions
+        return len(regions)
@@ -10,6 +10,59 @@ HAND_HEIGHT = 80
 BATTLE_HEIGHT = 90
 ISO_HEIGHT = 100
 
+# 界面字体候选（按优先顺序，取第一个系统中存在的）
+FONT_CANDIDATES = (
+    "Microsoft YaHei UI",
+    "Microsoft YaHei",
+    "SimHei",
+    "msyh",
+    "Arial Unicode MS",
+)
+
+# 内存中保留的日志条数，以及日志文件（--log-file）轮转的大小与保留份数
+LOG_CAPACITY = 200
+LOG_FILE_MAX_BYTES = 1 << 20
+LOG_FILE_BACKUPS = 3
+
+# 卡面缓存容量（4 人满手牌 + 各种选中状态绰绰有余）
+CARD_FACE_CACHE_SIZE = 256
+
+# 文字渲染缓存容量
+TEXT_CACHE_SIZE = 1024
+
+# 换行结果缓存容量（技能名与提示文案）
+TEXT_LAYOUT_CACHE_SIZE = 512
+
+# 半透明遮罩缓存容量（按 尺寸 + 颜色 计：禁用按钮、性能面板底板）
+OVERLAY_CACHE_SIZE = 16
+
+# 图片资源（ui/images 下的文件名）
+CARD_IMAGE = "card.png"
+BACKGROUND_IMAGE = "Background.png"
+BUTTON_IMAGE = "botton.png"
+TITLE_IMAGES = ("title.png", "title.jpg", "title.jpeg")  # 按顺序取第一张存在的
+# 启动时在后台解码的图片
+STARTUP_IMAGES = (CARD_IMAGE, BACKGROUND_IMAGE, BUTTON_IMAGE) + TITLE_IMAGES
+
+# 缩放图片缓存容量（按目标尺寸计，卡宽变化、窗口尺寸变化各占一项）
+ASSET_SCALED_CACHE_SIZE = 32
+
+# 是否把固定尺寸的按钮预先缩放并打包进图集；以及界面上用到的按钮尺寸（宽, 高）
+ASSET_ATLAS = True
+BUTTON_SIZES = ((120, 40), (180, 60), (320, 90), (150, 50))
+
+# 性能面板：统计的帧数，以及面板打开时的刷新间隔（毫秒）
+PROFILER_HISTORY = 120
+PROFILER_HUD_REFRESH_MS = 500
+
+# 点击 / 悬停检测空间索引的网格边长（像素，约为一张卡牌宽度）
+HIT_GRID_CELL = 64
+
+# 录像回放：1 倍速下每回合的间隔（毫秒），以及可调速度范围
+REPLAY_TURN_MS = 600
+REPLAY_MIN_SPEED = 0.125
+REPLAY_MAX_SPEED = 64
+
 # 颜色常量
 COLOR_BG = (30, 30, 30)
 COLOR_ZONE = (60, 60, 60)
@@ -34,10 +87,8 @@ COLOR_HAND_BORDER = (110, 170, 230)
 COLOR_BATTLE_BORDER = (120, 200, 120)
 COLOR_ISO_BORDER = (220, 170, 100)
 
-# 游戏事件类型
-END_TURN = "END_TURN"
-PLAY_CARD = "PLAY_CARD"
-SELECT_TARGET = "SELECT_TARGET"
+# 游戏事件类型（定义在引擎侧，UI 与引擎共用）
+from game.controller import END_TURN, PLAY_CARD, SELECT_TARGET
 
 # 为了类型提示
 from typing import TYPE_CHECKING, Optional, Type
@@ -0,0 +1,179 @@
+# ui/fonts.py
+"""
+界面字体注册表
+
+pygame.font.SysFont 每次按名字查找前都要先枚举系统字体（Linux 上调用 fc-list，
+Windows 读注册表，macOS 调用 system_profiler），字体多的机器上冷启动明显变慢。
+FontRegistry 只按候选列表解析一次字体文件路径，并把结果写进磁盘缓存；
+缓存以“系统字体目录的修改时间 + 候选列表 + pygame 版本”为键，字体增删后自动失效。
+各字号直接用解析出的文件构造 pygame.font.Font，与 SysFont 的结果一致。
+缓存未命中时的解析可以用 preload 放到后台线程，界面先用 pygame 内置字体画出第一帧，
+解析完成后投递 FONTS_LOADED 事件再换上中文字体。
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+import pygame
+
+CACHE_VERSION = 1
+
+# 后台解析完成时投递的事件类型
+FONTS_LOADED = pygame.event.custom_type()
+
+
+def default_cache_path():
+    """用户缓存目录下的字体缓存文件"""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "luobo-gwent", "fonts.json")
+
+
+def font_dirs():
+    """各平台的系统 / 用户字体目录（不存在的也列出，由调用方过滤）"""
+    if sys.platform.startswith("win"):
+        windir = os.environ.get("WINDIR", "C:\\Windows")
+        local = os.environ.get("LOCALAPPDATA", "")
+        return [os.path.join(windir, "Fonts"),
+                os.path.join(local, "Microsoft", "Windows", "Fonts") if local else ""]
+    if sys.platform == "darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return ["/usr/share/fonts", "/usr/local/share/fonts",
+            os.path.join(data_home, "fonts"), os.path.expanduser("~/.fonts")]
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class FontRegistry:
+    """按候选字体名列表解析一次字体文件，并按字号缓存 Font 对象"""
+
+    def __init__(self, candidates, cache_path=None):
+        """
+        :param candidates: 候选字体名（按优先顺序），与 SysFont 的 name 参数相同
+        :param cache_path: 磁盘缓存文件路径，默认在用户缓存目录；传 False 不使用磁盘缓存
+        """
+        self.candidates = list(candidates)
+        self.cache_path = default_cache_path() if cache_path is None else cache_path
+        self._path = None
+        self._resolved = False
+        self._fonts = {}
+        self._defaults = {}
+        self._lock = threading.Lock()
+        self._loader = None
+        self.from_cache = False   # 最近一次解析是否命中磁盘缓存
+        self.resolve_seconds = None   # 解析耗时（尚未解析时为 None）
+
+    def fingerprint(self):
+        """系统字体集合的指纹：字体目录的修改时间（增删字体文件时改变）+ 候选列表 + pygame 版本"""
+        dirs = [(d, _mtime(d)) for d in font_dirs() if d]
+        return {
+            "version": CACHE_VERSION,
+            "pygame": pygame.version.ver,
+            "platform": sys.platform,
+            "candidates": self.candidates,
+            "dirs": [[d, m] for d, m in dirs if m is not None],
+        }
+
+    def _load_cache(self, fingerprint):
+        """读取磁盘缓存，指纹不符或缓存的字体文件已不存在时返回 (False, None)"""
+        if not self.cache_path:
+            return False, None
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if data.get("fingerprint") != fingerprint:
+            return False, None
+        path = data.get("path")
+        if path is not None:
+            # 字体可能装在字体目录的子目录里，子目录的变化不会反映到指纹上
+            if not os.path.isfile(path) or _mtime(os.path.dirname(path)) != data.get("dir_mtime"):
+                return False, None
+        return True, path
+
+    def _save_cache(self, fingerprint, path):
+        if not self.cache_path:
+            return
+        data = {
+            "fingerprint": fingerprint,
+            "path": path,
+            "dir_mtime": _mtime(os.path.dirname(path)) if path else None,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass  # 缓存只是加速，写不进去（只读目录等）不影响使用
+
+    def resolve(self):
+        """
+        解析候选列表对应的字体文件（每个实例只解析一次）
+        :return: 字体文件路径；都找不到时为 None（使用 pygame 内置字体）
+        """
+        with self._lock:
+            if self._resolved:
+                return self._path
+            start = time.perf_counter()
+            fingerprint = self.fingerprint()
+            hit, path = self._load_cache(fingerprint)
+            if not hit:
+                path = pygame.font.match_font(self.candidates)
+                self._save_cache(fingerprint, path)
+            self._path = path
+            self.from_cache = hit
+            self.resolve_seconds = time.perf_counter() - start
+            self._resolved = True
+            return path
+
+    def preload(self, done_event=FONTS_LOADED):
+        """在后台线程解析字体文件，完成后投递 done_event（None 表示不投递）"""
+        def work():
+            self.resolve()
+            if done_event is not None:
+                pygame.event.post(pygame.event.Event(done_event))
+
+        self._loader = threading.Thread(target=work, name="font-resolve", daemon=True)
+        self._loader.start()
+
+    @property
+    def ready(self):
+        """字体文件是否已解析（之后 font() 不会阻塞）"""
+        return self._resolved
+
+    def wait(self):
+        """阻塞直到后台解析完成"""
+        if self._loader is not None:
+            self._loader.join()
+
+    def font(self, size):
+        """取指定字号的字体（同一字号共用一个 Font 对象）"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.resolve(), size)
+            self._fonts[size] = font
+        return font
+
+    def default_font(self, size):
+        """pygame 内置字体（不需要解析，字体就绪前的占位帧使用；没有中文字形）"""
+        font = self._defaults.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._defaults[size] = font
+        return font
@@ -0,0 +1,127 @@
+# ui/layout.py
+"""
+玩家区域布局几何缓存
+
+三 / 四人布局需要按手牌数量、窗口宽度与固定卡宽计算每位玩家的区域，
+点击、悬停检测和绘制都要用到这些矩形；这里把一次计算的结果保存下来，
+只有布局版本号（窗口尺寸、卡宽、对局管理器变化时递增）或各区域张数变化时才重算。
+HitIndex 在缓存的布局上建立均匀网格索引，鼠标位置只需查一个格子即可得到玩家 / 区域 / 卡牌。
+"""
+
+# 玩家区域内从上到下的三个卡牌区域
+ZONES = ("hand", "battlefield", "isolated")
+
+
+class PlayerLayout:
+    """单个玩家区域的屏幕几何：整体区域、分隔线两端 x、各区域的卡牌矩形"""
+
+    __slots__ = ("area_rect", "base_y", "x1", "x2", "cards_x_left", "zone_y", "card_rects")
+
+    def __init__(self, area_rect, base_y, x1, x2, cards_x_left, zone_y, card_rects):
+        """
+        :param area_rect: 玩家整体区域（边框与点击判定）
+        :param base_y: 手牌区域起始 y
+        :param x1: 分隔线左端 x
+        :param x2: 分隔线右端 x
+        :param cards_x_left: 卡牌起始 x
+        :param zone_y: {区域名: 该区域起始 y}
+        :param card_rects: {区域名: [该区域第 i 张牌的矩形, ...]}
+        """
+        self.area_rect = area_rect
+        self.base_y = base_y
+        self.x1 = x1
+        self.x2 = x2
+        self.cards_x_left = cards_x_left
+        self.zone_y = zone_y
+        self.card_rects = card_rects
+
+
+class HitIndex:
+    """
+    均匀网格空间索引：每个格子记录与之相交的卡牌矩形与玩家区域，
+    查询时只检查鼠标所在格子里的少量条目，与手牌数量无关
+    同一格子内的条目按（玩家顺序, 区域顺序, 卡牌顺序）排列，命中结果与逐个扫描一致
+    """
+
+    def __init__(self, players, layouts, cell=64):
+        """
+        :param players: 玩家列表（决定命中优先顺序）
+        :param layouts: {玩家座位: PlayerLayout}
+        :param cell: 网格边长（像素）
+        """
+        self.cell = cell
+        self._cards = {}   # (格 x, 格 y) -> [(rect, 玩家, 区域, 下标), ...]
+        self._areas = {}   # (格 x, 格 y) -> [(rect, 玩家), ...]
+        for p in players:
+            lay = layouts[p.index]
+            self._insert(self._areas, lay.area_rect, (lay.area_rect, p))
+            for zone in ZONES:
+                for i, rect in enumerate(lay.card_rects[zone]):
+                    self._insert(self._cards, rect, (rect, p, zone, i))
+
+    def _insert(self, grid, rect, entry):
+        c = self.cell
+        for gx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for gy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                grid.setdefault((gx, gy), []).append(entry)
+
+    def card_at(self, x, y, player=None, zone=None):
+        """
+        查找屏幕点下的卡牌
+        :param player: 只查该玩家（None 表示任意玩家）
+        :param zone: 只查该区域（None 表示任意区域）
+        :return: (玩家, 区域名, 卡牌在区域中的下标)，未命中返回 None
+        """
+        for rect, p, z, i in self._cards.get((x // self.cell, y // self.cell), ()):
+            if (player is None or p is player) and (zone is None or z == zone) and rect.collidepoint(x, y):
+                return p, z, i
+        return None
+
+    def player_at(self, x, y):
+        """查找屏幕点所在的玩家区域，未命中返回 None"""
+        for rect, p in self._areas.get((x // self.cell, y // self.cell), ()):
+            if rect.collidepoint(x, y):
+                return p
+        return None
+
+
+class LayoutCache:
+    """按（布局版本号, 各玩家各区域张数）缓存所有玩家的 PlayerLayout 及其空间索引"""
+
+    def __init__(self, hit_cell=64):
+        """
+        :param hit_cell: 空间索引的网格边长（像素）
+        """
+        self.hit_cell = hit_cell
+        self.version = 0
+        self._key = None
+        self._layouts = {}
+        self._index = None
+        self.builds = 0
+
+    def invalidate(self):
+        """窗口尺寸 / 卡宽 / 对局管理器变化后调用，下次查询时重算"""
+        self.version += 1
+
+    def get(self, players, build):
+        """
+        取所有玩家的布局，缓存失效时调用 build(player) 逐个重算
+        :param players: 玩家列表
+        :param build: 计算单个玩家 PlayerLayout 的函数
+        :return: {玩家座位: PlayerLayout}
+        """
+        key = (self.version, tuple((p.index, len(p.hand), len(p.battlefield_cards), len(p.isolated_cards))
+                                   for p in players))
+        if key != self._key:
+            self._layouts = {p.index: build(p) for p in players}
+            self._index = None
+            self._key = key
+            self.builds += 1
+        return self._layouts
+
+    def hit_index(self, players, build):
+        """取与当前布局对应的 HitIndex（布局重算后首次查询时重建）"""
+        layouts = self.get(players, build)
+        if self._index is None:
+            self._index = HitIndex(players, layouts, self.hit_cell)
+        return self._index
@@ -0,0 +1,100 @@
+# ui/log_store.py
+"""
+底部日志框的日志存储
+
+LogStore 是容量固定的环形缓冲区：每条日志带一个单调递增的序号，写满后新日志覆盖最旧的一条，
+不再像列表那样在溢出时整体切片复制。每条日志可以挂一个渲染好的 Surface（由界面首次绘制时填入），
+随日志一起被淘汰；日志框按 (序号, 条数) 判断是否需要重新合成。
+可选地把每条日志同时写入按大小轮转的磁盘文件，长时间游戏也能保留完整记录而内存不增长；
+文件在 close() 时关闭，没有显式关闭时由 atexit 在解释器退出前关闭。
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+
+
+class LogEntry:
+    """一条日志：序号、文本与渲染好的 Surface（尚未渲染时为 None）"""
+
+    __slots__ = ("seq", "text", "surface")
+
+    def __init__(self, seq, text):
+        self.seq = seq
+        self.text = text
+        self.surface = None
+
+
+class LogStore:
+    """容量固定的日志环形缓冲区"""
+
+    def __init__(self, capacity=200):
+        """
+        :param capacity: 内存中保留的日志条数
+        """
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._count = 0      # 当前保留的条数
+        self.seq = 0         # 下一条日志的序号（即累计写入条数）
+        self._spill = None   # 轮转文件 handler（不经过 logging 的 logger 树）
+
+    def append(self, text):
+        """
+        追加一条日志，缓冲区已满时覆盖最旧的一条
+        :return: 新日志的序号
+        """
+        seq = self.seq
+        self._slots[seq % self.capacity] = LogEntry(seq, text)
+        self.seq = seq + 1
+        if self._count < self.capacity:
+            self._count += 1
+        if self._spill is not None:
+            self._spill.handle(logging.makeLogRecord(
+                {"msg": "%d\t%s", "args": (seq, text), "levelno": logging.INFO, "levelname": "INFO"}))
+        return seq
+
+    def last(self, n):
+        """最近 n 条日志（从旧到新）"""
+        n = min(n, self._count)
+        cap = self.capacity
+        return [self._slots[s % cap] for s in range(self.seq - n, self.seq)]
+
+    def clear(self):
+        """清空内存中的日志（序号继续递增，磁盘文件不受影响）"""
+        self._slots = [None] * self.capacity
+        self._count = 0
+
+    @property
+    def version(self):
+        """内容版本：追加或清空后改变（日志框的重绘签名）"""
+        return self.seq, self._count
+
+    def spill_to(self, path, max_bytes=1 << 20, backups=3):
+        """
+        把之后写入的每条日志同时追加到磁盘文件（超过 max_bytes 时轮转，保留 backups 个旧文件）
+        :param path: 日志文件路径；None 表示停止写入
+        """
+        self.close()
+        if path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                       encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(asctime)s\t%(message)s"))
+        self._spill = handler
+        atexit.register(self.close)
+
+    def close(self):
+        """关闭磁盘文件"""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            atexit.unregister(self.close)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self.last(self._count))
@@ -0,0 +1,168 @@
+# ui/profiler.py
+"""
+界面帧耗时统计
+
+FrameProfiler 记录最近若干帧的帧耗时与分阶段耗时（事件处理、布局、玩家区、卡牌区、日志框、
+提示框、提交屏幕），并统计每帧新建的 Surface 数；PygameUI 在性能面板（F3 切换）里显示这些数据，
+基准测试（benchmarks/）也直接读取 summary()。
+关闭时 phase() 返回共享的空上下文，几乎没有额外开销。
+"""
+
+import time
+from collections import deque
+
+# 阶段名 -> 面板上的显示名（按显示顺序）
+PHASES = (
+    ("events", "事件"),
+    ("layout", "布局"),
+    ("draw_player_zones", "玩家区"),
+    ("draw_zone", "  卡牌区"),
+    ("draw_log_panel", "日志框"),
+    ("tooltip", "提示框"),
+    ("present", "提交"),
+)
+
+
+class _NullPhase:
+    """关闭统计时使用的空上下文"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """计时上下文：退出时把耗时累加到当前帧的对应阶段"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """最近 history 帧的帧耗时、分阶段耗时与新建 Surface 数"""
+
+    def __init__(self, history=120, alloc_counter=None):
+        """
+        :param history: 保留的帧数
+        :param alloc_counter: 返回累计新建 Surface 数的函数（例如各渲染缓存的未命中次数之和）
+        """
+        self.enabled = False
+        self.frames = deque(maxlen=history)   # (结束时刻, 帧耗时秒, {阶段: 秒}, 新建 Surface 数)
+        self.alloc_counter = alloc_counter
+        self._pending = {}
+        self._frame_start = None
+        self._alloc_start = 0
+
+    def toggle(self):
+        """开关统计（重新打开时清空历史），返回新的状态"""
+        self.enabled = not self.enabled
+        self.reset()
+        return self.enabled
+
+    def reset(self):
+        self.frames.clear()
+        self._pending = {}
+        self._frame_start = None
+
+    def phase(self, name):
+        """with profiler.phase("draw_zone"): ... 统计一段代码的耗时"""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def add(self, name, seconds):
+        """把一段耗时累加到当前（或下一）帧的阶段 name"""
+        self._pending[name] = self._pending.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self._alloc_start = self.alloc_counter() if self.alloc_counter else 0
+
+    def end_frame(self):
+        """结束一帧：帧耗时 = 绘制耗时 + 上一帧以来的事件处理耗时"""
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        phases = self._pending
+        elapsed = now - self._frame_start + phases.get("events", 0.0)
+        allocs = (self.alloc_counter() - self._alloc_start) if self.alloc_counter else 0
+        self.frames.append((now, elapsed, phases, allocs))
+        self._pending = {}
+        self._frame_start = None
+
+    # ---------------- 统计 ----------------
+    def fps(self, window=1.0):
+        """最近 window 秒内完成的帧数 / 秒（界面空闲不重绘时会下降，属正常）"""
+        if not self.frames:
+            return 0.0
+        cutoff = time.perf_counter() - window
+        return sum(1 for f in self.frames if f[0] >= cutoff) / window
+
+    def percentile(self, q):
+        """帧耗时分位数（毫秒），q 取 0..100"""
+        if not self.frames:
+            return 0.0
+        times = sorted(f[1] for f in self.frames)
+        idx = min(len(times) - 1, int(round(q / 100.0 * (len(times) - 1))))
+        return times[idx] * 1000.0
+
+    def phase_means(self):
+        """各阶段平均每帧耗时（毫秒）"""
+        n = len(self.frames)
+        if not n:
+            return {}
+        totals = {}
+        for _, _, phases, _ in self.frames:
+            for name, sec in phases.items():
+                totals[name] = totals.get(name, 0.0) + sec
+        return {name: sec * 1000.0 / n for name, sec in totals.items()}
+
+    def allocs_per_frame(self):
+        n = len(self.frames)
+        return sum(f[3] for f in self.frames) / n if n else 0.0
+
+    def summary(self):
+        """汇总为可直接序列化的字典"""
+        return {
+            "frames": len(self.frames),
+            "fps": self.fps(),
+            "frame_ms": {"p50": self.percentile(50), "p95": self.percentile(95), "p99": self.percentile(99)},
+            "phase_ms": self.phase_means(),
+            "surfaces_per_frame": self.allocs_per_frame(),
+        }
+
+    def hud_lines(self, hit_rates=None):
+        """
+        性能面板的文字行
+        :param hit_rates: [(显示名, 命中率 0..1), ...]
+        """
+        lines = [
+            f"FPS {self.fps():.0f}  帧耗时 p50 {self.percentile(50):.2f} / p95 {self.percentile(95):.2f}"
+            f" / p99 {self.percentile(99):.2f} ms",
+        ]
+        means = self.phase_means()
+        for name, label in PHASES:
+            lines.append(f"{label} {means.get(name, 0.0):.2f} ms")
+        if hit_rates:
+            lines.append("缓存命中 " + "  ".join(f"{label} {rate * 100:.0f}%" for label, rate in hit_rates))
+        lines.append(f"每帧新建 Surface {self.allocs_per_frame():.1f}")
+        return lines
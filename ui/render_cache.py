@@ -0,0 +1,177 @@
+# ui/render_cache.py
+"""
+界面渲染缓存
+
+每帧重复生成相同的 Surface（卡面、文字）代价很高，这里提供按最近使用淘汰的缓存，
+绘制时先按内容键查缓存，命中则直接 blit；同时统计命中 / 未命中次数，便于观察缓存效果。
+TextLayout 缓存逐字宽度与换行结果，文字排版不再逐字调用 font.size 量整串。
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """容量固定、按最近使用淘汰的缓存"""
+
+    def __init__(self, capacity=256):
+        """
+        :param capacity: 最多缓存的条目数
+        """
+        self.capacity = capacity
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """取缓存，未命中返回 None"""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.capacity:
+            data.popitem(last=False)
+
+    def clear(self):
+        """清空缓存（统计数据保留）"""
+        self._data.clear()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class TextCache:
+    """文字渲染缓存：(字体, 文本, 抗锯齿, 颜色, 透明度) -> Surface"""
+
+    def __init__(self, capacity=1024):
+        """
+        :param capacity: 最多缓存的文字 Surface 数量（界面上同时出现的文字远少于此）
+        """
+        self.cache = LRUCache(capacity)
+
+    def render(self, font, text, antialias, color, alpha=None):
+        """
+        与 font.render 相同，但相同参数只栅格化一次
+        返回的 Surface 为共享对象，调用方不要修改它
+        :param alpha: 整体透明度（None 表示不设置）
+        """
+        key = (font, text, antialias, color, alpha)
+        surf = self.cache.get(key)
+        if surf is None:
+            surf = font.render(text, antialias, color)
+            if alpha is not None:
+                surf.set_alpha(alpha)
+            self.cache.put(key, surf)
+        return surf
+
+    @property
+    def hits(self):
+        return self.cache.hits
+
+    @property
+    def misses(self):
+        return self.cache.misses
+
+    @property
+    def hit_rate(self):
+        return self.cache.hit_rate
+
+    def clear(self):
+        self.cache.clear()
+
+
+class TextLayout:
+    """
+    文字排版缓存：
+      - 逐字宽度（字形步进）按 (字体, 字符) 永久缓存，字符集有限
+      - 整串宽度与换行结果按 (字体, 文本[, 最大宽度]) 缓存
+    新文本换行时先用逐字宽度累加估出断点，再用 font.size 校正一两次（字距调整与亚像素取整
+    会让逐字宽度之和与整串宽度略有出入），结果与逐字量整串的贪心换行一致，但只需线性时间。
+    """
+
+    def __init__(self, capacity=512):
+        """
+        :param capacity: 最多缓存的换行结果 / 整串宽度数量（各自）
+        """
+        self._advances = {}
+        self.cache = LRUCache(capacity)
+        self.widths = LRUCache(capacity)
+
+    def advance(self, font, ch):
+        """单个字符的步进宽度（像素）"""
+        key = (font, ch)
+        w = self._advances.get(key)
+        if w is None:
+            w = self._advances[key] = font.size(ch)[0]
+        return w
+
+    def width(self, font, text):
+        """整串文字的渲染宽度（与 font.size 相同，经缓存）"""
+        key = (font, text)
+        w = self.widths.get(key)
+        if w is None:
+            w = font.size(text)[0]
+            self.widths.put(key, w)
+        return w
+
+    def wrap(self, font, text, max_width):
+        """
+        按像素宽度逐字换行（适配中英文混排，不添加省略号），每行至少一个字
+        :return: 行的元组（共享对象）；空文本返回 ("",)
+        """
+        key = (font, text, max_width)
+        lines = self.cache.get(key)
+        if lines is not None:
+            return lines
+        if not text:
+            lines = ("",)
+        else:
+            lines = tuple(self._wrap(font, text, max_width))
+        self.cache.put(key, lines)
+        return lines
+
+    def _wrap(self, font, text, max_width):
+        n = len(text)
+        start = 0
+        while start < n:
+            # 按逐字宽度估计本行末尾
+            end = start
+            line_w = 0
+            while end < n:
+                w = self.advance(font, text[end])
+                if line_w + w > max_width and end > start:
+                    break
+                line_w += w
+                end += 1
+            # 用整串实际宽度校正：超宽则回退，还放得下则继续延伸
+            while end - start > 1 and font.size(text[start:end])[0] > max_width:
+                end -= 1
+            while end < n and font.size(text[start:end + 1])[0] <= max_width:
+                end += 1
+            yield text[start:end]
+            start = end
+
+    def clear(self):
+        self._advances.clear()
+        self.cache.clear()
+        self.widths.clear()